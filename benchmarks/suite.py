@@ -0,0 +1,295 @@
+"""Offline performance benchmarks with baseline regression checks.
+
+Times the hot paths of the platform on deterministic synthetic markets
+(`data.synthetic.make_synthetic_market`: cointegrated pairs, a factor with
+hidden regime switches) at several universe sizes and history lengths:
+
+    feed.iterate              HistoricalDataFeed iteration + 60-bar window
+    strategy.on_market_event  PairsBacktestStrategy signal generation
+    engine.run[event|fast]    full backtest (risk manager on)
+    pairs.find_pairs          PairsSelector cointegration screen (statsmodels)
+    pairs.find_pairs[numpy]   ... with the batched NumPy Engle-Granger kernel
+    regime.hmm_walkforward    HMMRegimeDetector.fit_predict_walkforward
+
+Throughput (units/sec, best of `--repeat`) is compared to the stored
+baselines; the run fails (exit code 1) if any case drops more than
+`--threshold` below its baseline.  Baselines are machine-specific: refresh
+them with `--update-baseline` on the machine that runs the check.
+
+Run from repo root:
+    python benchmarks/suite.py                          # quick profile, check baselines
+    python benchmarks/suite.py --profile full           # 10/50/200/1000 tickers × 1k/10k bars
+    python benchmarks/suite.py --only engine.run --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import warnings
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from data.synthetic import SyntheticMarket, make_synthetic_market
+from features.featurize import compute_standard_features
+from regime.hmm_detector import HMMRegimeDetector
+from risk.risk_manager import RiskManager
+from strategy.pairs_trading import PairsSelector
+from backtest.data_feed import HistoricalDataFeed
+from backtest.engine import BacktestEngine
+from backtest.execution import SimulatedBroker
+from backtest.fast_engine import FastBacktestEngine
+from backtest.portfolio import Portfolio
+from backtest.strategy_wrapper import PairsBacktestStrategy
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baselines.json")
+
+TICKERS = (10, 50, 200, 1000)
+BARS = (1_000, 10_000)
+FULL_GRID = [(t, b) for b in BARS for t in TICKERS]
+QUICK = [(50, 1_000)]
+
+WARMUP = 60
+
+
+@dataclass
+class Case:
+    """One benchmark: `setup(market)` returns a runner that does the timed
+    work and returns the number of units processed."""
+    name: str
+    unit: str
+    setup: Callable[[SyntheticMarket], Callable[[], int]]
+    full: list
+    quick: list
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Cases
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _strategy(m: SyntheticMarket) -> PairsBacktestStrategy:
+    return PairsBacktestStrategy(pairs=m.pairs, zscore_window=WARMUP, warmup_bars=WARMUP,
+                                 regime_ticker=m.market_ticker, all_tickers=m.tickers)
+
+
+def _feed_iterate(m: SyntheticMarket):
+    feed = HistoricalDataFeed(m.prices, warmup_bars=WARMUP)
+
+    def run():
+        n = 0
+        for _ in feed:
+            feed.window(WARMUP)
+            n += 1
+        return n
+    return run
+
+
+def _strategy_bars(m: SyntheticMarket):
+    feed = HistoricalDataFeed(m.prices)
+    strategy = _strategy(m)
+    portfolio = Portfolio(initial_capital=1_000_000.0)
+
+    def run():
+        n = 0
+        for event in feed:
+            strategy.on_market_event(event, portfolio)
+            n += 1
+        return n
+    return run
+
+
+def _engine(engine_cls):
+    def setup(m: SyntheticMarket):
+        risk = RiskManager()
+        risk._peak_equity = 1_000_000.0
+        engine = engine_cls(
+            data_feed=HistoricalDataFeed(m.prices),
+            strategy=_strategy(m),
+            portfolio=Portfolio(initial_capital=1_000_000.0),
+            broker=SimulatedBroker(seed=0),
+            risk_manager=risk,
+        )
+        return lambda: engine.run()["bars"]
+    return setup
+
+
+def _find_pairs(kernel: str):
+    def setup(m: SyntheticMarket):
+        prices = m.prices[m.tickers]
+        n = len(m.tickers)
+
+        def run():
+            PairsSelector(kernel=kernel).find_pairs(prices, max_pairs=100, verbose=False)
+            return n * (n - 1) // 2
+        return run
+    return setup
+
+
+def _hmm_walkforward(m: SyntheticMarket):
+    features = compute_standard_features(m.ohlcv(m.market_ticker))
+    features.index = pd.DatetimeIndex(features["Date"])
+
+    def run():
+        HMMRegimeDetector(n_states=3).fit_predict_walkforward(features)
+        return len(features)
+    return run
+
+
+CASES = [
+    Case("feed.iterate", "bars/s", _feed_iterate, FULL_GRID, QUICK),
+    Case("strategy.on_market_event", "bars/s", _strategy_bars, FULL_GRID, QUICK),
+    Case("engine.run[event]", "bars/s", _engine(BacktestEngine), FULL_GRID, QUICK),
+    Case("engine.run[fast]", "bars/s", _engine(FastBacktestEngine), FULL_GRID, QUICK),
+    # Engle-Granger on 10k-bar histories is ~10× slower per pair; the
+    # 200/1000-ticker universes are only screened on 1k bars.
+    Case("pairs.find_pairs", "pairs/s", _find_pairs("statsmodels"),
+         [(t, 1_000) for t in TICKERS] + [(10, 10_000), (50, 10_000)], QUICK),
+    Case("pairs.find_pairs[numpy]", "pairs/s", _find_pairs("numpy"),
+         [(t, 1_000) for t in TICKERS] + [(10, 10_000), (50, 10_000)], QUICK),
+    # Single regime-proxy series: the universe size does not matter
+    Case("regime.hmm_walkforward", "bars/s", _hmm_walkforward,
+         [(10, b) for b in BARS], [(10, 1_000)]),
+]
+
+
+def case_key(name: str, n_tickers: int, n_bars: int) -> str:
+    return f"{name}[{n_tickers}x{n_bars}]"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────────────────────────────────────
+
+def time_case(case: Case, market: SyntheticMarket, repeat: int,
+              min_seconds: float = 0.2, max_seconds: float = 5.0) -> dict:
+    """Best-of-`repeat` throughput.  Each sample runs the case (fresh setup
+    every time) until it has accumulated `min_seconds`, so tiny cases are
+    not dominated by timer noise; repeating stops once a sample exceeds
+    `max_seconds`."""
+    best = None
+    for _ in range(repeat):
+        units, elapsed = 0, 0.0
+        while elapsed < min_seconds:
+            runner = case.setup(market)
+            t0 = time.perf_counter()
+            units += runner()
+            elapsed += time.perf_counter() - t0
+        if best is None or units / elapsed > best[0] / best[1]:
+            best = (units, elapsed)
+        if elapsed > max_seconds:
+            break
+    units, elapsed = best
+    return {"throughput": units / elapsed, "unit": case.unit, "seconds": elapsed}
+
+
+def run_suite(profile: str = "quick", only: list | None = None, repeat: int = 3,
+              seed: int = 0) -> dict:
+    """{case key: {throughput, unit, seconds}} for every selected case."""
+    cases = [c for c in CASES if not only or any(c.name.startswith(o) for o in only)]
+    scales = sorted({s for c in cases for s in (c.full if profile == "full" else c.quick)},
+                    key=lambda s: (s[1], s[0]))
+    results = {}
+    for n_tickers, n_bars in scales:
+        market = make_synthetic_market(n_tickers=n_tickers, n_bars=n_bars, seed=seed)
+        for case in cases:
+            if (n_tickers, n_bars) not in (case.full if profile == "full" else case.quick):
+                continue
+            key = case_key(case.name, n_tickers, n_bars)
+            results[key] = res = time_case(case, market, repeat)
+            print(f"  {key:<44} {res['throughput']:>14,.1f} {res['unit']:<8} "
+                  f"({res['seconds']:.3f}s)", flush=True)
+    return results
+
+
+def compare(results: dict, baselines: dict, threshold: float) -> list[tuple]:
+    """Rows (key, baseline, current, ratio, regressed) for cases with a baseline."""
+    rows = []
+    for key, res in results.items():
+        base = baselines.get(key)
+        if not base:
+            continue
+        ratio = res["throughput"] / base["throughput"]
+        rows.append((key, base["throughput"], res["throughput"], ratio, ratio < 1.0 - threshold))
+    return rows
+
+
+def load_baselines(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as fh:
+        return json.load(fh).get("results", {})
+
+
+def save_baselines(path: str, results: dict) -> None:
+    merged = {**load_baselines(path), **results}
+    payload = {
+        "machine": {"platform": platform.platform(), "python": platform.python_version(),
+                    "processor": platform.processor() or platform.machine(),
+                    "cpus": os.cpu_count()},
+        "updated": datetime.now().isoformat(timespec="seconds"),
+        "results": dict(sorted(merged.items())),
+    }
+    with open(path, "w") as fh:
+        json.dump(payload, fh, indent=2)
+        fh.write("\n")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Offline benchmark suite with baseline checks",
+                                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    p.add_argument("--profile", choices=["quick", "full"], default="quick")
+    p.add_argument("--only", nargs="*", default=None, help="Case name prefixes to run")
+    p.add_argument("--repeat", type=int, default=3, help="Runs per case (best is kept)")
+    p.add_argument("--seed", type=int, default=0, help="Synthetic market seed")
+    p.add_argument("--baseline", type=str, default=BASELINE_PATH)
+    p.add_argument("--threshold", type=float, default=0.25,
+                   help="Allowed fractional throughput drop before failing")
+    p.add_argument("--update-baseline", action="store_true",
+                   help="Store these results as the new baselines instead of checking")
+    p.add_argument("--json", type=str, default=None, help="Also write results here")
+    args = p.parse_args()
+
+    logging.disable(logging.INFO)
+    warnings.filterwarnings("ignore")
+
+    print(f"Benchmarks ({args.profile} profile)")
+    results = run_suite(args.profile, args.only, args.repeat, args.seed)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+    if args.update_baseline:
+        save_baselines(args.baseline, results)
+        print(f"\nBaselines updated → {args.baseline}")
+        return
+
+    rows = compare(results, load_baselines(args.baseline), args.threshold)
+    if not rows:
+        print("\nNo baselines to compare against (run with --update-baseline).")
+        return
+    print(f"\n{'case':<44} {'baseline':>14} {'current':>14} {'ratio':>7}")
+    for key, base, cur, ratio, regressed in rows:
+        print(f"{key:<44} {base:>14,.1f} {cur:>14,.1f} {ratio:>7.2f}"
+              f"{'  REGRESSION' if regressed else ''}")
+    failed = [r for r in rows if r[4]]
+    if failed:
+        print(f"\n{len(failed)} case(s) regressed more than {args.threshold:.0%}")
+        sys.exit(1)
+    print(f"\nAll {len(rows)} case(s) within {args.threshold:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,7 +32,7 @@ import numpy as np
 import pandas as pd
 from config import PlatformConfig, setup_logging
 from backtest.job_queue import BacktestJobQueue, JobStatus
-from strategy.kalman_hedge import KalmanHedge
+from strategy.kalman_hedge import kalman_hedge_series
 from utils.pair_id import make_pair_id, split_pair_id
 
 logger = logging.getLogger(__name__)
@@ -65,10 +65,11 @@ discovery_store = DiscoveryStore()
 
 @lru_cache(maxsize=8)
 def _get_cached_price_matrix(tickers_key: str, start_date: str, end_date: Optional[str]) -> Any:
-    from data.yfinance_client import YFinanceClient
+    from data.data_client_factory import DataClientFactory
 
     tickers = [t for t in tickers_key.split(",") if t]
-    client = YFinanceClient(cache_dir=os.path.join(ROOT_DIR, "data", "cache"))
+    client = DataClientFactory.from_config(PlatformConfig.from_env(),
+                                           cache_dir=os.path.join(ROOT_DIR, "data", "cache"))
     return client.get_price_matrix(tickers, start_date=start_date, end_date=end_date)
 
 
@@ -1010,18 +1011,18 @@ def create_app() -> Flask:
             return jsonify({"ok": False, "error": "No overlapping price history for pair"}), 404
 
         if hedge_mode == "kalman":
-            kf = KalmanHedge(initial_hedge=hedge_ratio)
-            spread_records = []
-            for idx, vals in pair_prices.iterrows():
-                p_a = float(vals[asset_a])
-                p_b = float(vals[asset_b])
-                hedge_t, unc_t = kf.update(p_a, p_b)
-                spread_records.append({
+            p_a = pair_prices[asset_a].to_numpy(dtype=float)
+            p_b = pair_prices[asset_b].to_numpy(dtype=float)
+            hedges, uncs = kalman_hedge_series(p_a, p_b, initial_hedge=hedge_ratio)
+            spread_records = [
+                {
                     "date": str(idx.date()),
-                    "spread": float(p_a - hedge_t * p_b),
-                    "hedge": float(hedge_t),
-                    "uncertainty": float(unc_t),
-                })
+                    "spread": float(a - h * b),
+                    "hedge": float(h),
+                    "uncertainty": float(u),
+                }
+                for idx, a, b, h, u in zip(pair_prices.index, p_a, p_b, hedges, uncs)
+            ]
             spread = pd.Series([r["spread"] for r in spread_records], index=pair_prices.index)
             hedge_ratio_out = float(spread_records[-1]["hedge"]) if spread_records else hedge_ratio
         else:
@@ -14,7 +14,7 @@ SRC  = ROOT / "src"
 sys.path.insert(0, str(SRC))
 
 from config import PlatformConfig, setup_logging
-from data.yfinance_client import YFinanceClient
+from data.data_client_factory import DataClientFactory
 from features.featurize import compute_market_features
 from regime.hmm_detector import HMMRegimeDetector
 from pair_discovery import PairDiscoveryEngine
@@ -35,7 +35,7 @@ def run():
 
     # ── Step 1: Fetch fresh prices ────────────────────────────────────
     logger.info("Step 1/5: Fetching price data for %d tickers", len(cfg.data.tickers))
-    client = YFinanceClient(cache_dir=str(ROOT / "data" / "cache"))
+    client = DataClientFactory.from_config(cfg, cache_dir=str(ROOT / "data" / "cache"))
     price_matrix = client.get_price_matrix(
         cfg.data.tickers,
         start_date="2015-01-01",   # full history; yfinance returns cached+new
@@ -0,0 +1,72 @@
+"""Nightly incremental backtest: restore an engine snapshot, run only the
+bars that arrived since it was taken, and save the snapshot again.
+
+Create the first snapshot with a full run:
+    python src/backtest/run_backtest.py --no-plot --save-snapshot data/engine.snapshot
+
+Then, from cron (repo root):
+    python scripts/extend_backtest.py --snapshot data/engine.snapshot
+
+Only bars dated after the snapshot's last bar are processed; the rest of the
+history is carried in the snapshot (portfolio, strategy buffers, risk
+manager, broker RNG).  Prices are fetched auto-adjusted, so after a split or
+dividend the new bars and the snapshot's history are on different bases —
+re-run the full backtest and take a fresh snapshot in that case.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+import pandas as pd
+
+from config import setup_logging
+from data.data_client_factory import DataClientFactory
+from backtest.engine import BacktestEngine
+
+
+def main():
+    p = argparse.ArgumentParser(description="Extend a saved backtest with new bars",
+                                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    p.add_argument("--snapshot", type=str, required=True, help="Engine snapshot to extend")
+    p.add_argument("--out", type=str, default=None,
+                   help="Where to write the updated snapshot (default: overwrite --snapshot)")
+    p.add_argument("--log-level", type=str, default="INFO")
+    args = p.parse_args()
+    setup_logging(level=args.log_level)
+
+    engine = BacktestEngine.load_snapshot(args.snapshot)
+    feed = engine.data_feed
+    last = feed._dates[-1]
+
+    new_bars = DataClientFactory.create().get_price_matrix(
+        feed.tickers,
+        start_date=(last + pd.Timedelta(days=1)).strftime("%Y-%m-%d"),
+        use_cache=False,
+    )
+    new_bars = new_bars[new_bars.index > last] if not new_bars.empty else new_bars
+    if new_bars.empty:
+        print(f"No bars after {last.date()} — snapshot unchanged.")
+        return
+
+    t0 = time.perf_counter()
+    results = engine.extend(new_bars)
+    elapsed = time.perf_counter() - t0
+    engine.save_snapshot(args.out or args.snapshot)
+
+    eq = results["equity_curve"]
+    print(f"Processed {len(new_bars)} new bar(s) in {elapsed * 1e3:.1f} ms "
+          f"({new_bars.index[0].date()} → {new_bars.index[-1].date()})")
+    print(f"  Equity: ${eq.iloc[-1]:,.0f} | Open positions: {len(engine.portfolio.positions)} "
+          f"| Sharpe: {results['stats'].get('sharpe_ratio', float('nan')):.2f}")
+    print("Snapshot saved →", args.out or args.snapshot)
+
+
+if __name__ == "__main__":
+    main()
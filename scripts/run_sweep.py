@@ -0,0 +1,92 @@
+"""Parameter sweep: run a grid of PlatformConfig overrides across a process pool.
+
+Prices and features are fetched once and shared with the workers through
+shared memory; every run gets its own seed spawned from --seed.
+
+Run from repo root:
+    python scripts/run_sweep.py --config config.example.yaml \
+        --param pairs.entry_z=1.5,2.0,2.5 \
+        --param backtest.target_notional_pct=0.05,0.10 \
+        --workers 16
+
+    # or a JSON grid file: {"pairs.entry_z": [1.5, 2.0], "pairs.max_pairs": [5, 10]}
+    python scripts/run_sweep.py --grid grid.json
+
+Outputs to `data/sweeps/<timestamp>/`:
+  - ranked.csv   (one row per run, best first)
+  - runs.json    (per-run overrides, seed, stats, errors)
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from config import PlatformConfig, setup_logging
+from backtest.sweep import run_sweep
+
+
+def _parse_value(text: str):
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def parse_grid(params: list, grid_file: str = None) -> dict:
+    grid = {}
+    if grid_file:
+        with open(grid_file) as fh:
+            grid.update(json.load(fh))
+    for spec in params or []:
+        key, _, values = spec.partition("=")
+        if not values:
+            raise SystemExit(f"--param needs KEY=V1,V2,...: {spec!r}")
+        grid[key.strip()] = [_parse_value(v.strip()) for v in values.split(",")]
+    if not grid:
+        raise SystemExit("Nothing to sweep: pass --param and/or --grid")
+    return grid
+
+
+def main():
+    p = argparse.ArgumentParser(description="Process-pool parameter sweep",
+                                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    p.add_argument("--config", type=str, default=None, help="Base YAML config")
+    p.add_argument("--param", action="append", default=[],
+                   help="Swept field as section.field=v1,v2,... (repeatable)")
+    p.add_argument("--grid", type=str, default=None, help="JSON file {field: [values]}")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    p.add_argument("--seed", type=int, default=0, help="Root seed for per-run seeds")
+    p.add_argument("--metric", type=str, default="sharpe_ratio", help="Ranking metric")
+    p.add_argument("--no-risk", action="store_true", help="Disable risk manager")
+    p.add_argument("--out", type=str, default=None, help="Output directory")
+    args = p.parse_args()
+
+    cfg = PlatformConfig.from_yaml(args.config) if args.config else PlatformConfig.from_env()
+    setup_logging(level=cfg.log_level)
+    grid = parse_grid(args.param, args.grid)
+
+    result = run_sweep(cfg, grid, n_workers=args.workers, seed=args.seed,
+                       use_risk=not args.no_risk, metric=args.metric)
+
+    out_dir = args.out or os.path.join(ROOT, "data", "sweeps",
+                                       datetime.now().strftime("%Y%m%d_%H%M%S"))
+    os.makedirs(out_dir, exist_ok=True)
+    result.table.to_csv(os.path.join(out_dir, "ranked.csv"))
+    with open(os.path.join(out_dir, "runs.json"), "w") as fh:
+        json.dump([result.runs[k] for k in sorted(result.runs)], fh, default=str, indent=2)
+
+    cols = ["job_id", *grid, "seed", args.metric, "cagr_pct", "max_drawdown_pct", "error"]
+    print(result.table[[c for c in cols if c in result.table.columns]].head(10).to_string())
+    print("\nSweep results saved to:", out_dir)
+
+
+if __name__ == "__main__":
+    main()
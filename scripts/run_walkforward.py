@@ -0,0 +1,76 @@
+"""Walk-forward optimization: fit + select pairs per train window, trade each
+test window, and stitch the out-of-sample equity curves.
+
+Folds come from the `walkforward` section of the config and run in parallel
+worker processes.
+
+Run from repo root:
+    python scripts/run_walkforward.py --config config.example.yaml --workers 16
+    python scripts/run_walkforward.py --train-days 756 --test-days 63 --anchored
+
+Outputs to `data/walkforward/<timestamp>/`:
+  - equity.csv   (stitched out-of-sample equity curve)
+  - folds.csv    (per-fold windows, pairs count and stats)
+  - summary.json (stitched stats)
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from config import PlatformConfig, setup_logging
+from backtest.walkforward import run_walkforward
+
+
+def main():
+    p = argparse.ArgumentParser(description="Parallel walk-forward backtest",
+                                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    p.add_argument("--config", type=str, default=None, help="Base YAML config")
+    p.add_argument("--train-days", type=int, default=None, help="Bars per train window")
+    p.add_argument("--test-days", type=int, default=None, help="Bars per test window")
+    p.add_argument("--step-days", type=int, default=None, help="Fold stride (default: test days)")
+    p.add_argument("--anchored", action="store_true", help="Expanding train window")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    p.add_argument("--no-risk", action="store_true", help="Disable risk manager")
+    p.add_argument("--out", type=str, default=None, help="Output directory")
+    args = p.parse_args()
+
+    cfg = PlatformConfig.from_yaml(args.config) if args.config else PlatformConfig.from_env()
+    setup_logging(level=cfg.log_level)
+    if args.train_days is not None:
+        cfg.walkforward.train_days = args.train_days
+    if args.test_days is not None:
+        cfg.walkforward.test_days = args.test_days
+    if args.step_days is not None:
+        cfg.walkforward.step_days = args.step_days
+    if args.anchored:
+        cfg.walkforward.anchored = True
+
+    result = run_walkforward(cfg, n_workers=args.workers, use_risk=not args.no_risk)
+
+    out_dir = args.out or os.path.join(ROOT, "data", "walkforward",
+                                       datetime.now().strftime("%Y%m%d_%H%M%S"))
+    os.makedirs(out_dir, exist_ok=True)
+    result.equity_curve.to_csv(os.path.join(out_dir, "equity.csv"))
+    result.folds.to_csv(os.path.join(out_dir, "folds.csv"))
+    with open(os.path.join(out_dir, "summary.json"), "w") as fh:
+        json.dump(result.stats, fh, default=float, indent=2)
+
+    cols = ["train_start", "test_start", "test_end", "n_pairs", "sharpe_ratio",
+            "total_return_pct", "max_drawdown_pct", "error"]
+    print(result.folds[[c for c in cols if c in result.folds.columns]].to_string())
+    print("\nStitched out-of-sample:")
+    for k, v in result.stats.items():
+        print(f"  {k:30s}: {v}")
+    print("\nWalk-forward results saved to:", out_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,14 @@ from .data_feed import HistoricalDataFeed
 from .execution import SimulatedBroker
 from .portfolio import Portfolio
 from .engine import BacktestEngine
+from .fast_engine import FastBacktestEngine
+from .multi_engine import MultiPortfolioEngine, ParameterSet
+from .scenarios import Scenario, run_scenarios
 from .strategy_wrapper import PairsBacktestStrategy
 
 __all__ = [
     "MarketEvent", "SignalEvent", "OrderEvent", "FillEvent", "EventType",
     "HistoricalDataFeed", "SimulatedBroker", "Portfolio", "BacktestEngine",
-    "PairsBacktestStrategy",
+    "FastBacktestEngine", "MultiPortfolioEngine", "ParameterSet",
+    "PairsBacktestStrategy", "Scenario", "run_scenarios",
 ]
@@ -0,0 +1,203 @@
+"""Growable columnar record log.
+
+Backs the portfolio trade log and the broker fill log.  Each column is a
+preallocated NumPy buffer that doubles when full, so a multi-year run stores
+a handful of arrays instead of one dict / event object per row:
+
+    "datetime"     int64 nanoseconds since the epoch
+    "float"        float64
+    "category"     int32 code into a per-column vocabulary (tickers, pair ids,
+                   directions — a few hundred distinct strings at most)
+
+Numeric and date columns can be read without copying (`column`,
+`to_frame(copy=False)`, `to_arrow`) as read-only views of the live buffers;
+`to_frame` copies by default, so frames handed to callers stay independent
+of the log.  Category columns either decode to object strings (pandas
+default, for compatibility with existing consumers) or stay as codes
+(`pd.Categorical` / Arrow dictionary arrays).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+import numpy as np
+import pandas as pd
+
+_DTYPES = {"datetime": np.int64, "float": np.float64, "category": np.int32}
+
+
+class ColumnarLog:
+    """Append-only table with typed, growable NumPy columns.
+
+    Parameters
+    ----------
+    schema : iterable of (name, kind)
+        Column names in append order; kind is "datetime", "float" or
+        "category".
+    capacity : int
+        Initial number of rows to preallocate.
+    """
+
+    def __init__(self, schema: Iterable[tuple[str, str]], capacity: int = 1024):
+        self._names: list[str] = []
+        self._kinds: list[str] = []
+        for name, kind in schema:
+            if kind not in _DTYPES:
+                raise ValueError(f"Unknown column kind {kind!r} for {name!r}")
+            self._names.append(name)
+            self._kinds.append(kind)
+
+        self._capacity = max(1, capacity)
+        self._len = 0
+        self._cols: list[np.ndarray] = [
+            np.empty(self._capacity, dtype=_DTYPES[k]) for k in self._kinds
+        ]
+        # Per category column: code lookup + decoded vocabulary
+        self._codes: dict[int, dict[str, int]] = {
+            j: {} for j, k in enumerate(self._kinds) if k == "category"
+        }
+        self._vocab: dict[int, list[str]] = {j: [] for j in self._codes}
+
+    # -----------------------------------------------------------------------
+    # Writing
+    # -----------------------------------------------------------------------
+
+    def append(self, *values) -> None:
+        """Append one row; values follow the schema order.
+
+        Dates may be `pd.Timestamp` or int nanoseconds.
+        """
+        i = self._len
+        if i == self._capacity:
+            self._grow()
+        codes = self._codes
+        for j, (col, v) in enumerate(zip(self._cols, values)):
+            if j in codes:
+                lookup = codes[j]
+                code = lookup.get(v)
+                if code is None:
+                    code = lookup[v] = len(lookup)
+                    self._vocab[j].append(v)
+                col[i] = code
+            elif v.__class__ is pd.Timestamp:
+                col[i] = v.value
+            else:
+                col[i] = v
+        self._len = i + 1
+
+    def extend(self, *columns) -> None:
+        """Append many rows at once; one sequence/array per column, in schema
+        order.  Dates must be int nanoseconds here."""
+        n = len(columns[0])
+        i = self._len
+        while i + n > self._capacity:
+            self._grow()
+        codes = self._codes
+        for j, (col, values) in enumerate(zip(self._cols, columns)):
+            if j in codes:
+                lookup = codes[j]
+                vocab = self._vocab[j]
+                out = col[i:i + n]
+                for k, v in enumerate(values):
+                    code = lookup.get(v)
+                    if code is None:
+                        code = lookup[v] = len(lookup)
+                        vocab.append(v)
+                    out[k] = code
+            else:
+                col[i:i + n] = values
+        self._len = i + n
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for j, col in enumerate(self._cols):
+            new = np.empty(self._capacity, dtype=col.dtype)
+            new[:self._len] = col[:self._len]
+            self._cols[j] = new
+
+    # -----------------------------------------------------------------------
+    # Reading
+    # -----------------------------------------------------------------------
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._names)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> dict:
+        """Row `i` as a dict (slow path — for inspection and tests)."""
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("ColumnarLog index out of range")
+        row = {}
+        for j, (name, kind, col) in enumerate(zip(self._names, self._kinds, self._cols)):
+            v = col[i]
+            if kind == "category":
+                row[name] = self._vocab[j][v]
+            elif kind == "datetime":
+                row[name] = pd.Timestamp(int(v))
+            else:
+                row[name] = float(v)
+        return row
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy, read-only view of the filled part of a column.
+
+        Dates come back as datetime64[ns]; category columns as int32 codes
+        (see `categories`).
+        """
+        j = self._names.index(name)
+        view = self._cols[j][:self._len]
+        if self._kinds[j] == "datetime":
+            view = view.view("datetime64[ns]")
+        view.flags.writeable = False
+        return view
+
+    def categories(self, name: str) -> list[str]:
+        """Vocabulary of a category column (index = code)."""
+        return list(self._vocab[self._names.index(name)])
+
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers (allocated capacity) and vocabularies."""
+        total = sum(col.nbytes for col in self._cols)
+        for vocab in self._vocab.values():
+            total += sum(len(s) for s in vocab)
+        return total
+
+    def to_frame(self, categorical: bool = False, copy: bool = True) -> pd.DataFrame:
+        """Convert to a DataFrame.
+
+        Category columns decode to object strings unless `categorical=True`,
+        which returns `pd.Categorical` columns of the codes instead.  With
+        `copy=False` numeric/date columns (and categorical codes) are
+        read-only views of the log's buffers instead of copies.
+        """
+        data = {}
+        for j, (name, kind) in enumerate(zip(self._names, self._kinds)):
+            col = self.column(name)
+            if kind == "category":
+                vocab = self._vocab[j]
+                if categorical:
+                    col = pd.Categorical.from_codes(col, categories=vocab)
+                else:
+                    col = np.array(vocab, dtype=object)[col] if vocab else np.empty(0, dtype=object)
+            data[name] = col
+        return pd.DataFrame(data, copy=copy)
+
+    def to_arrow(self):
+        """Convert to a `pyarrow.Table` (category columns → dictionary arrays)."""
+        import pyarrow as pa
+
+        arrays = []
+        for j, (name, kind) in enumerate(zip(self._names, self._kinds)):
+            col = self.column(name)
+            if kind == "category":
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(col), pa.array(self._vocab[j], type=pa.string())))
+            else:
+                arrays.append(pa.array(col))
+        return pa.Table.from_arrays(arrays, names=self._names)
+
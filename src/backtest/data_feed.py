@@ -3,12 +3,21 @@
 Yields one MarketEvent per trading day, advancing through the price matrix in
 calendar order.  Provides a rolling window of past prices for feature/z-score
 computation.
+
+Prices are held in one contiguous float64 (Date × Ticker) array; the feed only
+moves a cursor over it, so trailing windows are zero-copy slices rather than
+structures rebuilt from per-bar dicts.
+
+New bars can be appended after construction (`append`); `remaining()` then
+yields only the bars past the cursor, which is how a restored engine snapshot
+resumes (see `BacktestEngine.extend`).
 """
 
 from __future__ import annotations
 
-from collections import deque
+from collections.abc import Mapping
 from typing import Iterator, Optional
+import numpy as np
 import pandas as pd
 
 from .events import MarketEvent
@@ -24,6 +33,8 @@ class HistoricalDataFeed:
     ohlcv_panels : dict[str, DataFrame], optional
         Per-ticker long-format OHLCV DataFrames, keyed by ticker.
         Used to supply full bar `ohlcv` attribute on each MarketEvent.
+        Numeric columns are pre-aligned once into a (Date × Ticker × Field)
+        array; each bar's snapshot is an `OHLCVSnapshot` view into it.
     start : str or Timestamp, optional
         First date to emit (inclusive).
     end : str or Timestamp, optional
@@ -31,7 +42,10 @@ class HistoricalDataFeed:
     warmup_bars : int
         Number of bars to consume *silently* for indicator warm-up before
         emitting the first MarketEvent.  These bars are still accessible via
-        `history`.
+        `window` / `price_history`.
+    history_length : int, optional
+        Maximum number of trailing bars exposed by `window`, `price_history`
+        and `history_df`.  None (default) = everything up to the cursor.
     """
 
     def __init__(
@@ -41,24 +55,10 @@ class HistoricalDataFeed:
         start: Optional[str] = None,
         end: Optional[str] = None,
         warmup_bars: int = 0,
+        history_length: Optional[int] = None,
     ):
         df = price_df.copy()
-        # Normalize index to timezone-naive DatetimeIndex safely.
-        idx = pd.to_datetime(df.index)
-        try:
-            if getattr(idx, "tz", None) is not None:
-                idx = idx.tz_convert("UTC").tz_localize(None)
-            else:
-                idx = idx.tz_localize(None)
-        except Exception:
-            try:
-                idx = idx.tz_localize(None)
-            except Exception:
-                try:
-                    idx = idx.tz_convert(None)
-                except Exception:
-                    pass
-        df.index = idx
+        df.index = _naive_datetime_index(df.index)
         df = df.sort_index()
 
         if start:
@@ -66,15 +66,29 @@ class HistoricalDataFeed:
         if end:
             df = df[df.index <= pd.Timestamp(end)]
 
-        self._df = df
+        if history_length is not None and history_length < 1:
+            raise ValueError("history_length must be >= 1")
+
         self._tickers = list(df.columns)
+        self._ticker_idx = {t: j for j, t in enumerate(self._tickers)}
         self._dates = list(df.index)
-        self._ohlcv_panels = ohlcv_panels or {}
+        self._index = df.index
         self._warmup_bars = warmup_bars
+        self._history_length = history_length
+
+        # Contiguous (Date × Ticker) price matrix, read-only to callers.
+        self._values = np.ascontiguousarray(df.to_numpy(dtype=float))
+        self._values.flags.writeable = False
+        self._valid = ~np.isnan(self._values)
+        self._row_complete = self._valid.all(axis=1)
+        self._tickers_arr = np.array(self._tickers, dtype=object)
+
+        self._init_ohlcv(ohlcv_panels or {})
 
-        # Rolling history: deque of (date, price_dict) — most recent last
-        self._history: deque[tuple[pd.Timestamp, dict[str, float]]] = deque()
         self._current_idx: int = -1
+        # Price dict for the bar under the cursor, built once per bar
+        self._prices_idx: int = -1
+        self._prices: dict[str, float] = {}
 
     # -----------------------------------------------------------------------
     # Public API
@@ -94,49 +108,265 @@ class HistoricalDataFeed:
             return None
         return self._dates[self._current_idx]
 
+    @property
+    def warmup_bars(self) -> int:
+        return self._warmup_bars
+
+    @property
+    def history_length(self) -> Optional[int]:
+        return self._history_length
+
+    def to_numpy(self) -> np.ndarray:
+        """Return the full (Date × Ticker) price matrix, warm-up rows included.
+
+        The array is read-only and shared with the feed (no copy).
+        """
+        return self._values
+
     def current_prices(self) -> dict[str, float]:
         """Return the most recent close prices as a dict."""
-        if not self._history:
+        idx = self._current_idx
+        if idx < 0:
             return {}
-        return dict(self._history[-1][1])
+        if self._prices_idx != idx:
+            self._prices = self._row_prices(idx)
+            self._prices_idx = idx
+        return dict(self._prices)
+
+    def window(self, n: Optional[int] = None) -> np.ndarray:
+        """Return the last `n` bars (up to and including the current one) as a
+        read-only (n × Ticker) view of the price matrix.
+
+        `n` is capped by the bars seen so far and by `history_length`; None
+        returns the full available history.  Columns follow `tickers`.
+        """
+        lo, hi = self._window_bounds(n)
+        return self._values[lo:hi]
+
+    def window_dates(self, n: Optional[int] = None) -> pd.DatetimeIndex:
+        """Dates matching the rows of `window(n)`."""
+        lo, hi = self._window_bounds(n)
+        return self._index[lo:hi]
 
-    def price_history(self, ticker: str, n: int) -> pd.Series:
-        """Return the last n close prices for a ticker as a Series."""
-        dates, prices = zip(*[(d, p.get(ticker, float("nan"))) for d, p in self._history])
-        s = pd.Series(prices, index=dates, name=ticker)
-        return s.iloc[-n:] if n < len(s) else s
+    def price_history(self, ticker: str, n: int) -> np.ndarray:
+        """Return the last n close prices for a ticker as a read-only 1-D view
+        (NaN where the ticker had no price)."""
+        j = self._ticker_idx.get(ticker)
+        if j is None:
+            raise KeyError(f"Unknown ticker: {ticker}")
+        lo, hi = self._window_bounds(n)
+        return self._values[lo:hi, j]
 
     def history_df(self, n: Optional[int] = None) -> pd.DataFrame:
         """Return history as a wide price DataFrame (most recent last)."""
-        dates  = [d for d, _ in self._history]
-        prices = [p for _, p in self._history]
-        df = pd.DataFrame(prices, index=dates)
-        return df if n is None else df.iloc[-n:]
+        lo, hi = self._window_bounds(n)
+        return pd.DataFrame(self._values[lo:hi], index=self._index[lo:hi],
+                            columns=self._tickers)
 
     # -----------------------------------------------------------------------
     # Generator
     # -----------------------------------------------------------------------
 
     def __iter__(self) -> Iterator[MarketEvent]:
-        for idx, date in enumerate(self._dates):
-            row = self._df.iloc[idx]
-            prices = {t: float(row[t]) for t in self._tickers if pd.notna(row[t])}
-            self._current_idx = idx
-            self._history.append((date, prices))
-
-            # Still in warmup window — don't emit an event
-            if idx < self._warmup_bars:
-                continue
-
-            # Build optional full-bar OHLCV snapshot
-            ohlcv_snap = None
-            if self._ohlcv_panels:
-                ohlcv_snap = {}
-                for t, panel in self._ohlcv_panels.items():
-                    if date in panel.index:
-                        ohlcv_snap[t] = panel.loc[date].to_dict()
-
-            yield MarketEvent(date=date, prices=prices, ohlcv=ohlcv_snap)
+        for idx in range(self._warmup_bars, len(self._dates)):
+            # Warm-up bars are never emitted; they stay reachable through the
+            # cursor-relative window accessors.
+            prices = self._advance(idx)
+            yield MarketEvent(date=self._dates[idx], prices=prices,
+                              ohlcv=self._ohlcv_snapshot(idx))
+
+    def remaining(self, until=None) -> Iterator[MarketEvent]:
+        """Like iterating the feed, but starting after the current cursor
+        (resumes a partially consumed or extended feed) and stopping after
+        the last bar dated on or before `until` (None = end of data)."""
+        for idx in range(self.next_index, self.stop_index(until)):
+            prices = self._advance(idx)
+            yield MarketEvent(date=self._dates[idx], prices=prices,
+                              ohlcv=self._ohlcv_snapshot(idx))
+
+    @property
+    def next_index(self) -> int:
+        """Row of the next bar `remaining()` will emit."""
+        return max(self._warmup_bars, self._current_idx + 1)
+
+    def stop_index(self, until=None) -> int:
+        """End (exclusive) row of the bars dated on or before `until`."""
+        if until is None:
+            return len(self._dates)
+        return int(self._index.searchsorted(pd.Timestamp(until), side="right"))
+
+    def append(
+        self,
+        new_bars: pd.DataFrame,
+        ohlcv_panels: Optional[dict[str, pd.DataFrame]] = None,
+    ) -> int:
+        """Append bars dated after the last bar; returns the number added
+        (rows at or before the last bar are ignored, so overlapping fetches
+        are safe).
+
+        Tickers missing from `new_bars` get NaN; unseen tickers are added as
+        new columns (NaN for all earlier bars).  With OHLCV panels, rows of
+        the feed's existing panel tickers are aligned like at construction.
+        """
+        df = new_bars.copy()
+        df.index = _naive_datetime_index(df.index)
+        df = df.sort_index()
+        if self._dates:
+            df = df[df.index > self._dates[-1]]
+        if df.empty:
+            return 0
+
+        new_tickers = [t for t in df.columns if t not in self._ticker_idx]
+        if new_tickers:
+            self._tickers = self._tickers + new_tickers
+            self._ticker_idx = {t: j for j, t in enumerate(self._tickers)}
+            self._tickers_arr = np.array(self._tickers, dtype=object)
+            pad = np.full((len(self._values), len(new_tickers)), np.nan)
+            old = np.hstack([self._values, pad])
+        else:
+            old = self._values
+        block = df.reindex(columns=self._tickers).to_numpy(dtype=float)
+
+        self._values = np.ascontiguousarray(np.vstack([old, block]))
+        self._values.flags.writeable = False
+        self._valid = ~np.isnan(self._values)
+        self._row_complete = self._valid.all(axis=1)
+        self._dates = self._dates + list(df.index)
+        self._index = self._index.append(df.index)
+        self._append_ohlcv(len(df), ohlcv_panels or {})
+        return len(df)
+
+    def _advance(self, idx: int) -> dict[str, float]:
+        """Move the cursor to bar `idx` and return that bar's price dict."""
+        self._current_idx = idx
+        self._prices = self._row_prices(idx)
+        self._prices_idx = idx
+        return self._prices
+
+    def _row_prices(self, idx: int) -> dict[str, float]:
+        """Build the {ticker: price} dict for one bar, skipping missing prices."""
+        row = self._values[idx]
+        if self._row_complete[idx]:
+            return dict(zip(self._tickers, row.tolist()))
+        mask = self._valid[idx]
+        return dict(zip(self._tickers_arr[mask].tolist(), row[mask].tolist()))
+
+    def _window_bounds(self, n: Optional[int]) -> tuple[int, int]:
+        hi = self._current_idx + 1
+        span = hi
+        if self._history_length is not None:
+            span = min(span, self._history_length)
+        if n is not None:
+            span = min(span, max(n, 0))
+        return hi - span, hi
+
+    def _init_ohlcv(self, panels: dict[str, pd.DataFrame]) -> None:
+        """Align the per-ticker OHLCV panels to the feed's dates once."""
+        self._ohlcv_tickers: list[str] = list(panels)
+        self._ohlcv_fields: list[str] = []
+        for panel in panels.values():
+            for col in panel.select_dtypes("number").columns:
+                if col not in self._ohlcv_fields:
+                    self._ohlcv_fields.append(col)
+
+        shape = (len(self._dates), len(self._ohlcv_tickers), len(self._ohlcv_fields))
+        self._ohlcv = np.full(shape, np.nan)
+        self._ohlcv_present = np.zeros(shape[:2], dtype=bool)
+        self._ohlcv_ticker_idx = {t: j for j, t in enumerate(self._ohlcv_tickers)}
+        self._fill_ohlcv(panels, 0)
+        self._ohlcv.flags.writeable = False
+
+    def _append_ohlcv(self, n_new: int, panels: dict[str, pd.DataFrame]) -> None:
+        """Grow the OHLCV array by `n_new` (absent) rows and fill them."""
+        if not self._ohlcv_tickers:
+            return
+        start = len(self._ohlcv)
+        _, k, f = self._ohlcv.shape
+        self._ohlcv = np.concatenate([self._ohlcv, np.full((n_new, k, f), np.nan)])
+        self._ohlcv_present = np.concatenate([self._ohlcv_present, np.zeros((n_new, k), dtype=bool)])
+        self._fill_ohlcv({t: p for t, p in panels.items() if t in self._ohlcv_ticker_idx}, start)
+        self._ohlcv.flags.writeable = False
+
+    def _fill_ohlcv(self, panels: dict[str, pd.DataFrame], start: int) -> None:
+        """Write panel rows dated on feed bars >= `start` into the array."""
+        index = self._index[start:]
+        for t, panel in panels.items():
+            j = self._ohlcv_ticker_idx[t]
+            idx = _naive_datetime_index(panel.index)
+            rows = index.get_indexer(idx)
+            keep = (rows >= 0) & ~idx.duplicated(keep="last")
+            rows = rows[keep] + start
+            block = panel.reindex(columns=self._ohlcv_fields).to_numpy(dtype=float, na_value=np.nan)
+            self._ohlcv[rows, j, :] = block[keep]
+            self._ohlcv_present[rows, j] = True
+
+    def _ohlcv_snapshot(self, idx: int) -> Optional[OHLCVSnapshot]:
+        """Full-bar OHLCV snapshot for bar `idx` (None without panels)."""
+        if not self._ohlcv_tickers:
+            return None
+        return OHLCVSnapshot(self._ohlcv[idx], self._ohlcv_present[idx],
+                             self._ohlcv_ticker_idx, self._ohlcv_fields)
 
     def __len__(self) -> int:
         return max(0, len(self._dates) - self._warmup_bars)
+
+    def __setstate__(self, state: dict) -> None:
+        # Pickling drops the read-only flag of the shared arrays
+        self.__dict__.update(state)
+        self._values.flags.writeable = False
+        self._ohlcv.flags.writeable = False
+
+
+class OHLCVSnapshot(Mapping):
+    """One bar of OHLCV data: a read-only mapping {ticker: {field: value}}.
+
+    Backed by a (Ticker × Field) view into the feed's pre-aligned array, so
+    building it costs nothing per bar; the per-ticker dicts are only created
+    when a ticker is looked up.  Tickers whose panel has no row for the bar
+    are absent.  Use `array` / `field()` for vectorised access.
+    """
+
+    __slots__ = ("array", "_present", "_ticker_idx", "fields")
+
+    def __init__(self, array: np.ndarray, present: np.ndarray,
+                 ticker_idx: dict[str, int], fields: list[str]):
+        self.array = array            # (Ticker × Field), NaN where missing
+        self._present = present
+        self._ticker_idx = ticker_idx
+        self.fields = fields
+
+    def __getitem__(self, ticker: str) -> dict[str, float]:
+        j = self._ticker_idx.get(ticker)
+        if j is None or not self._present[j]:
+            raise KeyError(ticker)
+        return dict(zip(self.fields, self.array[j].tolist()))
+
+    def __iter__(self) -> Iterator[str]:
+        present = self._present
+        return (t for t, j in self._ticker_idx.items() if present[j])
+
+    def __len__(self) -> int:
+        return int(self._present.sum())
+
+    def field(self, name: str) -> np.ndarray:
+        """View of one field across all panel tickers (NaN where absent)."""
+        return self.array[:, self.fields.index(name)]
+
+
+def _naive_datetime_index(index) -> pd.DatetimeIndex:
+    """Normalize an index to a timezone-naive DatetimeIndex safely."""
+    idx = index if isinstance(index, pd.DatetimeIndex) else pd.to_datetime(index)
+    try:
+        if getattr(idx, "tz", None) is not None:
+            idx = idx.tz_convert("UTC").tz_localize(None)
+        else:
+            idx = idx.tz_localize(None)
+    except Exception:
+        try:
+            idx = idx.tz_localize(None)
+        except Exception:
+            try:
+                idx = idx.tz_convert(None)
+            except Exception:
+                pass
+    return idx
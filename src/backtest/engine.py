@@ -8,12 +8,20 @@ Event flow (repeated once per trading day):
     4. SimulatedBroker executes each OrderEvent → FillEvents
     5. Portfolio updates positions / cash for each FillEvent
     6. Portfolio marks equity to market
+
+The engine's complete state — portfolio, strategy buffers and Kalman filters,
+risk manager, broker RNG and feed cursor — can be saved with `snapshot()` and
+restored with `from_snapshot()`.  A restored engine continues where it
+stopped: `extend(new_bars)` appends bars to the feed and runs only those, so
+a nightly job pays for one day instead of replaying the whole history.
 """
 
 from __future__ import annotations
 
-import queue
 import logging
+import pickle
+import time
+from collections import deque
 from typing import Optional
 import pandas as pd
 
@@ -21,10 +29,14 @@ from .events import EventType, MarketEvent, SignalEvent, OrderEvent, FillEvent
 from .data_feed import HistoricalDataFeed
 from .execution import SimulatedBroker
 from .portfolio import Portfolio
+from .profiling import EngineProfiler
 from utils.pair_id import make_pair_id
 
 logger = logging.getLogger(__name__)
 
+# Bumped whenever engine state changes in a way old snapshots cannot load
+SNAPSHOT_FORMAT = 1
+
 
 class BacktestEngine:
     """Drives the event loop.
@@ -43,6 +55,9 @@ class BacktestEngine:
     short_rebate_rate : float
         Annual rate passed to Portfolio.accrue_short_rebate each day.
     verbose : bool
+    profile : bool
+        Record per-handler timings and per-bar latency percentiles
+        (`backtest.profiling`); returned as results["profile"].
     """
 
     def __init__(
@@ -55,6 +70,7 @@ class BacktestEngine:
         risk_manager=None,
         short_rebate_rate: float = 0.04,
         verbose: bool = False,
+        profile: bool = False,
     ):
         self.data_feed         = data_feed
         self.strategy          = strategy
@@ -64,8 +80,18 @@ class BacktestEngine:
         self.position_sizer    = position_sizer or default_position_sizer
         self.short_rebate_rate = short_rebate_rate
         self.verbose           = verbose
-
-        self._event_queue: queue.Queue = queue.Queue()
+        self.profiler          = EngineProfiler() if profile else None
+
+        # Single-threaded loop: a plain deque (no locking) drained FIFO, with
+        # one handler per event type.
+        self._event_queue: deque = deque()
+        self._bar_prices: dict[str, float] = {}
+        self._handlers = {
+            EventType.MARKET: self._handle_market,
+            EventType.SIGNAL: self._handle_signal,
+            EventType.ORDER:  self._handle_order,
+            EventType.FILL:   self._handle_fill,
+        }
         self._bars_processed   = 0
         self._signals_fired    = 0
         self._orders_sent      = 0
@@ -76,32 +102,50 @@ class BacktestEngine:
     # Main loop
     # -----------------------------------------------------------------------
 
-    def run(self) -> dict:
-        """Run the backtest end-to-end and return a results dict."""
+    def run(self, until=None) -> dict:
+        """Run the backtest end-to-end and return a results dict.
+
+        Only bars past the feed cursor are processed, so calling run() again
+        after `data_feed.append` continues the same backtest.  `until` stops
+        after the last bar dated on or before it (the next run() resumes
+        from there).
+        """
         logger.info("Backtest started — %d trading days in feed", len(self.data_feed))
 
-        for market_event in self.data_feed:
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.install(self)
+        try:
+            self._run_events(until, profiler)
+        finally:
+            if profiler is not None:
+                profiler.uninstall()
+
+        return self._build_results()
+
+    def _run_events(self, until, profiler) -> None:
+        queue    = self._event_queue
+        popleft  = queue.popleft
+        handlers = self._handlers
+        perf_counter_ns = time.perf_counter_ns
+
+        for market_event in self.data_feed.remaining(until):
+            if profiler is not None:
+                t0 = perf_counter_ns()
+            # One price snapshot per bar, shared by the sizer, risk manager,
+            # broker and end-of-day mark (lets the portfolio's exposure
+            # aggregates stay valid across every query in the bar).
+            self._bar_prices = prices = self.data_feed.current_prices()
+
             # ── 1. Push market event ────────────────────────────────────────
-            self._event_queue.put(market_event)
+            queue.append(market_event)
 
             # ── 2. Drain queue for this bar ──────────────────────────────────
-            while not self._event_queue.empty():
-                event = self._event_queue.get(block=False)
-
-                if event.event_type == EventType.MARKET:
-                    self._handle_market(event)
-
-                elif event.event_type == EventType.SIGNAL:
-                    self._handle_signal(event)
-
-                elif event.event_type == EventType.ORDER:
-                    self._handle_order(event)
-
-                elif event.event_type == EventType.FILL:
-                    self._handle_fill(event)
+            while queue:
+                event = popleft()
+                handlers[event.event_type](event)
 
             # ── 3. End-of-day portfolio maintenance ──────────────────────────
-            prices = self.data_feed.current_prices()
             self.portfolio.mark_to_market(market_event.date, prices)
             self.portfolio.accrue_short_rebate(self.short_rebate_rate)
 
@@ -115,14 +159,62 @@ class BacktestEngine:
             self._bars_processed += 1
             if self.verbose and self._bars_processed % 252 == 0:
                 eq = self.portfolio.total_equity(prices)
+                live = self.portfolio.live_stats()
                 logger.info(
-                    "Bar %d | %s | Equity: $%.0f | Positions: %d",
+                    "Bar %d | %s | Equity: $%.0f | Positions: %d | Sharpe: %.2f | MaxDD: %.1f%%",
                     self._bars_processed,
                     market_event.date.date(),
                     eq,
                     len(self.portfolio.positions),
+                    live.get("sharpe_ratio", float("nan")),
+                    live.get("max_drawdown_pct", 0.0),
                 )
 
+            if profiler is not None:
+                profiler.record_bar(perf_counter_ns() - t0)
+
+    # -----------------------------------------------------------------------
+    # Snapshots / incremental runs
+    # -----------------------------------------------------------------------
+
+    def extend(self, new_bars: pd.DataFrame, ohlcv_panels: Optional[dict] = None) -> dict:
+        """Append `new_bars` (wide Date × Ticker prices, dated after the last
+        bar) to the feed, process only those bars and return the results of
+        the whole run so far."""
+        n = self.data_feed.append(new_bars, ohlcv_panels)
+        logger.info("Extending backtest by %d bar(s)", n)
+        return self.run()
+
+    def snapshot(self) -> bytes:
+        """Serialize the full engine state (pickle)."""
+        return pickle.dumps({"format": SNAPSHOT_FORMAT, "engine": self},
+                            protocol=pickle.HIGHEST_PROTOCOL)
+
+    def save_snapshot(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.snapshot())
+
+    @classmethod
+    def from_snapshot(cls, blob: bytes) -> "BacktestEngine":
+        """Restore an engine saved with `snapshot()`.
+
+        Snapshots are pickles: only load files you wrote yourself.
+        """
+        state = pickle.loads(blob)
+        if not isinstance(state, dict) or state.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported engine snapshot (expected format {SNAPSHOT_FORMAT})")
+        engine = state["engine"]
+        if not isinstance(engine, cls):
+            raise ValueError(f"Snapshot holds a {type(engine).__name__}, not a {cls.__name__}")
+        return engine
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> "BacktestEngine":
+        with open(path, "rb") as f:
+            return cls.from_snapshot(f.read())
+
+    def _build_results(self) -> dict:
+        """Assemble the results dict returned by run()."""
         stats = self.portfolio.performance_stats()
         logger.info("Backtest complete — %d bars, %d fills, %d rejected",
                     self._bars_processed, self._fills_received, self._orders_rejected)
@@ -143,6 +235,8 @@ class BacktestEngine:
 
         if self.risk_manager is not None:
             result["risk_summary"] = self.risk_manager.summary()
+        if self.profiler is not None:
+            result["profile"] = self.profiler.summary()
 
         return result
 
@@ -153,18 +247,18 @@ class BacktestEngine:
     def _handle_market(self, event: MarketEvent) -> None:
         signals = self.strategy.on_market_event(event, self.portfolio)
         for sig in (signals or []):
-            self._event_queue.put(sig)
+            self._event_queue.append(sig)
             self._signals_fired += 1
 
     def _handle_signal(self, event: SignalEvent) -> None:
-        prices = self.data_feed.current_prices()
+        prices = self._bar_prices
         orders = self.position_sizer(event, self.portfolio, prices)
         for order in (orders or []):
-            self._event_queue.put(order)
+            self._event_queue.append(order)
             self._orders_sent += 1
 
     def _handle_order(self, event: OrderEvent) -> None:
-        prices = self.data_feed.current_prices()
+        prices = self._bar_prices
 
         # Risk management gate
         if self.risk_manager is not None:
@@ -175,7 +269,7 @@ class BacktestEngine:
 
         fill   = self.broker.execute(event, prices)
         if fill is not None:
-            self._event_queue.put(fill)
+            self._event_queue.append(fill)
             # Register pair as open with risk manager
             if self.risk_manager is not None and fill.pair_id:
                 self.risk_manager.register_pair(fill.pair_id)
@@ -5,13 +5,20 @@ Event flow:
     SignalEvent → (PositionSizer) → OrderEvent
     OrderEvent  → (Broker/ExecutionHandler) → FillEvent
     FillEvent   → (Portfolio) → updated positions
+
+Events are plain `__slots__` classes rather than dataclasses: one is allocated
+for every signal, order and fill, so they carry no per-instance `__dict__`.
+Dates are stored as integer nanoseconds since the epoch (`date_ns`); the
+`date` attribute still reads and writes a `pd.Timestamp`, materialised lazily
+and cached when an event is built from a raw integer.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Mapping
 from enum import Enum, auto
-from typing import Optional
+from typing import Optional, Union
+import numpy as np
 import pandas as pd
 
 
@@ -35,56 +42,163 @@ class OrderType(str, Enum):
 
 # ---------------------------------------------------------------------------
 
-@dataclass
-class MarketEvent:
-    """Fired once per bar for each ticker that has a new price."""
-    event_type: EventType = field(default=EventType.MARKET, init=False)
-    date: pd.Timestamp
-    prices: dict[str, float]          # {ticker: close_price}
-    ohlcv: Optional[dict] = None      # full bar data if available
+DateLike = Union[pd.Timestamp, int, None]
+_Timestamp = pd.Timestamp
+
 
+class _Event:
+    """Shared slot storage for the event date plus dataclass-style repr/eq."""
 
-@dataclass
-class SignalEvent:
+    __slots__ = ("date_ns", "_date")
+    _fields: tuple[str, ...] = ()
+
+    @property
+    def date(self) -> Optional[pd.Timestamp]:
+        ts = self._date
+        if ts is None and self.date_ns is not None:
+            ts = self._date = pd.Timestamp(self.date_ns)
+        return ts
+
+    @date.setter
+    def date(self, value: DateLike) -> None:
+        if value is None:
+            self.date_ns, self._date = None, None
+        elif isinstance(value, pd.Timestamp):
+            self.date_ns, self._date = value.value, value
+        elif isinstance(value, (int, np.integer)):
+            self.date_ns, self._date = int(value), None
+        else:
+            ts = pd.Timestamp(value)
+            self.date_ns, self._date = ts.value, ts
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({args})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._fields)
+
+    __hash__ = None
+
+
+class MarketEvent(_Event):
+    """Fired once per bar for each ticker that has a new price."""
+    __slots__ = ("prices", "ohlcv")
+    _fields = ("date", "prices", "ohlcv")
+    event_type = EventType.MARKET
+
+    def __init__(
+        self,
+        date: DateLike,
+        prices: dict[str, float],         # {ticker: close_price}
+        ohlcv: Optional[Mapping] = None,  # full bar data if available
+    ):
+        if date.__class__ is _Timestamp:
+            self.date_ns, self._date = date.value, date
+        else:
+            self.date = date
+        self.prices = prices
+        self.ohlcv  = ohlcv
+
+
+class SignalEvent(_Event):
     """Strategy-generated directional signal for a pair spread."""
-    event_type: EventType = field(default=EventType.SIGNAL, init=False)
-    date: pd.Timestamp
-    ticker1: str
-    ticker2: str
-    direction: str                    # "long_spread" | "short_spread" | "flat"
-    strength: float = 1.0             # 0–1 scalar, used for position sizing
-    spread_zscore: float = 0.0
-    hedge_ratio: float = 1.0
-    strategy_id: str = "pairs"
-
-
-@dataclass
-class OrderEvent:
+    __slots__ = ("ticker1", "ticker2", "direction", "strength",
+                 "spread_zscore", "hedge_ratio", "strategy_id")
+    _fields = ("date", "ticker1", "ticker2", "direction", "strength",
+               "spread_zscore", "hedge_ratio", "strategy_id")
+    event_type = EventType.SIGNAL
+
+    def __init__(
+        self,
+        date: DateLike,
+        ticker1: str,
+        ticker2: str,
+        direction: str,                   # "long_spread" | "short_spread" | "flat"
+        strength: float = 1.0,            # 0–1 scalar, used for position sizing
+        spread_zscore: float = 0.0,
+        hedge_ratio: float = 1.0,
+        strategy_id: str = "pairs",
+    ):
+        if date.__class__ is _Timestamp:
+            self.date_ns, self._date = date.value, date
+        else:
+            self.date = date
+        self.ticker1       = ticker1
+        self.ticker2       = ticker2
+        self.direction     = direction
+        self.strength      = strength
+        self.spread_zscore = spread_zscore
+        self.hedge_ratio   = hedge_ratio
+        self.strategy_id   = strategy_id
+
+
+class OrderEvent(_Event):
     """Single-leg order to execute."""
-    event_type: EventType = field(default=EventType.ORDER, init=False)
-    date: pd.Timestamp
-    ticker: str
-    order_type: OrderType
-    quantity: float                   # +ve = buy, -ve = sell (shares or $ notional)
-    direction: Direction
-    limit_price: Optional[float] = None
-    strategy_id: str = "pairs"
-    pair_id: str = ""                 # e.g. "AAPL/AMD"
-
-
-@dataclass
-class FillEvent:
+    __slots__ = ("ticker", "order_type", "quantity", "direction",
+                 "limit_price", "strategy_id", "pair_id")
+    _fields = ("date", "ticker", "order_type", "quantity", "direction",
+               "limit_price", "strategy_id", "pair_id")
+    event_type = EventType.ORDER
+
+    def __init__(
+        self,
+        date: DateLike,
+        ticker: str,
+        order_type: OrderType,
+        quantity: float,                  # +ve = buy, -ve = sell (shares or $ notional)
+        direction: Direction,
+        limit_price: Optional[float] = None,
+        strategy_id: str = "pairs",
+        pair_id: str = "",                # e.g. "AAPL/AMD"
+    ):
+        if date.__class__ is _Timestamp:
+            self.date_ns, self._date = date.value, date
+        else:
+            self.date = date
+        self.ticker      = ticker
+        self.order_type  = order_type
+        self.quantity    = quantity
+        self.direction   = direction
+        self.limit_price = limit_price
+        self.strategy_id = strategy_id
+        self.pair_id     = pair_id
+
+
+class FillEvent(_Event):
     """Execution confirmation for a single-leg order."""
-    event_type: EventType = field(default=EventType.FILL, init=False)
-    date: pd.Timestamp
-    ticker: str
-    quantity: float                   # signed: +ve = bought, -ve = sold
-    fill_price: float                 # actual execution price (incl. slippage)
-    commission: float                 # total commission $ for this fill
-    slippage_cost: float              # $ slippage vs mid
-    direction: Direction
-    strategy_id: str = "pairs"
-    pair_id: str = ""
+    __slots__ = ("ticker", "quantity", "fill_price", "commission",
+                 "slippage_cost", "direction", "strategy_id", "pair_id")
+    _fields = ("date", "ticker", "quantity", "fill_price", "commission",
+               "slippage_cost", "direction", "strategy_id", "pair_id")
+    event_type = EventType.FILL
+
+    def __init__(
+        self,
+        date: DateLike,
+        ticker: str,
+        quantity: float,                  # signed: +ve = bought, -ve = sold
+        fill_price: float,                # actual execution price (incl. slippage)
+        commission: float,                # total commission $ for this fill
+        slippage_cost: float,             # $ slippage vs mid
+        direction: Direction,
+        strategy_id: str = "pairs",
+        pair_id: str = "",
+    ):
+        if date.__class__ is _Timestamp:
+            self.date_ns, self._date = date.value, date
+        else:
+            self.date = date
+        self.ticker        = ticker
+        self.quantity      = quantity
+        self.fill_price    = fill_price
+        self.commission    = commission
+        self.slippage_cost = slippage_cost
+        self.direction     = direction
+        self.strategy_id   = strategy_id
+        self.pair_id       = pair_id
 
     @property
     def notional(self) -> float:
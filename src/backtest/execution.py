@@ -23,6 +23,12 @@ min_commission : float
 short_rebate_rate : float
     Annualised % rate credited on short proceeds (e.g. 0.04 = 4% per year).
     Accrued and returned daily by Portfolio.call_daily_accrual().
+
+Random slippage noise is drawn from the broker's RNG in blocks of standard
+exponentials and consumed one value per priced order, by both `execute` and
+`execute_batch`.  `Generator.exponential(scale)` is `scale *
+standard_exponential()`, so the fills are bit-identical to drawing one sample
+per order, whichever path (or mix of paths) is used.
 """
 
 from __future__ import annotations
@@ -33,8 +39,20 @@ from dataclasses import dataclass
 from typing import Optional
 import pandas as pd
 
+from .columnar_log import ColumnarLog
 from .events import FillEvent, OrderEvent, Direction
 
+FILL_LOG_SCHEMA = (
+    ("date",          "datetime"),
+    ("ticker",        "category"),
+    ("quantity",      "float"),
+    ("fill_price",    "float"),
+    ("commission",    "float"),
+    ("slippage_cost", "float"),
+    ("pair_id",       "category"),
+    ("direction",     "category"),
+)
+
 
 @dataclass
 class ExecutionConfig:
@@ -49,10 +67,37 @@ class ExecutionConfig:
 class SimulatedBroker:
     """Fill orders at simulated realistic prices."""
 
-    def __init__(self, config: Optional[ExecutionConfig] = None, seed: int = 42):
+    def __init__(
+        self,
+        config: Optional[ExecutionConfig] = None,
+        seed: int = 42,
+        noise_block: int = 1024,
+    ):
         self.cfg = config or ExecutionConfig()
         self._rng = np.random.default_rng(seed)
-        self._fills: list[FillEvent] = []
+        self._fills = ColumnarLog(FILL_LOG_SCHEMA)
+
+        # Pre-drawn standard-exponential slippage noise
+        self._noise_block = max(1, noise_block)
+        self._noise = np.empty(0)
+        self._noise_pos = 0
+
+    def _take_noise(self, n: int) -> np.ndarray:
+        """Next `n` standard-exponential draws from the RNG stream."""
+        avail = len(self._noise) - self._noise_pos
+        if avail < n:
+            fresh = self._rng.standard_exponential(max(self._noise_block, n - avail))
+            self._noise = np.concatenate([self._noise[self._noise_pos:], fresh])
+            self._noise_pos = 0
+        out = self._noise[self._noise_pos:self._noise_pos + n]
+        self._noise_pos += n
+        return out
+
+    @staticmethod
+    def can_fill(order: OrderEvent, prices: dict[str, float]) -> bool:
+        """True if `execute` would produce a fill (the ticker has a price)."""
+        mid = prices.get(order.ticker)
+        return mid is not None and not math.isnan(mid)
 
     # -----------------------------------------------------------------------
 
@@ -75,7 +120,7 @@ class SimulatedBroker:
         # 2. Fixed + optional random slippage
         slip_bps = self.cfg.slippage_bps
         if self.cfg.random_slippage:
-            slip_bps += float(self._rng.exponential(scale=slip_bps * 0.5))
+            slip_bps += float(self._take_noise(1)[0] * (slip_bps * 0.5))
         slip_adj = mid * (slip_bps / 10_000)
         slippage_cost = slip_adj * abs(qty)
 
@@ -100,33 +145,92 @@ class SimulatedBroker:
             strategy_id  = order.strategy_id,
             pair_id      = order.pair_id,
         )
-        self._fills.append(fill)
+        self._fills.append(
+            fill.date_ns, fill.ticker, qty, fill_price, commission,
+            fill.slippage_cost, fill.pair_id, fill.direction.value,
+        )
         return fill
 
+    def execute_batch(
+        self,
+        orders: list[OrderEvent],
+        prices: dict[str, float],
+    ) -> list[FillEvent]:
+        """Execute all orders of one bar in a single vectorised pass.
+
+        Equivalent to calling `execute` on each order in turn (same fill
+        prices, costs and RNG consumption); orders whose ticker has no price
+        are skipped.  Returns the fills in order.
+        """
+        if not orders:
+            return []
+        cfg = self.cfg
+
+        mid = np.array([prices.get(o.ticker, np.nan) for o in orders], dtype=float)
+        priced = ~np.isnan(mid)
+        if not priced.all():
+            orders = [o for o, ok in zip(orders, priced) if ok]
+            if not orders:
+                return []
+            mid = mid[priced]
+
+        qty    = np.array([o.quantity for o in orders], dtype=float)
+        is_buy = qty > 0
+        abs_q  = np.abs(qty)
+
+        # 1. Half-spread cost
+        spread_adj  = mid * (cfg.spread_bps / 10_000)
+        spread_cost = spread_adj * abs_q
+
+        # 2. Fixed + optional random slippage
+        slip_bps = np.full(len(orders), cfg.slippage_bps)
+        if cfg.random_slippage:
+            slip_bps = slip_bps + self._take_noise(len(orders)) * (cfg.slippage_bps * 0.5)
+        slip_adj = mid * (slip_bps / 10_000)
+        slippage_cost = slip_adj * abs_q
+
+        # 3. Fill price: move adversely
+        fill_price = np.where(is_buy, mid + spread_adj + slip_adj, mid - spread_adj - slip_adj)
+
+        # 4. Commission
+        commission = np.maximum(cfg.min_commission, abs_q * fill_price * cfg.commission_pct)
+        total_slip = spread_cost + slippage_cost
+
+        fills = [
+            FillEvent(
+                date         = o.date,
+                ticker       = o.ticker,
+                quantity     = o.quantity,
+                fill_price   = fp,
+                commission   = cm,
+                slippage_cost= sc,
+                direction    = o.direction,
+                strategy_id  = o.strategy_id,
+                pair_id      = o.pair_id,
+            )
+            for o, fp, cm, sc in zip(orders, fill_price.tolist(),
+                                     commission.tolist(), total_slip.tolist())
+        ]
+        self._fills.extend(
+            [o.date_ns for o in orders], [o.ticker for o in orders], qty, fill_price,
+            commission, total_slip, [o.pair_id for o in orders],
+            [o.direction.value for o in orders],
+        )
+        return fills
+
     # -----------------------------------------------------------------------
 
     def fills_df(self) -> pd.DataFrame:
-        if not self._fills:
+        if not len(self._fills):
             return pd.DataFrame()
-        rows = [
-            {
-                "date":          f.date,
-                "ticker":        f.ticker,
-                "quantity":      f.quantity,
-                "fill_price":    f.fill_price,
-                "notional":      f.notional,
-                "commission":    f.commission,
-                "slippage_cost": f.slippage_cost,
-                "total_cost":    f.total_cost,
-                "pair_id":       f.pair_id,
-                "direction":     f.direction.value,
-            }
-            for f in self._fills
-        ]
-        return pd.DataFrame(rows).set_index("date")
+        df = self._fills.to_frame()
+        qty, px = df["quantity"].to_numpy(), df["fill_price"].to_numpy()
+        df.insert(4, "notional", np.abs(qty) * px)
+        df.insert(7, "total_cost", -(qty * px) - df["commission"].to_numpy())
+        return df.set_index("date")
 
     def total_commission(self) -> float:
-        return sum(f.commission for f in self._fills)
+        return float(self._fills.column("commission").sum())
 
     def total_slippage(self) -> float:
-        return sum(f.slippage_cost for f in self._fills)
+        return float(self._fills.column("slippage_cost").sum())
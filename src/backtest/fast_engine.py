@@ -0,0 +1,148 @@
+"""Array-backed fast-path backtesting engine.
+
+Same inputs and same results as `BacktestEngine`, without the event queue:
+
+    1. Each bar's price dict is built once by the feed from its contiguous
+       NumPy price matrix (row + finite mask) and shared by every consumer,
+       instead of `current_prices()` copies per signal and order.
+    2. A single MarketEvent is reused across bars (strategies only read
+       `date` / `prices` from it).
+    3. Signals, orders and fills are processed in flat per-bar batches in the
+       exact order the event queue would drain them (all signals → all
+       orders → all fills), so portfolio/risk state evolves identically.
+    4. One price snapshot per bar is shared by the sizer, risk manager,
+       broker and end-of-day mark instead of copying it for every event.
+    5. Orders that pass the risk gate are filled in one vectorised
+       `SimulatedBroker.execute_batch` call per bar.
+
+Signal/Order/Fill objects are still produced by the strategy, sizer and
+broker — they are sparse (only on state changes) and are the public contract
+of those components.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from .engine import BacktestEngine
+from .events import MarketEvent
+
+logger = logging.getLogger(__name__)
+
+
+class FastBacktestEngine(BacktestEngine):
+    """Drop-in replacement for `BacktestEngine` that runs the bar loop over
+    preallocated arrays.  Constructor parameters are identical.
+    """
+
+    def run(self, until=None) -> dict:
+        """Run the backtest end-to-end and return a results dict (see
+        `BacktestEngine.run`)."""
+        feed = self.data_feed
+        logger.info("Backtest started (fast path) — %d trading days in feed", len(feed))
+
+        # Resume after the feed cursor (a restored snapshot or extended feed)
+        start = feed.next_index
+        stop  = max(start, feed.stop_index(until))
+        dates = feed.dates[start - feed.warmup_bars:stop - feed.warmup_bars]
+
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.install(self)
+        try:
+            self._run_bars(start, dates, profiler)
+        finally:
+            if profiler is not None:
+                profiler.uninstall()
+
+        return self._build_results()
+
+    def _run_bars(self, start: int, dates: list, profiler) -> None:
+        feed = self.data_feed
+        perf_counter_ns = time.perf_counter_ns
+        event = MarketEvent(date=None, prices={})
+
+        for i, date in enumerate(dates):
+            if profiler is not None:
+                t0 = perf_counter_ns()
+            # Advancing the feed cursor keeps window()/current_prices() valid
+            # for strategies that read trailing history from the feed.
+            prices = feed._advance(start + i)
+
+            event.date   = date
+            event.prices = prices
+            event.ohlcv  = feed._ohlcv_snapshot(start + i)
+
+            self._process_bar(event, prices)
+            if profiler is not None:
+                profiler.record_bar(perf_counter_ns() - t0)
+
+    # -----------------------------------------------------------------------
+    # Per-bar processing
+    # -----------------------------------------------------------------------
+
+    def _process_bar(self, event: MarketEvent, prices: dict[str, float]) -> None:
+        # ── 1. Strategy → signals ───────────────────────────────────────────
+        signals = self.strategy.on_market_event(event, self.portfolio) or []
+        self._apply_signals(event, prices, signals)
+
+    def _apply_signals(self, event: MarketEvent, prices: dict[str, float],
+                       signals: list) -> None:
+        """Steps 2–5 of a bar: size, risk-check and fill `signals`, then mark
+        the book.  Shared with `MultiPortfolioEngine`, whose lanes get their
+        signals from a `SignalBook` instead of `strategy.on_market_event`."""
+        portfolio    = self.portfolio
+        risk_manager = self.risk_manager
+        self._signals_fired += len(signals)
+
+        # ── 2. Signals → orders ─────────────────────────────────────────────
+        orders = []
+        for sig in signals:
+            orders.extend(self.position_sizer(sig, portfolio, prices) or [])
+        self._orders_sent += len(orders)
+
+        # ── 3. Orders → fills (risk gate first, then one batched execution) ─
+        # The queue would interleave execution with the risk checks, so a
+        # later order's max-open-pairs check sees pairs registered by earlier
+        # fills.  A fill happens iff the ticker is priced, so registration
+        # can be done here, ahead of the batch.
+        broker = self.broker
+        accepted = []
+        for order in orders:
+            if risk_manager is not None:
+                order = risk_manager.scale_order(order, portfolio, prices)
+                if not risk_manager.check_order(order, portfolio, prices):
+                    self._orders_rejected += 1
+                    continue
+                if order.pair_id and broker.can_fill(order, prices):
+                    risk_manager.register_pair(order.pair_id)
+            accepted.append(order)
+        fills = broker.execute_batch(accepted, prices)
+
+        # ── 4. Fills → portfolio ────────────────────────────────────────────
+        for fill in fills:
+            portfolio.update_fill(fill)
+        self._fills_received += len(fills)
+
+        # ── 5. End-of-day portfolio maintenance ─────────────────────────────
+        portfolio.mark_to_market(event.date, prices)
+        portfolio.accrue_short_rebate(self.short_rebate_rate)
+
+        if risk_manager is not None:
+            risk_manager.update(portfolio, prices)
+            if hasattr(self.strategy, '_current_regime'):
+                risk_manager.set_regime(self.strategy._current_regime)
+
+        self._bars_processed += 1
+        if self.verbose and self._bars_processed % 252 == 0:
+            live = portfolio.live_stats()
+            logger.info(
+                "Bar %d | %s | Equity: $%.0f | Positions: %d | Sharpe: %.2f | MaxDD: %.1f%%",
+                self._bars_processed,
+                event.date.date(),
+                portfolio.total_equity(prices),
+                len(portfolio.positions),
+                live.get("sharpe_ratio", float("nan")),
+                live.get("max_drawdown_pct", 0.0),
+            )
@@ -0,0 +1,198 @@
+"""Multi-portfolio engine: many parameter sets, one pass over the feed.
+
+A parameter sweep over thresholds / sizing normally repeats the whole
+backtest per set, although most of the per-bar work does not depend on those
+parameters at all:
+
+    shared (once per bar)           per parameter set ("lane")
+    ─────────────────────           ──────────────────────────
+    feed advance + price dict       SignalBook state machine (entry/exit/stop
+    price buffers, regime label       thresholds, regime position scale)
+    pair re-selection               position sizer (target_notional_pct)
+    Kalman hedge + spread z-score   risk manager, broker, portfolio
+
+`MultiPortfolioEngine` calls `PairsBacktestStrategy.prepare_bar` once per bar
+and hands the resulting z-scores to one `SignalBook` per lane; each lane is a
+`FastBacktestEngine` that sizes, risk-checks, fills and marks its own book.
+A lane's results are identical to a standalone run of the same parameters
+(same broker seed), because nothing a lane does feeds back into the shared
+computation.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+# Module import (not `from … import`): risk.risk_manager imports
+# backtest.events, so this module can run while it is still initialising.
+import risk.risk_manager as risk_manager_mod
+from strategy.meta_signal import MetaSignalModel
+
+from .data_feed import HistoricalDataFeed
+from .engine import default_position_sizer
+from .events import MarketEvent
+from .execution import ExecutionConfig, SimulatedBroker
+from .fast_engine import FastBacktestEngine
+from .portfolio import Portfolio
+from .strategy_wrapper import PairsBacktestStrategy
+
+logger = logging.getLogger(__name__)
+
+# Regime labels a flat threshold override is applied to (in addition to any
+# labels already present in the strategy's maps)
+_REGIMES = (0, 1, 2, 3)
+
+
+@dataclass
+class ParameterSet:
+    """One lane of a `MultiPortfolioEngine` run.
+
+    Thresholds left as None fall back to the strategy's regime maps.  A flat
+    `entry_z` / `exit_z` / `stop_z` applies to every regime; the `regime_*`
+    maps override individual regimes (on top of the flat value).
+    """
+    name: str
+    target_notional_pct: float = 0.10
+    entry_z: Optional[float] = None
+    exit_z: Optional[float] = None
+    stop_z: Optional[float] = None
+    regime_entry_z: Optional[dict] = None
+    regime_exit_z: Optional[dict] = None
+    regime_stop_z: Optional[dict] = None
+    regime_position_scale: Optional[dict] = None
+    use_risk: bool = True
+    risk_config: Optional["risk_manager_mod.RiskConfig"] = None
+    execution_config: Optional[ExecutionConfig] = None
+    initial_capital: Optional[float] = None
+
+
+def _threshold_map(base: dict, flat: Optional[float], overrides: Optional[dict]) -> dict:
+    out = dict(base)
+    if flat is not None:
+        out = {r: flat for r in set(out) | set(_REGIMES)}
+    if overrides:
+        out.update(overrides)
+    return out
+
+
+class MultiPortfolioEngine:
+    """Run N parameter sets in lockstep over one feed and one strategy.
+
+    Parameters
+    ----------
+    data_feed : HistoricalDataFeed
+    strategy : PairsBacktestStrategy
+        Shared signal computation; its own thresholds are the defaults for
+        every `ParameterSet`.
+    parameter_sets : list of ParameterSet
+        Names must be unique.
+    initial_capital : float
+        Default starting capital per lane.
+    broker_seed : int
+        Seed of every lane's `SimulatedBroker` (same slippage stream as a
+        standalone run with that seed).
+    """
+
+    def __init__(
+        self,
+        data_feed: HistoricalDataFeed,
+        strategy: PairsBacktestStrategy,
+        parameter_sets: List[ParameterSet],
+        initial_capital: float = 1_000_000.0,
+        broker_seed: int = 42,
+        short_rebate_rate: float = 0.04,
+        verbose: bool = False,
+    ):
+        if not parameter_sets:
+            raise ValueError("MultiPortfolioEngine needs at least one ParameterSet")
+        names = [ps.name for ps in parameter_sets]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate parameter set names: {names}")
+
+        self.data_feed = data_feed
+        self.strategy = strategy
+        self.parameter_sets = list(parameter_sets)
+        self._results: Dict[str, dict] = {}
+
+        base = strategy._meta_signal.cfg
+        self._lanes = []
+        for ps in self.parameter_sets:
+            meta_cfg = dataclasses.replace(
+                base,
+                regime_entry_thresholds=_threshold_map(
+                    base.regime_entry_thresholds, ps.entry_z, ps.regime_entry_z),
+                regime_exit_thresholds=_threshold_map(
+                    base.regime_exit_thresholds, ps.exit_z, ps.regime_exit_z),
+                regime_stop_loss=_threshold_map(
+                    base.regime_stop_loss, ps.stop_z, ps.regime_stop_z),
+                regime_position_scale=_threshold_map(
+                    base.regime_position_scale, None, ps.regime_position_scale),
+            )
+            book = strategy.new_book(MetaSignalModel(config=meta_cfg))
+
+            capital = ps.initial_capital if ps.initial_capital is not None else initial_capital
+            risk_manager = None
+            if ps.use_risk:
+                risk_manager = risk_manager_mod.RiskManager(config=ps.risk_config)
+                risk_manager._peak_equity = capital
+
+            lane = FastBacktestEngine(
+                data_feed=data_feed,
+                strategy=strategy,
+                portfolio=Portfolio(initial_capital=capital),
+                broker=SimulatedBroker(config=ps.execution_config, seed=broker_seed),
+                position_sizer=partial(default_position_sizer,
+                                       target_notional_pct=ps.target_notional_pct),
+                risk_manager=risk_manager,
+                short_rebate_rate=short_rebate_rate,
+                verbose=verbose,
+            )
+            self._lanes.append((ps.name, book, lane))
+
+    # -----------------------------------------------------------------------
+
+    def run(self) -> Dict[str, dict]:
+        """Run every lane and return {parameter set name: results dict}
+        (same layout as `BacktestEngine.run()`)."""
+        feed = self.data_feed
+        logger.info("Multi-portfolio backtest started — %d parameter sets, %d trading days",
+                    len(self._lanes), len(feed))
+
+        start = feed.next_index
+        strategy = self.strategy
+        lanes = self._lanes
+        event = MarketEvent(date=None, prices={})
+
+        for i, date in enumerate(feed.dates[start - feed.warmup_bars:]):
+            prices = feed._advance(start + i)
+            event.date   = date
+            event.prices = prices
+            event.ohlcv  = feed._ohlcv_snapshot(start + i)
+
+            bar = strategy.prepare_bar(event)
+            for _, book, lane in lanes:
+                signals = book.on_bar(date, bar) if bar is not None else []
+                lane._apply_signals(event, prices, signals)
+
+        self._results = {name: lane._build_results() for name, _, lane in lanes}
+        return self._results
+
+    def results_table(self) -> pd.DataFrame:
+        """One row of performance stats and event counts per parameter set."""
+        if not self._results:
+            raise RuntimeError("Call run() before results_table()")
+        rows = {}
+        for name, res in self._results.items():
+            row = dict(res["stats"])
+            for key in ("bars", "signals", "orders", "orders_rejected", "fills_count"):
+                row[key] = res[key]
+            rows[name] = row
+        table = pd.DataFrame.from_dict(rows, orient="index")
+        table.index.name = "parameter_set"
+        return table
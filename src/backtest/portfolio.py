@@ -4,9 +4,11 @@ Tracks:
     - Cash balance
     - Long/short equity positions (shares held)
     - Daily mark-to-market equity
+    - Running long/short market-value aggregates (O(1) equity/leverage queries)
     - Short-sale proceeds for rebate accrual
     - Trade log
-    - Performance metrics (Sharpe, Sortino, drawdown, etc.)
+    - Performance metrics (Sharpe, Sortino, drawdown, etc.), both batch
+      (`performance_stats`) and streaming (`live_stats`)
 """
 
 from __future__ import annotations
@@ -16,8 +18,140 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from .columnar_log import ColumnarLog
 from .events import FillEvent, Direction
 
+TRADE_LOG_SCHEMA = (
+    ("date",       "datetime"),
+    ("ticker",     "category"),
+    ("quantity",   "float"),
+    ("fill_price", "float"),
+    ("commission", "float"),
+    ("slippage",   "float"),
+    ("cash_delta", "float"),
+    ("pair_id",    "category"),
+)
+
+
+class _StreamingStats:
+    """Online accumulator behind `Portfolio.live_stats`.
+
+    Running mean/variance (Welford) of daily excess returns and of the
+    negative excess returns, running peak / max drawdown, and trade totals —
+    everything `performance_stats` needs, updated in O(1) per bar / fill.
+    """
+
+    __slots__ = ("daily_rf", "n_marks", "last_equity", "peak", "max_dd",
+                 "n", "mean", "m2", "n_neg", "mean_neg", "m2_neg",
+                 "n_trades", "commission", "slippage")
+
+    def __init__(self, risk_free_rate: float):
+        self.daily_rf = risk_free_rate / 252
+        self.n_marks = 0
+        self.last_equity = 0.0
+        self.peak = -math.inf
+        self.max_dd = math.nan          # until a drawdown is defined (peak ≠ 0)
+        self.n = 0;     self.mean = 0.0;     self.m2 = 0.0
+        self.n_neg = 0; self.mean_neg = 0.0; self.m2_neg = 0.0
+        self.n_trades = 0
+        self.commission = 0.0
+        self.slippage = 0.0
+
+    def add_equity(self, equity: float) -> None:
+        if self.n_marks:
+            if self.last_equity:
+                x = (equity / self.last_equity - 1) - self.daily_rf
+            else:
+                # From zero equity, as `pct_change`: ±inf, or NaN (dropped)
+                # for 0 → 0
+                x = math.copysign(math.inf, equity) if equity else math.nan
+            if x == x:
+                self.n += 1
+                d = x - self.mean
+                self.mean += d / self.n
+                self.m2 += d * (x - self.mean)
+                if x < 0:
+                    self.n_neg += 1
+                    d = x - self.mean_neg
+                    self.mean_neg += d / self.n_neg
+                    self.m2_neg += d * (x - self.mean_neg)
+        self.n_marks += 1
+        self.last_equity = equity
+        if equity > self.peak:
+            self.peak = equity
+        if self.peak:
+            dd = (equity - self.peak) / self.peak
+        else:
+            # Zero peak, as the batch drawdown: 0/0 is skipped, below it -inf
+            dd = -math.inf if equity < 0 else math.nan
+        if dd == dd and not dd >= self.max_dd:
+            self.max_dd = dd
+
+    def add_fill(self, commission: float, slippage: float) -> None:
+        self.n_trades += 1
+        self.commission += commission
+        self.slippage += slippage
+
+
+def _format_stats(initial_capital, end_val, n_days, cagr, ann_vol, sharpe,
+                  sortino, calmar, max_dd, n_trades, commission, slippage) -> dict:
+    """Shared shape/rounding of the performance stats dict."""
+    return {
+        "initial_capital":    initial_capital,
+        "final_equity":       round(end_val, 2),
+        "total_return_pct":   round((end_val / initial_capital - 1) * 100, 2),
+        "cagr_pct":           round(cagr * 100, 2),
+        "ann_vol_pct":        round(ann_vol * math.sqrt(252) * 100, 2),
+        "sharpe_ratio":       round(sharpe, 3),
+        "sortino_ratio":      round(sortino, 3),
+        "calmar_ratio":       round(calmar, 3),
+        "max_drawdown_pct":   round(max_dd * 100, 2),
+        "n_trades":           n_trades,
+        "total_commission":   round(commission, 2),
+        "total_slippage":     round(slippage, 2),
+        "trading_days":       n_days,
+    }
+
+
+def equity_curve_stats(
+    eq: pd.Series,
+    initial_capital: float,
+    risk_free_rate: float = 0.05,
+    n_trades: int = 0,
+    commission: float = 0.0,
+    slippage: float = 0.0,
+) -> dict:
+    """Performance stats of an equity curve ({} if it has < 2 points)."""
+    if len(eq) < 2:
+        return {}
+
+    rets  = eq.pct_change().dropna()
+    daily_rf = risk_free_rate / 252
+    excess   = rets - daily_rf
+
+    # Annualised return (CAGR)
+    n_years  = len(rets) / 252
+    end_val  = eq.iloc[-1]
+    cagr     = (end_val / initial_capital) ** (1 / n_years) - 1 if n_years > 0 else 0.0
+
+    # Sharpe
+    sharpe   = excess.mean() / excess.std() * math.sqrt(252) if excess.std() > 0 else float("nan")
+
+    # Sortino (downside deviation)
+    neg      = excess[excess < 0]
+    sortino  = excess.mean() / neg.std() * math.sqrt(252) if len(neg) > 1 and neg.std() > 0 else float("nan")
+
+    # Calmar
+    roll_max = eq.cummax()
+    dd       = (eq - roll_max) / roll_max
+    max_dd   = dd.min()
+    calmar   = cagr / abs(max_dd) if max_dd != 0 else float("nan")
+
+    return _format_stats(
+        initial_capital, end_val, len(rets), cagr, rets.std(), sharpe,
+        sortino, calmar, max_dd, n_trades, commission, slippage,
+    )
+
 
 class Portfolio:
     """Mark-to-market portfolio with margin-aware position tracking.
@@ -32,6 +166,8 @@ class Portfolio:
     max_gross_leverage : float
         Hard cap on (longs + |shorts|) / equity.  Engine enforces via
         rejection of orders that would breach this.
+    risk_free_rate : float
+        Annual rate used by the streaming `live_stats()` accumulator.
     """
 
     def __init__(
@@ -39,6 +175,7 @@ class Portfolio:
         initial_capital: float = 1_000_000.0,
         margin_requirement: float = 0.50,
         max_gross_leverage: float = 4.0,
+        risk_free_rate: float = 0.05,
     ):
         self.initial_capital   = initial_capital
         self.margin_requirement = margin_requirement
@@ -52,11 +189,25 @@ class Portfolio:
 
         # Historical records
         self._equity_curve: list[tuple[pd.Timestamp, float]] = []
-        self._trades: list[dict] = []
+        self._trades = ColumnarLog(TRADE_LOG_SCHEMA)
+        self._live = _StreamingStats(risk_free_rate)
 
         # Current market prices (updated by mark_to_market)
         self._last_prices: dict[str, float] = {}
 
+        # Running exposure aggregates, valued against the price snapshot
+        # `_agg_prices` (a ticker missing from it is valued at avg_cost).
+        # `_marks[t]` is the price position t is currently carried at, so a
+        # fill only has to swap that one ticker's contribution.  Queries
+        # against a different dict trigger one O(positions) resync; the
+        # engines pass the same dict for every query within a bar.  A price
+        # dict updated in place is only picked up by `mark_to_market` or
+        # after `invalidate_exposure`.
+        self._long_mv: float  = 0.0   # Σ shares × price over longs
+        self._short_mv: float = 0.0   # Σ |shares| × price over shorts
+        self._marks: dict[str, float] = {}
+        self._agg_prices: Optional[dict[str, float]] = None
+
     # -----------------------------------------------------------------------
     # Core operations
     # -----------------------------------------------------------------------
@@ -122,24 +273,25 @@ class Portfolio:
             self.short_proceeds.pop(t, None)
 
         self.cash += cash_delta
+        if self._agg_prices is not None:
+            self._apply_exposure(t, old_pos)
 
         # Record trade
-        self._trades.append({
-            "date":        fill.date,
-            "ticker":      fill.ticker,
-            "quantity":    fill.quantity,
-            "fill_price":  fill.fill_price,
-            "commission":  fill.commission,
-            "slippage":    fill.slippage_cost,
-            "cash_delta":  cash_delta,
-            "pair_id":     fill.pair_id,
-        })
+        self._trades.append(
+            fill.date_ns, fill.ticker, fill.quantity, fill.fill_price,
+            fill.commission, fill.slippage_cost, cash_delta, fill.pair_id,
+        )
+        self._live.add_fill(fill.commission, fill.slippage_cost)
 
     def mark_to_market(self, date: pd.Timestamp, prices: dict[str, float]) -> float:
         """Update equity curve with current prices.  Returns total equity."""
         self._last_prices.update(prices)
+        # Full resync: `_last_prices` was just mutated in place, and a new
+        # bar's prices move every open position anyway.
+        self._resync_exposure(prices or self._last_prices)
         equity = self.total_equity(prices)
         self._equity_curve.append((date, equity))
+        self._live.add_equity(equity)
         return equity
 
     def accrue_short_rebate(self, rebate_rate_annual: float = 0.04) -> None:
@@ -154,34 +306,40 @@ class Portfolio:
 
     def total_equity(self, prices: Optional[dict[str, float]] = None) -> float:
         """Market value of portfolio (cash + long MV − short MV)."""
-        p = prices or self._last_prices
-        pos_mv = sum(
-            shares * p.get(t, self.avg_cost.get(t, 0.0))
-            for t, shares in self.positions.items()
-        )
-        return self.cash + pos_mv
+        self._exposure_for(prices)
+        return self.cash + self._long_mv - self._short_mv
+
+    def long_market_value(self, prices: Optional[dict[str, float]] = None) -> float:
+        """Σ shares × price over long positions."""
+        self._exposure_for(prices)
+        return self._long_mv
+
+    def short_market_value(self, prices: Optional[dict[str, float]] = None) -> float:
+        """Σ |shares| × price over short positions (a positive number)."""
+        self._exposure_for(prices)
+        return self._short_mv
+
+    def gross_notional(self, prices: Optional[dict[str, float]] = None) -> float:
+        """Long MV + |short MV|."""
+        self._exposure_for(prices)
+        return self._long_mv + self._short_mv
+
+    def net_notional(self, prices: Optional[dict[str, float]] = None) -> float:
+        """Long MV − |short MV|."""
+        self._exposure_for(prices)
+        return self._long_mv - self._short_mv
 
     def gross_leverage(self, prices: Optional[dict[str, float]] = None) -> float:
-        p = prices or self._last_prices
-        equity = self.total_equity(p)
+        equity = self.total_equity(prices)
         if equity <= 0:
             return float("inf")
-        gross_notional = sum(
-            abs(shares) * p.get(t, self.avg_cost.get(t, 0.0))
-            for t, shares in self.positions.items()
-        )
-        return gross_notional / equity
+        return (self._long_mv + self._short_mv) / equity
 
     def net_leverage(self, prices: Optional[dict[str, float]] = None) -> float:
-        p = prices or self._last_prices
-        equity = self.total_equity(p)
+        equity = self.total_equity(prices)
         if equity <= 0:
             return float("inf")
-        net_notional = sum(
-            shares * p.get(t, self.avg_cost.get(t, 0.0))
-            for t, shares in self.positions.items()
-        )
-        return net_notional / equity
+        return (self._long_mv - self._short_mv) / equity
 
     def margin_available(self) -> float:
         """Cash not pledged as short margin collateral."""
@@ -194,6 +352,55 @@ class Portfolio:
     def get_position(self, ticker: str) -> float:
         return self.positions.get(ticker, 0.0)
 
+    # -----------------------------------------------------------------------
+    # Exposure aggregates
+    # -----------------------------------------------------------------------
+
+    def _exposure_for(self, prices: Optional[dict[str, float]]) -> None:
+        """Make sure the aggregates are valued against `prices`."""
+        p = prices or self._last_prices
+        if p is not self._agg_prices:
+            self._resync_exposure(p)
+
+    def invalidate_exposure(self) -> None:
+        """Revalue the aggregates on the next query (call after updating a
+        price dict in place between queries)."""
+        self._agg_prices = None
+
+    def _resync_exposure(self, p: dict[str, float]) -> None:
+        """Recompute the aggregates from scratch against snapshot `p`."""
+        long_mv = short_mv = 0.0
+        marks = {}
+        avg_cost = self.avg_cost
+        for t, shares in self.positions.items():
+            px = marks[t] = p.get(t, avg_cost.get(t, 0.0))
+            if shares > 0:
+                long_mv += shares * px
+            else:
+                short_mv -= shares * px
+        self._long_mv, self._short_mv = long_mv, short_mv
+        self._marks = marks
+        self._agg_prices = p
+
+    def _apply_exposure(self, t: str, old_pos: float) -> None:
+        """Swap ticker t's contribution after a fill (O(1))."""
+        old_px = self._marks.pop(t, 0.0)
+        if old_pos > 0:
+            self._long_mv -= old_pos * old_px
+        elif old_pos < 0:
+            self._short_mv += old_pos * old_px
+
+        new_pos = self.positions.get(t)
+        if new_pos is not None:
+            px = self._marks[t] = self._agg_prices.get(t, self.avg_cost.get(t, 0.0))
+            if new_pos > 0:
+                self._long_mv += new_pos * px
+            else:
+                self._short_mv -= new_pos * px
+        elif not self.positions:
+            # Flat book: drop accumulated rounding residue.
+            self._long_mv = self._short_mv = 0.0
+
     # -----------------------------------------------------------------------
     # Results / Reporting
     # -----------------------------------------------------------------------
@@ -205,56 +412,49 @@ class Portfolio:
         return pd.Series(vals, index=dates, name="equity")
 
     def trades_df(self) -> pd.DataFrame:
-        if not self._trades:
+        if not len(self._trades):
             return pd.DataFrame()
-        return pd.DataFrame(self._trades).set_index("date")
+        return self._trades.to_frame().set_index("date")
 
     def performance_stats(self, risk_free_rate: float = 0.05) -> dict:
-        eq = self.equity_curve()
-        if len(eq) < 2:
+        # Trade totals straight from the columnar log
+        return equity_curve_stats(
+            self.equity_curve(), self.initial_capital, risk_free_rate,
+            n_trades=len(self._trades),
+            commission=float(self._trades.column("commission").sum()),
+            slippage=float(self._trades.column("slippage").sum()),
+        )
+
+    def live_stats(self) -> dict:
+        """O(1) snapshot of `performance_stats()` at the current bar.
+
+        Built from the streaming accumulator updated by `mark_to_market` /
+        `update_fill`, using the `risk_free_rate` given at construction.
+        Same keys and (up to float summation order) same values as the batch
+        computation.
+        """
+        acc = self._live
+        if acc.n_marks < 2:
             return {}
 
-        rets  = eq.pct_change().dropna()
-        daily_rf = risk_free_rate / 252
-        excess   = rets - daily_rf
-
-        # Annualised return (CAGR)
-        n_years  = len(rets) / 252
-        end_val  = eq.iloc[-1]
-        cagr     = (end_val / self.initial_capital) ** (1 / n_years) - 1 if n_years > 0 else 0.0
-
-        # Sharpe
-        sharpe   = excess.mean() / excess.std() * math.sqrt(252) if excess.std() > 0 else float("nan")
-
-        # Sortino (downside deviation)
-        neg      = excess[excess < 0]
-        sortino  = excess.mean() / neg.std() * math.sqrt(252) if len(neg) > 1 and neg.std() > 0 else float("nan")
-
-        # Calmar
-        roll_max = eq.cummax()
-        dd       = (eq - roll_max) / roll_max
-        max_dd   = dd.min()
-        calmar   = cagr / abs(max_dd) if max_dd != 0 else float("nan")
-
-        # Win rate
-        trades = self.trades_df()
-        n_trades = len(trades)
-
-        total_commission = trades["commission"].sum() if "commission" in trades.columns else 0.0
-        total_slippage   = trades["slippage"].sum()   if "slippage"   in trades.columns else 0.0
-
-        return {
-            "initial_capital":    self.initial_capital,
-            "final_equity":       round(end_val, 2),
-            "total_return_pct":   round((end_val / self.initial_capital - 1) * 100, 2),
-            "cagr_pct":           round(cagr * 100, 2),
-            "ann_vol_pct":        round(rets.std() * math.sqrt(252) * 100, 2),
-            "sharpe_ratio":       round(sharpe, 3),
-            "sortino_ratio":      round(sortino, 3),
-            "calmar_ratio":       round(calmar, 3),
-            "max_drawdown_pct":   round(max_dd * 100, 2),
-            "n_trades":           n_trades,
-            "total_commission":   round(total_commission, 2),
-            "total_slippage":     round(total_slippage, 2),
-            "trading_days":       len(rets),
-        }
+        # NumPy scalars, as in the batch stats: zero capital or equity gives
+        # inf / NaN instead of raising
+        end_val = np.float64(acc.last_equity)
+        n_years = acc.n / 252
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cagr = (end_val / self.initial_capital) ** (1 / n_years) - 1 if n_years > 0 else 0.0
+
+            std = math.sqrt(acc.m2 / (acc.n - 1)) if acc.n > 1 else float("nan")
+            sharpe = acc.mean / std * math.sqrt(252) if std > 0 else float("nan")
+
+            std_neg = math.sqrt(acc.m2_neg / (acc.n_neg - 1)) if acc.n_neg > 1 else float("nan")
+            sortino = (acc.mean / std_neg * math.sqrt(252)
+                       if acc.n_neg > 1 and std_neg > 0 else float("nan"))
+
+            max_dd = acc.max_dd
+            calmar = cagr / abs(max_dd) if max_dd != 0 else float("nan")
+
+            return _format_stats(
+                self.initial_capital, end_val, acc.n, cagr, std, sharpe,
+                sortino, calmar, max_dd, acc.n_trades, acc.commission, acc.slippage,
+            )
@@ -0,0 +1,107 @@
+"""Rolling (bars × tickers) price matrix.
+
+`PriceWindow` holds the last `size` bars of prices for a growing set of
+tickers in one float array, so a bar is a single row write and any trailing
+span of bars is a zero-copy NumPy view (or a DataFrame over that view).
+
+Layout: the array has 2·size rows and every bar is written twice, at ring
+slot `pos` and at `pos + size`.  The bars ending at slot `pos` are then
+always the contiguous rows `[pos + size + 1 - n, pos + size + 1)` — no
+unrolling or copying on read.  Missing prints are NaN.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class PriceWindow:
+    """Last `size` bars × tickers of prices, oldest row first on read.
+
+    Views returned by `values`, `column` and `frame` alias the internal
+    buffer: they are valid until the next `append` (which overwrites the
+    oldest row) or `add_ticker` (which may reallocate).  Copy them to keep
+    them longer.
+    """
+
+    def __init__(self, size: int, tickers: Iterable[str] = (), capacity: int = 16):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self.tickers: List[str] = []
+        self.columns: Dict[str, int] = {}          # ticker → column index
+        self._buf = np.full((2 * size, max(capacity, 1)), np.nan)
+        self._dates = np.zeros(2 * size, dtype="datetime64[ns]")
+        self._pos = size - 1                        # ring slot of the latest bar
+        self.n_bars = 0                             # bars appended so far
+        for t in tickers:
+            self.add_ticker(t)
+
+    def __len__(self) -> int:
+        """Number of bars currently held (≤ size)."""
+        return min(self.n_bars, self.size)
+
+    # -----------------------------------------------------------------------
+    # Writes
+    # -----------------------------------------------------------------------
+
+    def add_ticker(self, ticker: str) -> int:
+        """Column index of `ticker`, adding an all-NaN column if it is new."""
+        j = self.columns.get(ticker)
+        if j is not None:
+            return j
+        j = len(self.tickers)
+        if j == self._buf.shape[1]:
+            grown = np.full((2 * self.size, 2 * j), np.nan)
+            grown[:, :j] = self._buf
+            self._buf = grown
+        self.tickers.append(ticker)
+        self.columns[ticker] = j
+        return j
+
+    def append(self, date, cols, values) -> None:
+        """Add one bar: `values` at column indices `cols`, NaN elsewhere."""
+        pos = (self._pos + 1) % self.size
+        row = self._buf[pos]
+        row.fill(np.nan)
+        row[cols] = values
+        self._buf[pos + self.size] = row
+        self._dates[pos] = self._dates[pos + self.size] = np.datetime64(pd.Timestamp(date), "ns")
+        self._pos = pos
+        self.n_bars += 1
+
+    # -----------------------------------------------------------------------
+    # Zero-copy reads
+    # -----------------------------------------------------------------------
+
+    def _rows(self, n: Optional[int]) -> slice:
+        held = len(self)
+        n = held if n is None else max(0, min(n, held))
+        end = self._pos + self.size + 1
+        return slice(end - n, end)
+
+    def values(self, n: Optional[int] = None) -> np.ndarray:
+        """View of the last `n` bars (default: all held) × tickers."""
+        return self._buf[self._rows(n), :len(self.tickers)]
+
+    def column(self, j: int, n: Optional[int] = None) -> np.ndarray:
+        """View of the last `n` bars of column `j`."""
+        return self._buf[self._rows(n), j]
+
+    def dates(self, n: Optional[int] = None) -> pd.DatetimeIndex:
+        """Dates of the last `n` bars."""
+        return pd.DatetimeIndex(self._dates[self._rows(n)])
+
+    def frame(self, n: Optional[int] = None) -> pd.DataFrame:
+        """Wide Date × ticker DataFrame over `values(n)` (not copied)."""
+        return pd.DataFrame(self.values(n), index=self.dates(n),
+                            columns=list(self.tickers), copy=False)
+
+    def tail(self, j: int, k: int) -> np.ndarray:
+        """Last `k` non-missing prices of column `j`, oldest first (fewer if
+        the window holds fewer)."""
+        col = self.column(j)
+        return col[~np.isnan(col)][-k:]
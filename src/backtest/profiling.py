@@ -0,0 +1,156 @@
+"""Opt-in per-handler timing for the backtest engines.
+
+`EngineProfiler` answers "where does a bar's time go": it wraps the
+collaborator methods the engine calls on every bar —
+
+    strategy.on_market_event      position_sizer
+    risk_manager.scale_order      risk_manager.check_order
+    risk_manager.update           broker.execute / broker.execute_batch
+    portfolio.update_fill         portfolio.mark_to_market
+    portfolio.accrue_short_rebate
+
+— with instance-level timers for the duration of `run()`, and records the
+wall time of every bar.  Enable it with `BacktestEngine(..., profile=True)`
+(`backtest.profile` in the config, `--profile` on the CLI); `run()` then
+returns the summary under `results["profile"]`.
+
+Nothing is wrapped when profiling is off, so the only cost of the feature
+is one `is None` check per bar.  The wrappers are removed again when `run()`
+returns, so snapshots never contain them.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# (engine attribute, method name, label)
+TIMED_METHODS = (
+    ("strategy",     "on_market_event",     "strategy.on_market_event"),
+    ("risk_manager", "scale_order",         "risk_manager.scale_order"),
+    ("risk_manager", "check_order",         "risk_manager.check_order"),
+    ("risk_manager", "update",              "risk_manager.update"),
+    ("broker",       "execute",             "broker.execute"),
+    ("broker",       "execute_batch",       "broker.execute_batch"),
+    ("portfolio",    "update_fill",         "portfolio.update_fill"),
+    ("portfolio",    "mark_to_market",      "portfolio.mark_to_market"),
+    ("portfolio",    "accrue_short_rebate", "portfolio.accrue_short_rebate"),
+)
+
+PERCENTILES = (50, 95, 99)
+
+
+class _Timed:
+    """Callable stand-in for a method that adds its run time to a profiler."""
+
+    __slots__ = ("fn", "stats")
+
+    def __init__(self, fn, stats: list):
+        self.fn = fn
+        self.stats = stats              # [calls, total_ns], shared with the profiler
+
+    def __call__(self, *args, **kwargs):
+        t0 = time.perf_counter_ns()
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            self.stats[1] += time.perf_counter_ns() - t0
+            self.stats[0] += 1
+
+
+class EngineProfiler:
+    """Cumulative per-handler timings and per-bar latencies of an engine."""
+
+    def __init__(self):
+        self.handlers: dict[str, list] = {}     # label → [calls, total_ns]
+        self.bar_ns: list[int] = []
+        self._installed: list[tuple] = []
+
+    # -----------------------------------------------------------------------
+    # Wrapping
+    # -----------------------------------------------------------------------
+
+    def install(self, engine) -> None:
+        """Wrap the engine's collaborators (see `TIMED_METHODS`)."""
+        if self._installed:
+            return
+        for attr, name, label in TIMED_METHODS:
+            obj = getattr(engine, attr, None)
+            if obj is not None and hasattr(obj, name):
+                self._wrap(obj, name, label)
+        self._wrap(engine, "position_sizer", "position_sizer")
+
+    def uninstall(self) -> None:
+        """Restore every wrapped attribute."""
+        for obj, name, had_own, old in reversed(self._installed):
+            if had_own:
+                setattr(obj, name, old)
+            else:
+                delattr(obj, name)
+        self._installed.clear()
+
+    def _wrap(self, obj, name: str, label: str) -> None:
+        had_own = name in getattr(obj, "__dict__", {})
+        old = obj.__dict__.get(name) if had_own else None
+        stats = self.handlers.setdefault(label, [0, 0])
+        setattr(obj, name, _Timed(getattr(obj, name), stats))
+        self._installed.append((obj, name, had_own, old))
+
+    def record_bar(self, elapsed_ns: int) -> None:
+        self.bar_ns.append(elapsed_ns)
+
+    # -----------------------------------------------------------------------
+    # Reporting
+    # -----------------------------------------------------------------------
+
+    def summary(self) -> dict:
+        """{"handlers": {label: {calls, total_s, mean_us}}, "bar_latency_us":
+        {p50, p95, p99, mean, max}, "bars": n, "total_s": s}"""
+        handlers = {
+            label: {
+                "calls": calls,
+                "total_s": total / 1e9,
+                "mean_us": total / calls / 1e3 if calls else 0.0,
+            }
+            for label, (calls, total) in self.handlers.items()
+            if calls
+        }
+        bars = np.asarray(self.bar_ns, dtype=float) / 1e3
+        latency = {}
+        if len(bars):
+            latency = {f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(bars, PERCENTILES))}
+            latency["mean"] = float(bars.mean())
+            latency["max"] = float(bars.max())
+        return {
+            "handlers": handlers,
+            "bar_latency_us": latency,
+            "bars": len(bars),
+            "total_s": float(bars.sum()) / 1e6,
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        """Handler table sorted by cumulative time, with each handler's share
+        of total bar time."""
+        summary = self.summary()
+        df = pd.DataFrame.from_dict(summary["handlers"], orient="index")
+        if df.empty:
+            return df
+        df.index.name = "handler"
+        if summary["total_s"] > 0:
+            df["pct_of_bar_time"] = 100.0 * df["total_s"] / summary["total_s"]
+        return df.sort_values("total_s", ascending=False)
+
+
+def profile_metrics(summary: Optional[dict]) -> dict[str, float]:
+    """Flatten a profile summary into MLflow-safe metric names."""
+    if not summary:
+        return {}
+    out = {f"profile_bar_{k}_us": v for k, v in summary["bar_latency_us"].items()}
+    for label, row in summary["handlers"].items():
+        key = label.replace(".", "_")
+        out[f"profile_{key}_total_s"] = row["total_s"]
+        out[f"profile_{key}_calls"] = float(row["calls"])
+    return out
@@ -0,0 +1,176 @@
+"""Ahead-of-time pair re-selection.
+
+`PairsBacktestStrategy` re-selects pairs every `reselection_interval` bars by
+running `find_pairs` on its trailing price window, which stalls the bar loop.
+That work depends only on prices, not on portfolio state, so for a known
+price path it can be done up front:
+
+    precompute_reselection(strategy, prices_the_strategy_will_see, n_workers=4)
+    engine.run()        # re-selection bars are now look-ups
+
+`precompute_reselection` replays the re-selection schedule over `prices`
+(the strategy's cadence, including the adaptive rule when its regimes are
+known in advance from a regime timeline), rebuilds every trailing window
+exactly as the strategy's `PriceWindow` will hold it, and runs
+`PairReSelector.select` on all windows in a process pool (prices shared
+through `SharedFrames`).  Results are registered on the re-selector keyed by
+window; a bar whose window was not precomputed (e.g. the schedule moved
+because regimes differed from the guess) simply selects synchronously, so
+results are always identical to a run without precomputation.
+
+An incremental selector (`PairReSelector(incremental=True)`) slides its
+window sums from one window to the next, so its windows are handed out as
+contiguous runs, each processed in order by one worker: every run builds
+the sums once and then slides them.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .shared_data import SharedFrames, single_threaded_children
+
+logger = logging.getLogger(__name__)
+
+
+def reselection_windows(strategy, prices: pd.DataFrame) -> Tuple[pd.DataFrame, List[tuple]]:
+    """Price history and trailing windows of the re-selections ahead.
+
+    `prices` are the bars the strategy will receive next, in order, as a
+    wide Date × ticker frame (missing prints NaN, as `HistoricalDataFeed`
+    skips them).  Returns the full history (bars already held + `prices`,
+    columns in the strategy's registration order) and one
+    `(row_lo, row_hi, n_columns)` slice of it per scheduled re-selection.
+    """
+    rs = strategy._pair_reselector
+    prices = prices.astype(float)
+
+    # Window columns in the order the strategy will register them: tickers
+    # known now, then new ones by their first valid price (feed column order
+    # within a bar)
+    known = list(strategy._tickers)
+    valid = prices.notna().to_numpy()
+    first = np.where(valid.any(axis=0), valid.argmax(axis=0), -1)
+    new = [(first[k], k, t) for k, t in enumerate(prices.columns)
+           if first[k] >= 0 and t not in strategy._tix]
+    new.sort()
+    columns = known + [t for _, _, t in new]
+    registered_at = [f for f, _, _ in new]          # bar offset of each new column
+
+    held = strategy._window.frame().copy() if len(strategy._window) else None
+    future = prices.reindex(columns=columns)
+    history = future if held is None else pd.concat([held.reindex(columns=columns), future])
+    history.index = pd.DatetimeIndex(history.index)
+    n_held = 0 if held is None else len(held)
+    span = min(strategy._buf_size, rs.lookback_days)
+
+    # Regimes the strategy will see: from its timeline while it covers the
+    # bar; without a detector the label just carries; otherwise unknown, and
+    # the schedule falls back to the static cadence
+    ns = strategy._timeline_ns
+    regimes = [r for _, r in strategy._regime_history]
+    carry = strategy._current_regime
+    known_regimes = True
+
+    windows = []
+    last = rs._last_reselection_bar
+    for i, date in enumerate(prices.index):
+        bar = strategy._bar_count + i + 1
+        if bar < strategy.warmup_bars:
+            continue
+        now = pd.Timestamp(date).value
+        if ns and ns[0] <= now <= ns[-1]:
+            carry = strategy._timeline_labels[bisect.bisect_right(ns, now) - 1]
+        elif strategy._regime_detector is not None:
+            known_regimes = False
+        regimes.append(carry)
+        recent = regimes[-40:] if known_regimes else None
+
+        n_cols = len(known) + bisect.bisect_right(registered_at, i)
+        if n_cols < 2 or not rs.is_due(bar, last, recent):
+            continue
+        last = bar
+        hi = n_held + i + 1
+        windows.append((max(0, hi - span), hi, n_cols))
+    return history, windows
+
+
+# Per-worker state, set once by the pool initializer
+_WORKER: dict = {}
+
+
+def _init_worker(spec: dict, reselector) -> None:
+    shared = SharedFrames.attach(spec)
+    _WORKER.update(shared=shared, history=shared.frames()["history"], reselector=reselector)
+
+
+def _worker_select(window: tuple) -> pd.DataFrame:
+    lo, hi, n_cols = window
+    return _WORKER["reselector"].select(_WORKER["history"].iloc[lo:hi, :n_cols])
+
+
+def _worker_select_run(windows: List[tuple]) -> List[pd.DataFrame]:
+    return [_worker_select(window) for window in windows]
+
+
+def precompute_reselection(
+    strategy,
+    prices: pd.DataFrame,
+    n_workers: Optional[int] = None,
+    mp_context: str = "spawn",
+) -> int:
+    """Run the upcoming re-selections of `strategy` over `prices` ahead of
+    time and register them on its `PairReSelector`.
+
+    Parameters
+    ----------
+    strategy : PairsBacktestStrategy
+        Strategy positioned before the first bar of `prices`.
+    prices : DataFrame
+        The bars the strategy will receive next (e.g. the rest of the
+        backtest feed's price matrix).
+    n_workers : int, optional
+        Worker processes (default: CPU count).  1 runs in-process.
+
+    Returns the number of windows precomputed.
+    """
+    rs = strategy._pair_reselector
+    if rs is None or prices.empty:
+        return 0
+    history, windows = reselection_windows(strategy, prices)
+    if not windows:
+        return 0
+
+    n_workers = max(1, min(n_workers or os.cpu_count() or 1, len(windows)))
+    logger.info("Precomputing %d pair re-selection window(s) on %d worker(s)",
+                len(windows), n_workers)
+    if n_workers == 1:
+        results = [rs.select(history.iloc[lo:hi, :n]) for lo, hi, n in windows]
+    else:
+        with SharedFrames.create({"history": history}) as shared, \
+                single_threaded_children(), \
+                ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    mp_context=get_context(mp_context),
+                    initializer=_init_worker,
+                    initargs=(shared.spec, rs),
+                ) as pool:
+            if rs._selector.incremental:
+                runs = np.array_split(np.arange(len(windows)), n_workers)
+                results = [df for run in pool.map(_worker_select_run,
+                                                  [[windows[k] for k in r] for r in runs])
+                           for df in run]
+            else:
+                results = list(pool.map(_worker_select, windows))
+
+    for (lo, hi, n_cols), new_pairs_df in zip(windows, results):
+        rs.add_precomputed(rs.window_key(history.iloc[lo:hi, :n_cols]), new_pairs_df)
+    return len(windows)
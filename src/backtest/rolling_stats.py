@@ -0,0 +1,177 @@
+"""Incremental windowed statistics for per-bar signal generation.
+
+`PairMomentsBank` keeps, for every active pair (one row each), the last
+`window` (price1, price2) observations in a ring buffer together with their
+running means and co-moments (Welford-style add/remove updates).  Because
+the spread of a pair under hedge ratio h is linear in the two legs,
+
+    mean(s1 - h·s2) = m1 - h·m2
+    var(s1 - h·s2)  = (C11 - 2h·C12 + h²·C22) / n
+
+the rolling z-score of every spread is available in O(1) per pair per bar
+even though the (Kalman) hedge ratios change every bar and re-weight the
+whole window — and all pairs are updated in one vectorized step.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class PairMomentsBank:
+    """Windowed means / co-moments of many (price1, price2) series.
+
+    Row k is pair k: `x1[k]`, `x2[k]` are its ring buffers (oldest sample at
+    `head[k]`), `count[k]` how many are filled.  `push` slides a subset of
+    rows by one observation; `reset` reloads a single row.  A row's moments
+    are recomputed from its ring every `resync_every` pushes so rounding
+    error cannot accumulate over long runs.
+
+    `seen` is caller bookkeeping stored alongside each row (the strategy
+    keeps the legs' sample counters there to decide between push and reset).
+    """
+
+    _ROW_ARRAYS = ("x1", "x2", "head", "count", "pushes",
+                   "m1", "m2", "c11", "c22", "c12", "seen")
+
+    def __init__(self, window: int, n_pairs: int = 0, resync_every: int = 1000):
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self.window = window
+        self.resync_every = resync_every
+        self.x1 = np.zeros((n_pairs, window))
+        self.x2 = np.zeros((n_pairs, window))
+        self.head = np.zeros(n_pairs, dtype=np.int64)
+        self.count = np.zeros(n_pairs, dtype=np.int64)
+        self.pushes = np.zeros(n_pairs, dtype=np.int64)
+        self.m1 = np.zeros(n_pairs)
+        self.m2 = np.zeros(n_pairs)
+        self.c11 = np.zeros(n_pairs)
+        self.c22 = np.zeros(n_pairs)
+        self.c12 = np.zeros(n_pairs)
+        self.seen = np.full((n_pairs, 2), -1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+    # -----------------------------------------------------------------------
+    # Rows
+    # -----------------------------------------------------------------------
+
+    def keep(self, mask: np.ndarray) -> None:
+        """Drop the rows where `mask` is False (order of the rest preserved)."""
+        for name in self._ROW_ARRAYS:
+            setattr(self, name, getattr(self, name)[mask])
+
+    def extend(self, n: int) -> None:
+        """Append `n` empty rows."""
+        fresh = PairMomentsBank(self.window, n, self.resync_every)
+        for name in self._ROW_ARRAYS:
+            setattr(self, name, np.concatenate([getattr(self, name), getattr(fresh, name)]))
+
+    def reset(self, k: int, x1: np.ndarray, x2: np.ndarray) -> None:
+        """Reload row `k` from the last `window` values of two equal-length arrays."""
+        x1 = np.asarray(x1, dtype=float)[-self.window:]
+        x2 = np.asarray(x2, dtype=float)[-self.window:]
+        n = len(x1)
+        self.x1[k, :n] = x1
+        self.x2[k, :n] = x2
+        self.head[k] = 0
+        self.count[k] = n
+        self._recompute([k])
+
+    # -----------------------------------------------------------------------
+    # Updates
+    # -----------------------------------------------------------------------
+
+    def push(self, rows: np.ndarray, v1: np.ndarray, v2: np.ndarray) -> None:
+        """Append one observation to each of `rows` (distinct row indices),
+        evicting the oldest sample of rows whose window is full."""
+        if len(rows) == 0:
+            return
+        w = self.window
+        count = self.count[rows]
+        head = self.head[rows]
+        full = count == w
+        slot = np.where(full, head, (head + count) % w)
+
+        if full.any():
+            r = rows[full]
+            old = head[full]
+            self._remove(r, self.x1[r, old], self.x2[r, old])
+            self.head[r] = (old + 1) % w
+
+        self.x1[rows, slot] = v1
+        self.x2[rows, slot] = v2
+        self._add(rows, v1, v2)
+
+        self.pushes[rows] += 1
+        stale = rows[self.pushes[rows] >= self.resync_every]
+        if len(stale):
+            self._recompute(stale)
+
+    def spread_zscore(self, hedge: np.ndarray, min_std: float = 1e-10) -> np.ndarray:
+        """z-score of each row's latest spread x1 − hedge·x2 against its
+        window (population std); NaN for empty rows or flat spreads."""
+        n = self.count
+        out = np.full(len(n), np.nan)
+        rows = np.flatnonzero(n > 0)
+        if len(rows) == 0:
+            return out
+        n = n[rows]
+        h = hedge[rows]
+        var = (self.c11[rows] - 2.0 * h * self.c12[rows] + h * h * self.c22[rows]) / n
+        sig = np.sqrt(np.maximum(var, 0.0))
+        last = (self.head[rows] + n - 1) % self.window
+        spread = self.x1[rows, last] - h * self.x2[rows, last]
+        flat = sig < min_std
+        z = (spread - (self.m1[rows] - h * self.m2[rows])) / np.where(flat, 1.0, sig)
+        out[rows] = np.where(flat, np.nan, z)
+        return out
+
+    # -----------------------------------------------------------------------
+    # Welford updates
+    # -----------------------------------------------------------------------
+
+    def _add(self, rows, v1, v2) -> None:
+        n = self.count[rows] + 1
+        self.count[rows] = n
+        d1 = v1 - self.m1[rows]
+        d2 = v2 - self.m2[rows]
+        m1 = self.m1[rows] + d1 / n
+        m2 = self.m2[rows] + d2 / n
+        self.c11[rows] += d1 * (v1 - m1)
+        self.c22[rows] += d2 * (v2 - m2)
+        self.c12[rows] += d1 * (v2 - m2)
+        self.m1[rows] = m1
+        self.m2[rows] = m2
+
+    def _remove(self, rows, v1, v2) -> None:
+        n = self.count[rows] - 1
+        empty = n == 0
+        d1 = v1 - self.m1[rows]
+        d2 = v2 - self.m2[rows]
+        m1 = self.m1[rows] - d1 / np.where(empty, 1, n)
+        m2 = self.m2[rows] - d2 / np.where(empty, 1, n)
+        keep = ~empty
+        self.c11[rows] = np.where(keep, self.c11[rows] - d1 * (v1 - m1), 0.0)
+        self.c22[rows] = np.where(keep, self.c22[rows] - d2 * (v2 - m2), 0.0)
+        self.c12[rows] = np.where(keep, self.c12[rows] - (v1 - m1) * d2, 0.0)
+        self.m1[rows] = np.where(keep, m1, 0.0)
+        self.m2[rows] = np.where(keep, m2, 0.0)
+        self.count[rows] = n
+
+    def _recompute(self, rows) -> None:
+        for k in rows:
+            n = self.count[k]
+            self.pushes[k] = 0
+            if n == 0:
+                self.m1[k] = self.m2[k] = self.c11[k] = self.c22[k] = self.c12[k] = 0.0
+                continue
+            idx = (self.head[k] + np.arange(n)) % self.window
+            a, b = self.x1[k, idx], self.x2[k, idx]
+            self.m1[k], self.m2[k] = a.mean(), b.mean()
+            da, db = a - self.m1[k], b - self.m2[k]
+            self.c11[k] = da @ da
+            self.c22[k] = db @ db
+            self.c12[k] = da @ db
@@ -15,10 +15,12 @@ Features:
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import sys
 import logging
 import warnings
+from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
@@ -41,17 +43,20 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import PlatformConfig, setup_logging
 from pathlib import Path
-from data.yfinance_client import YFinanceClient
+from data.data_client_factory import DataClientFactory
 from features.featurize import compute_standard_features, compute_market_correlation_feature
 from regime.hmm_detector import HMMRegimeDetector
 from strategy.pairs_trading import PairsSelector
 from strategy.pair_reselection import PairReSelector
 from risk.risk_manager import RiskManager, RiskConfig
 from backtest.data_feed import HistoricalDataFeed
+from backtest.reselection_precompute import precompute_reselection
 from backtest.execution import SimulatedBroker, ExecutionConfig
 from backtest.portfolio import Portfolio
 from backtest.engine import BacktestEngine
 from backtest.engine import default_position_sizer
+from backtest.fast_engine import FastBacktestEngine
+from backtest.profiling import profile_metrics
 from backtest.strategy_wrapper import PairsBacktestStrategy
 
 logger = logging.getLogger(__name__)
@@ -86,6 +91,17 @@ def parse_args() -> argparse.Namespace:
                    help="Also write logs to this file")
     p.add_argument("--no-plot", action="store_true",
                    help="Disable generating pyplot figures (faster)")
+    p.add_argument("--engine", type=str, default=None, choices=["event", "fast"],
+                   help="Backtest engine: event-driven queue or array-backed fast path")
+    p.add_argument("--profile", action="store_true",
+                   help="Time each engine handler and report per-bar latency percentiles")
+    p.add_argument("--save-snapshot", type=str, default=None,
+                   help="Write the final engine state here (resume with scripts/extend_backtest.py)")
+    p.add_argument("--data-source", type=str, default=None,
+                   choices=["yfinance", "parquet", "synthetic"],
+                   help="Market data source (parquet/synthetic run fully offline)")
+    p.add_argument("--data-dir", type=str, default=None,
+                   help="Parquet directory for --data-source parquet")
     return p.parse_args()
 
 
@@ -107,6 +123,14 @@ def build_config(args: argparse.Namespace) -> PlatformConfig:
         cfg.reselection.interval_days = args.reselect_interval
     if args.no_reselect:
         cfg.reselection.enabled = False
+    if args.engine:
+        cfg.backtest.engine = args.engine
+    if args.profile:
+        cfg.backtest.profile = True
+    if args.data_source:
+        cfg.data.source = args.data_source
+    if args.data_dir:
+        cfg.data.data_dir = args.data_dir
     if args.log_level:
         cfg.log_level = args.log_level
 
@@ -117,9 +141,11 @@ def build_config(args: argparse.Namespace) -> PlatformConfig:
 # Pipeline
 # ─────────────────────────────────────────────────────────────────────────────
 
-def fetch_wide_prices(tickers, period, interval, cache_dir: str | None = None) -> tuple[pd.DataFrame, dict]:
-    """Returns (wide_price_df, per_ticker_feature_dict)."""
-    client = YFinanceClient()
+def fetch_wide_prices(tickers, period, interval, cache_dir: str | None = None,
+                      client=None) -> tuple[pd.DataFrame, dict]:
+    """Returns (wide_price_df, per_ticker_feature_dict).  `client` defaults to
+    `DataClientFactory.create()` (yfinance unless $STATARB_DATA_SOURCE says otherwise)."""
+    client = client or DataClientFactory.create()
     price_dict, feature_dict = {}, {}
     # Prepare disk cache directory (per-ticker, keyed by period+interval)
     cache_path = Path(cache_dir) if cache_dir else None
@@ -174,11 +200,12 @@ def fetch_macro_features(
     macro_tickers: list,
     period: str = "15y",
     interval: str = "1d",
+    client=None,
 ) -> dict:
     """Download macro assets (VIX, gold, treasuries, oil) and compute features.
     Returns {ticker: feature_df}.
     """
-    client = YFinanceClient()
+    client = client or DataClientFactory.create()
     macro_dict: dict = {}
     for t in macro_tickers:
         try:
@@ -292,6 +319,7 @@ def select_pairs(wide_prices: pd.DataFrame, end_date: pd.Timestamp,
         pvalue_threshold=cfg.pairs.pvalue_threshold,
         min_half_life=cfg.pairs.min_half_life,
         max_half_life=cfg.pairs.max_half_life,
+        kernel=cfg.pairs.coint_kernel,
     )
     pairs_df  = selector.find_pairs(in_sample, verbose=False,
                                     max_pairs=cfg.pairs.max_pairs)
@@ -354,14 +382,181 @@ def compute_regime_performance(
     return pd.DataFrame(rows).set_index("Regime") if rows else pd.DataFrame()
 
 
-def run_backtest(cfg: PlatformConfig, use_risk: bool = True, use_plot: bool = True) -> dict:
+@dataclass
+class MarketData:
+    """Prices and features fetched once and shared by any number of backtests.
+
+    Only `cfg.data` and `cfg.regime.regime_ticker` / `macro_tickers` affect
+    this step; everything else in `PlatformConfig` can vary across runs that
+    reuse the same `MarketData` (see `backtest.sweep`).
+    """
+    wide: pd.DataFrame          # wide price matrix, Date × Ticker
+    feature_dict: dict          # ticker → feature DataFrame
+    macro_dict: dict            # macro ticker → feature DataFrame
+
+
+def load_market_data(cfg: PlatformConfig) -> MarketData:
+    """Fetch and featurize the universe (steps 1 and the feature part of 3)."""
+    # Always include the regime ticker so HMM training works regardless of universe choice.
+    fetch_tickers = list(cfg.data.tickers)
+    if cfg.regime.regime_ticker not in fetch_tickers:
+        fetch_tickers.append(cfg.regime.regime_ticker)
+    client = DataClientFactory.from_config(cfg)
+    wide, feature_dict = fetch_wide_prices(
+        fetch_tickers, cfg.data.period, cfg.data.interval, client=client
+    )
+
+    # Augment regime-ticker features with market-wide mean pairwise correlation.
+    # Gives the HMM a cross-sectional risk signal beyond single-ticker statistics.
+    try:
+        market_corr = compute_market_correlation_feature(wide, window=60, max_tickers=30)
+        regime_feat = feature_dict.get(cfg.regime.regime_ticker)
+        if regime_feat is not None and not market_corr.empty:
+            regime_feat = regime_feat.copy()
+            market_corr_aligned = market_corr.reindex(regime_feat.index, method="nearest")
+            regime_feat["market_corr"] = market_corr_aligned.values
+            feature_dict[cfg.regime.regime_ticker] = regime_feat
+            logger.info("Market correlation feature injected into regime-ticker features (%d rows)", len(market_corr))
+    except Exception as e:
+        logger.warning("Could not compute market correlation feature: %s", e)
+
+    # Fetch macro features for multivariate HMM if configured (guide §6)
+    macro_dict: dict = {}
+    if cfg.regime.macro_tickers:
+        print(f"  Fetching macro tickers for multivariate HMM: {cfg.regime.macro_tickers}")
+        macro_dict = fetch_macro_features(
+            cfg.regime.macro_tickers, cfg.data.period, cfg.data.interval, client=client
+        )
+
+    return MarketData(wide=wide, feature_dict=feature_dict, macro_dict=macro_dict)
+
+
+def build_backtest_engine(
+    cfg: PlatformConfig,
+    price_df: pd.DataFrame,
+    pairs_df: pd.DataFrame,
+    regime_detector=None,
+    use_risk: bool = True,
+    feed_warmup_bars: int | None = None,
+):
+    """Wire feed, broker, portfolio, risk manager, re-selector and strategy
+    for one out-of-sample run over `price_df` (step 4 of the pipeline)."""
+    data_feed = HistoricalDataFeed(
+        price_df=price_df,
+        warmup_bars=cfg.pairs.warmup_bars if feed_warmup_bars is None else feed_warmup_bars,
+    )
+
+    exec_config = ExecutionConfig(
+        slippage_bps=cfg.execution.slippage_bps,
+        spread_bps=cfg.execution.spread_bps,
+        commission_pct=cfg.execution.commission_pct,
+        min_commission=cfg.execution.min_commission,
+    )
+    broker    = SimulatedBroker(config=exec_config, seed=cfg.backtest.seed)
+    portfolio = Portfolio(initial_capital=cfg.backtest.initial_capital)
+
+    # Risk manager
+    risk_manager = None
+    if use_risk:
+        risk_cfg = RiskConfig(
+            max_gross_leverage=cfg.risk.max_gross_leverage,
+            max_net_leverage=cfg.risk.max_net_leverage,
+            max_pair_notional_pct=cfg.risk.max_pair_notional_pct,
+            max_ticker_notional_pct=cfg.risk.max_ticker_notional_pct,
+            max_open_pairs=cfg.risk.max_open_pairs,
+            drawdown_halt_pct=cfg.risk.drawdown_halt_pct,
+            drawdown_reduce_pct=cfg.risk.drawdown_reduce_pct,
+            drawdown_scale_factor=cfg.risk.drawdown_scale_factor,
+            regime_leverage_caps=getattr(cfg.risk, "regime_leverage_caps", None) or getattr(cfg.risk, "regime_leverage_caps", {}),
+            regime_max_open_pairs=getattr(cfg.risk, "regime_max_open_pairs", None) or getattr(cfg.risk, "regime_max_open_pairs", {}),
+            regime_pair_notional_pct=getattr(cfg.risk, "regime_pair_notional_pct", None) or getattr(cfg.risk, "regime_pair_notional_pct", {}),
+            regime_ticker_notional_pct=getattr(cfg.risk, "regime_ticker_notional_pct", None) or getattr(cfg.risk, "regime_ticker_notional_pct", {}),
+        )
+        risk_manager = RiskManager(config=risk_cfg)
+        risk_manager._peak_equity = cfg.backtest.initial_capital
+        logger.info("Risk manager enabled: %s", risk_cfg)
+
+    # Pair re-selector
+    pair_reselector = None
+    if cfg.reselection.enabled:
+        pair_reselector = PairReSelector(
+            reselection_interval=cfg.reselection.interval_days,
+            lookback_days=cfg.reselection.lookback_days,
+            pvalue_threshold=cfg.pairs.pvalue_threshold,
+            min_half_life=cfg.pairs.min_half_life,
+            max_half_life=cfg.pairs.max_half_life,
+            max_pairs=cfg.pairs.max_pairs,
+            incremental=cfg.reselection.incremental,
+            kernel=cfg.pairs.coint_kernel,
+        )
+        logger.info("Pair re-selection enabled every %d days", cfg.reselection.interval_days)
+
+    # Walk-forward labels, when the detector has them, drive the regime
+    # directly; the detector's online model covers bars past their end
+    regime_timeline = None
+    if regime_detector is not None and cfg.regime.precomputed_timeline:
+        regime_timeline = getattr(regime_detector, "walkforward_labels", None)
+
+    strategy = PairsBacktestStrategy(
+        pairs=pairs_df.to_dict("records"),
+        zscore_window=cfg.pairs.zscore_window,
+        entry_z=cfg.pairs.entry_z,
+        exit_z=cfg.pairs.exit_z,
+        stop_z=cfg.pairs.stop_z,
+        regime_detector=regime_detector,
+        regime_ticker=cfg.regime.regime_ticker,
+        regime_entry_z_map=cfg.pairs.regime_entry_z,
+        regime_exit_z_map=cfg.pairs.regime_exit_z,
+        regime_position_scale_map=getattr(cfg.pairs, "regime_position_scale", None),
+        warmup_bars=cfg.pairs.warmup_bars,
+        pair_reselector=pair_reselector,
+        all_tickers=cfg.data.tickers,
+        regime_timeline=regime_timeline,
+        regime_stream=cfg.regime.stream,
+    )
+    if pair_reselector is not None and cfg.reselection.precompute:
+        precompute_reselection(strategy, price_df.iloc[data_feed.next_index:],
+                               n_workers=cfg.reselection.precompute_workers)
+
+    engine_cls = FastBacktestEngine if cfg.backtest.engine == "fast" else BacktestEngine
+    return engine_cls(
+        data_feed=data_feed,
+        strategy=strategy,
+        portfolio=portfolio,
+        broker=broker,
+        # partial (not a lambda) so the engine can be pickled by snapshot()
+        position_sizer=functools.partial(
+            default_position_sizer,
+            target_notional_pct=cfg.backtest.target_notional_pct,
+        ),
+        risk_manager=risk_manager,
+        verbose=cfg.backtest.verbose,
+        profile=cfg.backtest.profile,
+    )
+
+
+def run_backtest(
+    cfg: PlatformConfig,
+    use_risk: bool = True,
+    use_plot: bool = True,
+    market_data: MarketData | None = None,
+    log_mlflow: bool = True,
+    snapshot_path: str | None = None,
+) -> dict:
+    """Run the full pipeline for one config.
+
+    Pass `market_data` (from `load_market_data`) to skip fetching and
+    featurizing; `log_mlflow=False` skips experiment tracking (used by
+    sweep workers).  `snapshot_path` saves the engine state after the run
+    (see `BacktestEngine.extend`).
+    """
     print("=" * 64)
     print("  Regime-Adaptive Pairs Backtest")
     print("=" * 64)
 
     # Optionally start MLflow run to record experiment metadata and artifacts
     mlflow_run = None
-    if _HAS_MLFLOW:
+    if _HAS_MLFLOW and log_mlflow:
         try:
             import datetime as _dt
             exp_name = getattr(cfg.backtest, "experiment_name", "regime-adaptive-backtests")
@@ -401,6 +596,8 @@ def run_backtest(cfg: PlatformConfig, use_risk: bool = True, use_plot: bool = Tr
                     "drawdown_halt_pct": float(cfg.risk.drawdown_halt_pct),
                     "reselection_enabled": bool(cfg.reselection.enabled),
                     "reselection_interval_days": int(cfg.reselection.interval_days),
+                    "engine": str(cfg.backtest.engine),
+                    "seed": int(cfg.backtest.seed),
                 }
                 # MLflow limits param count; log in one call, extras silently ignored
                 mlflow.log_params(all_params)
@@ -411,14 +608,12 @@ def run_backtest(cfg: PlatformConfig, use_risk: bool = True, use_plot: bool = Tr
 
     # 1. Fetch data
     print("\n[1/5] Fetching price data…")
-    # Always include the regime ticker so HMM training works regardless of universe choice.
-    fetch_tickers = list(cfg.data.tickers)
-    regime_ticker_extra = cfg.regime.regime_ticker not in fetch_tickers
-    if regime_ticker_extra:
-        fetch_tickers.append(cfg.regime.regime_ticker)
-    wide, feature_dict = fetch_wide_prices(
-        fetch_tickers, cfg.data.period, cfg.data.interval
-    )
+    if market_data is None:
+        market_data = load_market_data(cfg)
+    wide         = market_data.wide
+    feature_dict = market_data.feature_dict
+    macro_dict   = market_data.macro_dict
+    regime_ticker_extra = cfg.regime.regime_ticker not in cfg.data.tickers
     print(f"  Price matrix: {wide.shape[0]} days × {wide.shape[1]} tickers "
           f"({wide.index[0].date()} → {wide.index[-1].date()})")
 
@@ -431,28 +626,6 @@ def run_backtest(cfg: PlatformConfig, use_risk: bool = True, use_plot: bool = Tr
     # 3. In-sample: fit regime detector + select pairs
     print("\n[3/5] Fitting regime detector and selecting pairs (in-sample)…")
 
-    # Augment regime-ticker features with market-wide mean pairwise correlation.
-    # Gives the HMM a cross-sectional risk signal beyond single-ticker statistics.
-    try:
-        market_corr = compute_market_correlation_feature(wide, window=60, max_tickers=30)
-        regime_feat = feature_dict.get(cfg.regime.regime_ticker)
-        if regime_feat is not None and not market_corr.empty:
-            regime_feat = regime_feat.copy()
-            market_corr_aligned = market_corr.reindex(regime_feat.index, method="nearest")
-            regime_feat["market_corr"] = market_corr_aligned.values
-            feature_dict[cfg.regime.regime_ticker] = regime_feat
-            logger.info("Market correlation feature injected into regime-ticker features (%d rows)", len(market_corr))
-    except Exception as e:
-        logger.warning("Could not compute market correlation feature: %s", e)
-
-    # Fetch macro features for multivariate HMM if configured (guide §6)
-    macro_dict: dict = {}
-    if cfg.regime.macro_tickers:
-        print(f"  Fetching macro tickers for multivariate HMM: {cfg.regime.macro_tickers}")
-        macro_dict = fetch_macro_features(
-            cfg.regime.macro_tickers, cfg.data.period, cfg.data.interval
-        )
-
     regime_detector = fit_regime_detector(
         feature_dict,
         cfg.regime.regime_ticker,
@@ -512,86 +685,15 @@ def run_backtest(cfg: PlatformConfig, use_risk: bool = True, use_plot: bool = Tr
     print(f"\n[4/5] Running out-of-sample backtest (from {split_date.date()})…")
     wide_oos = wide[wide.index >= split_date]
 
-    data_feed = HistoricalDataFeed(
-        price_df=wide_oos,
-        warmup_bars=cfg.pairs.warmup_bars,
-    )
-
-    exec_config = ExecutionConfig(
-        slippage_bps=cfg.execution.slippage_bps,
-        spread_bps=cfg.execution.spread_bps,
-        commission_pct=cfg.execution.commission_pct,
-        min_commission=cfg.execution.min_commission,
-    )
-    broker    = SimulatedBroker(config=exec_config)
-    portfolio = Portfolio(initial_capital=cfg.backtest.initial_capital)
-
-    # Risk manager
-    risk_manager = None
-    if use_risk:
-        risk_cfg = RiskConfig(
-            max_gross_leverage=cfg.risk.max_gross_leverage,
-            max_net_leverage=cfg.risk.max_net_leverage,
-            max_pair_notional_pct=cfg.risk.max_pair_notional_pct,
-            max_ticker_notional_pct=cfg.risk.max_ticker_notional_pct,
-            max_open_pairs=cfg.risk.max_open_pairs,
-            drawdown_halt_pct=cfg.risk.drawdown_halt_pct,
-            drawdown_reduce_pct=cfg.risk.drawdown_reduce_pct,
-            drawdown_scale_factor=cfg.risk.drawdown_scale_factor,
-            regime_leverage_caps=getattr(cfg.risk, "regime_leverage_caps", None) or getattr(cfg.risk, "regime_leverage_caps", {}),
-            regime_max_open_pairs=getattr(cfg.risk, "regime_max_open_pairs", None) or getattr(cfg.risk, "regime_max_open_pairs", {}),
-            regime_pair_notional_pct=getattr(cfg.risk, "regime_pair_notional_pct", None) or getattr(cfg.risk, "regime_pair_notional_pct", {}),
-            regime_ticker_notional_pct=getattr(cfg.risk, "regime_ticker_notional_pct", None) or getattr(cfg.risk, "regime_ticker_notional_pct", {}),
-        )
-        risk_manager = RiskManager(config=risk_cfg)
-        risk_manager._peak_equity = cfg.backtest.initial_capital
-        logger.info("Risk manager enabled: %s", risk_cfg)
-
-    # Pair re-selector
-    pair_reselector = None
-    if cfg.reselection.enabled:
-        pair_reselector = PairReSelector(
-            reselection_interval=cfg.reselection.interval_days,
-            lookback_days=cfg.reselection.lookback_days,
-            pvalue_threshold=cfg.pairs.pvalue_threshold,
-            min_half_life=cfg.pairs.min_half_life,
-            max_half_life=cfg.pairs.max_half_life,
-            max_pairs=cfg.pairs.max_pairs,
-        )
-        logger.info("Pair re-selection enabled every %d days", cfg.reselection.interval_days)
-
-    strategy = PairsBacktestStrategy(
-        pairs=pairs_df.to_dict("records"),
-        zscore_window=cfg.pairs.zscore_window,
-        entry_z=cfg.pairs.entry_z,
-        exit_z=cfg.pairs.exit_z,
-        stop_z=cfg.pairs.stop_z,
-        regime_detector=regime_detector,
-        regime_ticker=cfg.regime.regime_ticker,
-        regime_entry_z_map=cfg.pairs.regime_entry_z,
-        regime_exit_z_map=cfg.pairs.regime_exit_z,
-        regime_position_scale_map=getattr(cfg.pairs, "regime_position_scale", None),
-        warmup_bars=cfg.pairs.warmup_bars,
-        pair_reselector=pair_reselector,
-        all_tickers=cfg.data.tickers,
-    )
-
-    engine = BacktestEngine(
-        data_feed=data_feed,
-        strategy=strategy,
-        portfolio=portfolio,
-        broker=broker,
-        position_sizer=lambda signal, pf, prices: default_position_sizer(
-            signal,
-            pf,
-            prices,
-            target_notional_pct=cfg.backtest.target_notional_pct,
-        ),
-        risk_manager=risk_manager,
-        verbose=cfg.backtest.verbose,
-    )
+    engine = build_backtest_engine(cfg, wide_oos, pairs_df, regime_detector, use_risk=use_risk)
+    strategy        = engine.strategy
+    broker          = engine.broker
+    pair_reselector = strategy._pair_reselector
 
     results = engine.run()
+    if snapshot_path:
+        engine.save_snapshot(snapshot_path)
+        print(f"  Engine snapshot saved → {snapshot_path}")
     results["selected_pairs"] = pairs_df.to_dict("records")
     results["pair_reselection_count"] = (
         pair_reselector.reselection_count if pair_reselector is not None else 0
@@ -623,6 +725,14 @@ def run_backtest(cfg: PlatformConfig, use_risk: bool = True, use_plot: bool = Tr
     if pair_reselector:
         print(f"\n  Pair Re-selections: {pair_reselector.reselection_count}")
 
+    if "profile" in results:
+        lat = results["profile"]["bar_latency_us"]
+        print(f"\n  Engine profile ({results['profile']['bars']} bars):")
+        if lat:
+            print(f"    Bar latency µs  : p50 {lat['p50']:.0f} | p95 {lat['p95']:.0f} | "
+                  f"p99 {lat['p99']:.0f} | max {lat['max']:.0f}")
+        print(engine.profiler.to_frame().to_string(float_format=lambda v: f"{v:.3f}"))
+
     # Per-regime performance breakdown (spec §4.4)
     if not regime_series.empty:
         regime_perf = compute_regime_performance(
@@ -650,6 +760,13 @@ def run_backtest(cfg: PlatformConfig, use_risk: bool = True, use_plot: bool = Tr
                 except Exception:
                     pass
 
+            # --- engine profile (only with backtest.profile) ---
+            for k, v in profile_metrics(results.get("profile")).items():
+                try:
+                    mlflow.log_metric(k, float(v))
+                except Exception:
+                    pass
+
             # --- pairs selected metric ---
             try:
                 mlflow.log_metric("n_pairs_selected", float(len(pairs_df)))
@@ -864,7 +981,7 @@ def main():
     setup_logging(level=cfg.log_level, log_file=args.log_file)
     use_risk = not args.no_risk
     use_plot = not getattr(args, "no_plot", False)
-    run_backtest(cfg, use_risk=use_risk, use_plot=use_plot)
+    run_backtest(cfg, use_risk=use_risk, use_plot=use_plot, snapshot_path=args.save_snapshot)
 
 
 if __name__ == "__main__":
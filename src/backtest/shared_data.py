@@ -0,0 +1,150 @@
+"""Read-only market data shared with worker processes through shared memory.
+
+Used by the process-pool runners (`backtest.sweep`, `backtest.walkforward`):
+the parent packs the wide price matrix and every feature frame into one
+`multiprocessing.shared_memory` block, and each worker attaches once (pool
+initializer) and builds zero-copy DataFrames on top of it — N workers hold
+one copy of the data instead of N pickled copies.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:       # run_backtest pulls in the whole pipeline
+    from backtest.run_backtest import MarketData
+
+# Thread pools capped to one thread per worker process
+_THREAD_ENV = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+_ALIGN = 64
+
+
+class SharedFrames:
+    """Read-only DataFrames packed into one shared-memory block.
+
+    The owner (`create`) copies each frame's datetime index (int64) and
+    numeric columns (float64) into a single `SharedMemory` segment; other
+    processes `attach` with the picklable `spec` and get DataFrames backed by
+    that memory without copying.  Non-numeric columns are dropped, except a
+    "Date" column, which is rebuilt from the index.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, spec: dict, owner: bool):
+        self._shm = shm
+        self.spec = spec
+        self._owner = owner
+
+    @classmethod
+    def create(cls, frames: dict) -> "SharedFrames":
+        layout, offset = [], 0
+        prepared = []
+        for name, df in frames.items():
+            if not isinstance(df.index, pd.DatetimeIndex) or df.index.tz is not None:
+                raise TypeError(f"Frame {name!r} needs a tz-naive DatetimeIndex")
+            numeric = df.select_dtypes(include="number")
+            n, k = numeric.shape
+            idx_off = offset
+            offset += -(-(n * 8) // _ALIGN) * _ALIGN
+            val_off = offset
+            offset += -(-(n * k * 8) // _ALIGN) * _ALIGN
+            layout.append({
+                "name": name, "n": n, "columns": list(numeric.columns),
+                "index_name": df.index.name, "index_unit": df.index.unit,
+                "index_offset": idx_off, "values_offset": val_off,
+                "has_date": "Date" in df.columns,
+            })
+            prepared.append((df.index, numeric))
+
+        shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for entry, (index, numeric) in zip(layout, prepared):
+            n, k = entry["n"], len(entry["columns"])
+            idx = np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=entry["index_offset"])
+            idx[:] = index.asi8
+            # Column-major so each column is one contiguous run
+            vals = np.ndarray((k, n), dtype=np.float64, buffer=shm.buf, offset=entry["values_offset"])
+            vals[:] = numeric.to_numpy(dtype=np.float64).T
+        return cls(shm, {"shm_name": shm.name, "frames": layout}, owner=True)
+
+    @classmethod
+    def attach(cls, spec: dict) -> "SharedFrames":
+        return cls(shared_memory.SharedMemory(name=spec["shm_name"]), spec, owner=False)
+
+    def frames(self) -> dict:
+        """{name: DataFrame} views on the shared block (read-only)."""
+        buf = self._shm.buf
+        out = {}
+        for entry in self.spec["frames"]:
+            n, cols = entry["n"], entry["columns"]
+            idx = np.ndarray((n,), dtype=np.int64, buffer=buf, offset=entry["index_offset"])
+            vals = np.ndarray((len(cols), n), dtype=np.float64, buffer=buf,
+                              offset=entry["values_offset"])
+            vals.flags.writeable = False
+            index = pd.DatetimeIndex(idx.view(f"datetime64[{entry['index_unit']}]"),
+                                     name=entry["index_name"])
+            df = pd.DataFrame(vals.T, index=index, columns=cols, copy=False)
+            if entry["has_date"]:
+                df.insert(0, "Date", index)
+            out[entry["name"]] = df
+        return out
+
+    def close(self) -> None:
+        self._shm.close()
+
+    def unlink(self) -> None:
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedFrames":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+        self.unlink()
+
+
+def share_market_data(data: MarketData) -> SharedFrames:
+    """Copy prices + features into one shared block (owner side)."""
+    frames = {"wide": data.wide}
+    frames.update({f"feature/{t}": df for t, df in data.feature_dict.items()})
+    frames.update({f"macro/{t}": df for t, df in data.macro_dict.items()})
+    return SharedFrames.create(frames)
+
+
+def attach_market_data(spec: dict) -> tuple[SharedFrames, MarketData]:
+    """Worker side of `share_market_data`.  Keep the returned `SharedFrames`
+    referenced for as long as the `MarketData` views are in use."""
+    from backtest.run_backtest import MarketData
+    shared = SharedFrames.attach(spec)
+    features, macro = {}, {}
+    frames = shared.frames()
+    for name, df in frames.items():
+        kind, _, ticker = name.partition("/")
+        if kind == "feature":
+            features[ticker] = df
+        elif kind == "macro":
+            macro[ticker] = df
+    return shared, MarketData(wide=frames["wide"], feature_dict=features, macro_dict=macro)
+
+
+@contextlib.contextmanager
+def single_threaded_children():
+    """Default BLAS/OpenMP pools of child processes started inside the block
+    to one thread (one worker process per core, no oversubscription)."""
+    saved = {k: os.environ.get(k) for k in _THREAD_ENV}
+    for k in _THREAD_ENV:
+        os.environ.setdefault(k, "1")
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
@@ -1,9 +1,14 @@
 """Strategy wrapper: adapts PairsTradingStrategy into the event-driven engine.
 
 Responsibilities:
-    - Maintains a rolling price history window (per-ticker deques)
-    - On each MarketEvent: recomputes spread z-scores for all registered pairs
-    - Manages state machine (flat / long_spread / short_spread) per pair
+    - Maintains a rolling bars × tickers price window (`PriceWindow`), shared
+      with pair re-selection
+    - On each MarketEvent: updates the spread z-scores of all registered pairs
+      in one vectorized step (`PairMomentsBank`, legs gathered by integer
+      ticker index)
+    - Manages state machine (flat / long_spread / short_spread) per pair in a
+      `SignalBook`; the price/regime/spread work in `prepare_bar` is shared,
+      so several books (parameter sets) can be driven from one computation
     - Optionally gates entries on regime label (HMM / Vol / KMeans detector)
     - Emits SignalEvents consumed by the BacktestEngine's position sizer
     - Periodically re-selects pairs via PairReSelector (if configured)
@@ -18,13 +23,16 @@ from __future__ import annotations
 
 import logging
 from collections import deque
-from typing import Optional, List, Dict
+from typing import NamedTuple, Optional, List, Dict
 import numpy as np
 import pandas as pd
 
 from .events import MarketEvent, SignalEvent
 from .portfolio import Portfolio
-from strategy.kalman_hedge import KalmanHedge
+from .price_window import PriceWindow
+from .rolling_stats import PairMomentsBank
+from features.featurize import latest_standard_features
+from strategy.kalman_hedge import KalmanHedgeBank
 from strategy.meta_signal import MetaSignalModel, MetaSignalConfig
 from utils.pair_id import make_pair_id
 
@@ -44,6 +52,12 @@ def _get_featurize():
         _featurize_fn = compute_standard_features
     return _featurize_fn
 
+# Regime features the strategy can compute per bar from the regime ticker's
+# price buffer (`latest_standard_features` with windows=[20]); detectors
+# fitted on a subset of these are run as streaming forward filters.
+_STREAM_WINDOW = 20
+_STREAM_FEATURES = frozenset({"ret", "logret", f"mom_{_STREAM_WINDOW}", f"rv_{_STREAM_WINDOW}"})
+
 # Default: per-regime target-notional multipliers
 DEFAULT_REGIME_SIZE: dict[int, float] = {
     0: 1.0,    # Bull / Low-Vol  — full size
@@ -85,9 +99,110 @@ class PairConfig:
         self.exit_z       = exit_z
         self.stop_z       = stop_z
         self.pair_id      = make_pair_id(ticker1, ticker2)
-        self.position: int = 0   # -1 / 0 / +1
-        # Kalman filter for dynamic hedge ratio estimation
-        self.kalman_hedge = KalmanHedge(initial_hedge=hedge_ratio, process_variance=0.0001)
+
+
+class PreparedBar(NamedTuple):
+    """Shared per-bar output of `PairsBacktestStrategy.prepare_bar`."""
+    removed: List[PairConfig]     # pairs dropped by re-selection
+    pairs: List[PairConfig]       # active pairs, in pair order
+    zscores: np.ndarray           # spread z-score per pair (NaN: not scorable yet)
+    regime: int
+    version: int                  # bumped whenever `pairs` changes
+
+
+class SignalBook:
+    """Per-parameter-set pair state machine (flat / long_spread / short_spread).
+
+    Holds the open direction of every pair and the regime-dependent
+    thresholds / position scale (via its `MetaSignalModel`); everything else
+    — price buffers, regime, re-selection, Kalman hedges, z-scores — comes in
+    pre-computed through a `PreparedBar`.  Directions live in an int8 array
+    aligned with `PreparedBar.pairs`, so a bar's transitions are a handful
+    of array comparisons and SignalEvents are only built for pairs whose
+    state changes.
+    """
+
+    _DIRECTIONS = {1: "long_spread", -1: "short_spread", 0: "flat"}
+
+    def __init__(self, meta_signal: MetaSignalModel, strategy_id: str = "pairs"):
+        self.meta_signal = meta_signal
+        self.strategy_id = strategy_id
+        self._ids: List[str] = []                  # pair_id per row of _pos
+        self._pos = np.zeros(0, dtype=np.int8)     # -1 / 0 / +1 per pair
+        self._version: Optional[int] = None        # PreparedBar.version _pos follows
+
+    @property
+    def positions(self) -> Dict[str, int]:
+        """pair_id → -1 / 0 / +1 for every tracked pair."""
+        return dict(zip(self._ids, self._pos.tolist()))
+
+    def position(self, pair_id: str) -> int:
+        return self.positions.get(pair_id, 0)
+
+    def on_bar(self, date: pd.Timestamp, bar: PreparedBar) -> List[SignalEvent]:
+        signals: List[SignalEvent] = []
+
+        if bar.version != self._version:
+            held = self.positions
+            # Close pairs dropped by re-selection
+            for pc in bar.removed:
+                if held.pop(pc.pair_id, 0) != 0:
+                    signals.append(SignalEvent(
+                        date=date,
+                        ticker1=pc.ticker1,
+                        ticker2=pc.ticker2,
+                        direction="flat",
+                        strength=1.0,
+                        spread_zscore=0.0,
+                        hedge_ratio=pc.hedge_ratio,
+                        strategy_id=self.strategy_id,
+                    ))
+            self._ids = [pc.pair_id for pc in bar.pairs]
+            self._pos = np.array([held.get(pid, 0) for pid in self._ids], dtype=np.int8)
+            self._version = bar.version
+
+        z = bar.zscores
+        if len(z) == 0:
+            return signals
+
+        # Regime-adaptive thresholds (spec §3.4) via meta-signal model
+        meta   = self.meta_signal
+        regime = bar.regime
+        entry_z_eff   = meta.get_entry_threshold(regime)
+        exit_z_eff    = meta.get_exit_threshold(regime)
+        stop_loss_eff = meta.get_stop_loss_threshold(regime)
+        regime_scale  = meta.get_position_scale(regime)
+
+        # NaN z-scores compare False everywhere, so unscorable pairs never move
+        pos  = self._pos
+        absz = np.abs(z)
+        new  = pos.copy()
+        # Exit / stop
+        new[(pos != 0) & ((absz < exit_z_eff) | (absz > stop_loss_eff))] = 0
+        # Entry — unless the regime blocks new entries
+        if regime_scale > 0.0:
+            flat = pos == 0
+            new[flat & (z < -entry_z_eff)] = 1
+            new[flat & (z > entry_z_eff)] = -1
+
+        changed = np.flatnonzero(new != pos)
+        if len(changed) == 0:
+            return signals
+        self._pos = new
+
+        for k, d in zip(changed.tolist(), new[changed].tolist()):
+            pc = bar.pairs[k]
+            signals.append(SignalEvent(
+                date        = date,
+                ticker1     = pc.ticker1,
+                ticker2     = pc.ticker2,
+                direction   = self._DIRECTIONS[d],
+                strength    = regime_scale if d != 0 else 1.0,
+                spread_zscore = float(z[k]),
+                hedge_ratio = pc.hedge_ratio,
+                strategy_id = self.strategy_id,
+            ))
+        return signals
 
 
 class PairsBacktestStrategy:
@@ -113,6 +228,20 @@ class PairsBacktestStrategy:
         If supplied, periodically re-selects pairs on trailing data.
     all_tickers : list[str], optional
         Full universe of tickers for re-selection price tracking.
+    regime_timeline : pd.Series, optional
+        Precomputed date-indexed regime labels (e.g. the detector's
+        walk-forward labels).  Bars inside its date range take the latest
+        label at or before the bar date and skip online regime inference;
+        bars outside it fall back to `regime_detector`.
+    regime_probs : pd.DataFrame, optional
+        State probabilities (date × regime label) aligned with
+        `regime_timeline`, exposed as `current_regime_probs`.
+    regime_stream : bool
+        Infer the regime every bar with the detector's streaming forward
+        filter (when it has one over features computed incrementally here)
+        instead of re-predicting every few bars.  Restarts the detector's
+        filter, so it should not be shared with another running strategy.
+        Ignored when `regime_timeline` is given.
     """
 
     def __init__(
@@ -132,6 +261,9 @@ class PairsBacktestStrategy:
         strategy_id: str = "pairs",
         pair_reselector=None,
         all_tickers: Optional[List[str]] = None,
+        regime_timeline: Optional[pd.Series] = None,
+        regime_probs: Optional[pd.DataFrame] = None,
+        regime_stream: bool = False,
     ):
         self.zscore_window  = zscore_window
         self.warmup_bars    = warmup_bars
@@ -152,19 +284,32 @@ class PairsBacktestStrategy:
                 stop_z      = p.get("stop_z",  stop_z),
             ))
 
-        # Collect all unique tickers (pair tickers + full universe for reselection)
-        all_tickers_set: set[str] = set(all_tickers or [])
+        # Collect all unique tickers (pair tickers + full universe for
+        # reselection) in first-seen order, so buffer/column order — and with
+        # it re-selection — does not depend on string hashing
+        all_tickers_set: Dict[str, None] = dict.fromkeys(all_tickers or [])
         for pc in self._pairs:
-            all_tickers_set.update([pc.ticker1, pc.ticker2])
-        self._tickers = list(all_tickers_set)
-
-        # Price history buffers (enough for z-score + regime window + reselection)
-        buf_size = max(zscore_window * 3, 504, 252)
-        self._price_buf: Dict[str, deque] = {
-            t: deque(maxlen=buf_size) for t in self._tickers
-        }
-        # Also track dates for building a DataFrame for re-selection
-        self._date_buf: deque = deque(maxlen=buf_size)
+            all_tickers_set.update(dict.fromkeys([pc.ticker1, pc.ticker2]))
+
+        # Price history (enough for z-score + regime window + reselection):
+        # one bars × tickers ring, shared with pair re-selection
+        self._buf_size = max(zscore_window * 3, 504, 252)
+        self._window = PriceWindow(self._buf_size, capacity=max(len(all_tickers_set), 16))
+        self._tickers: List[str] = self._window.tickers
+        # Integer ticker index (window column): per-ticker counters / latest
+        # prices as arrays, so pair legs can be gathered with fancy indexing
+        self._tix: Dict[str, int] = self._window.columns
+        self._appended = np.zeros(0, dtype=np.int64)   # prices appended per ticker
+        self._last_px = np.zeros(0)                    # latest finite price per ticker
+        for t in all_tickers_set:
+            self._ensure_ticker(t)
+
+        # Per-pair rolling spread moments and Kalman hedge filters, rows
+        # aligned with self._pairs
+        self._moments = PairMomentsBank(max(zscore_window, 1))
+        self._kalman  = KalmanHedgeBank(process_variance=0.0001)
+        self._pairs_version = 0
+        self._sync_pairs()
 
         # Regime
         self._regime_detector  = regime_detector
@@ -174,6 +319,8 @@ class PairsBacktestStrategy:
         self._regime_exit_z_map  = regime_exit_z_map  or DEFAULT_REGIME_EXIT_Z
         self._regime_buf: deque = deque(maxlen=max(zscore_window * 3, 252))
         self._current_regime: int = 1   # start neutral
+        self._current_regime_probs: Optional[np.ndarray] = None
+        self._set_regime_timeline(regime_timeline, regime_probs)
 
         # Regime history for analytics (spec §4.4)
         self._regime_history: list = []  # list of (date, regime_label)
@@ -190,12 +337,26 @@ class PairsBacktestStrategy:
             regime_position_scale=regime_position_scale_map or {0: 1.0, 1: 0.75, 2: 0.5, 3: 0.1},
         )
         self._meta_signal = MetaSignalModel(config=meta_cfg)
+        self._book = SignalBook(self._meta_signal, strategy_id=strategy_id)
 
         self._bar_count = 0
         # Regime update throttle — regime labels change slowly, no need to
         # re-predict on every single bar.
         self._regime_update_every: int = 5
         self._regime_last_update: int = 0
+        # Streaming regime inference (every bar, O(K²)), on request, when the
+        # detector has a forward filter over features we can compute
+        # incrementally
+        self._regime_stream: bool = False
+        self._regime_seen: int = 0      # regime-ticker prices fed to the stream
+        if (regime_stream and regime_timeline is None and regime_detector is not None
+                and hasattr(regime_detector, "start_stream")):
+            try:
+                if set(regime_detector.stream_features) <= _STREAM_FEATURES:
+                    regime_detector.start_stream()
+                    self._regime_stream = True
+            except RuntimeError as e:
+                logger.debug("Regime streaming unavailable: %s", e)
 
     # -----------------------------------------------------------------------
     # Called once per bar by the BacktestEngine
@@ -206,125 +367,155 @@ class PairsBacktestStrategy:
         event: MarketEvent,
         portfolio: Portfolio,
     ) -> List[SignalEvent]:
+        bar = self.prepare_bar(event)
+        if bar is None:
+            return []
+        return self._book.on_bar(event.date, bar)
+
+    def new_book(self, meta_signal: Optional[MetaSignalModel] = None) -> SignalBook:
+        """A fresh, flat `SignalBook` (default: this strategy's thresholds)."""
+        return SignalBook(meta_signal or self._meta_signal,
+                          strategy_id=self.strategy_id)
+
+    def prepare_bar(self, event: MarketEvent) -> Optional[PreparedBar]:
+        """Shared per-bar work: buffers, regime, re-selection, hedges, z-scores.
+
+        Returns None during warm-up.  Must be called exactly once per bar;
+        the result can then be fed to any number of `SignalBook`s.
+        """
+        # 1. Append the bar to the price window in one row write.  Tickers
+        # absent from this bar's prices (or with a missing print) are NaN
+        # for this bar and their counters don't advance.
+        prices = event.prices
+        tix  = self._tix
+        cols = [tix.get(t) for t in prices]
+        if None in cols:
+            cols = [self._ensure_ticker(t) for t in prices]
+        vals = np.array([np.nan if p is None else p for p in prices.values()], dtype=float)
+        ok   = np.isfinite(vals)
+        idx, vals = np.array(cols, dtype=np.intp)[ok], vals[ok]
+        self._window.append(event.date, idx, vals)
+        self._appended[idx] += 1
+        self._last_px[idx] = vals
 
-        # 1. Update price buffers — single pass over incoming prices.
-        # Tickers already in self._tickers but absent from this bar's prices
-        # simply don't get a new value appended, which is the same behaviour
-        # as the previous two-loop approach.
-        _buf_size = max(self.zscore_window * 3, 504, 252)
-        for t, p in event.prices.items():
-            if t not in self._price_buf:
-                self._price_buf[t] = deque(maxlen=_buf_size)
-                if t not in self._tickers:
-                    self._tickers.append(t)
-            if p is not None and np.isfinite(p):
-                self._price_buf[t].append(p)
-
-        self._date_buf.append(event.date)
         self._bar_count += 1
         if self._bar_count < self.warmup_bars:
-            return []
+            return None
 
-        # 2. Update regime if detector is attached
-        if self._regime_detector is not None:
+        # 2. Regime: precomputed timeline, else the attached detector
+        if not self._read_regime_timeline(event) and self._regime_detector is not None:
             self._update_regime(event)
 
         # Record regime label for analytics (every bar after warmup)
         self._regime_history.append((event.date, self._current_regime))
 
         # 3. Periodic pair re-selection
-        signals = []
+        removed: List[PairConfig] = []
         if self._pair_reselector is not None:
-            resel_signals = self._try_reselect(event, portfolio)
-            signals.extend(resel_signals)
-
-        # 4. Generate signals per pair
-        for pc in self._pairs:
-            sig = self._evaluate_pair(event, pc)
-            if sig is not None:
-                signals.append(sig)
-
-        return signals
+            removed = self._try_reselect(event)
+
+        # 4. Spread z-scores, all pairs at once
+        return PreparedBar(
+            removed=removed,
+            pairs=self._pairs,
+            zscores=self._pair_zscores(),
+            regime=self._current_regime,
+            version=self._pairs_version,
+        )
 
     # -----------------------------------------------------------------------
     # Pair evaluation
     # -----------------------------------------------------------------------
 
-    def _evaluate_pair(self, event: MarketEvent, pc: PairConfig) -> Optional[SignalEvent]:
-        buf1 = list(self._price_buf.get(pc.ticker1, []))
-        buf2 = list(self._price_buf.get(pc.ticker2, []))
-        n    = min(len(buf1), len(buf2))
-        if n < self.zscore_window // 2:
-            return None
+    def _ensure_ticker(self, t: str) -> int:
+        """Window column of `t`, registering the ticker on first sight."""
+        j = self._tix.get(t)
+        if j is None:
+            j = self._window.add_ticker(t)
+            self._appended = np.append(self._appended, 0)
+            self._last_px = np.append(self._last_px, np.nan)
+        return j
 
-        s1 = np.array(buf1[-n:], dtype=float)
-        s2 = np.array(buf2[-n:], dtype=float)
-        
-        # Update Kalman hedge ratio with latest prices
-        p1_current = s1[-1]
-        p2_current = s2[-1]
-        pc.hedge_ratio, _ = pc.kalman_hedge.update(p1_current, p2_current)
-        
-        spread = s1 - pc.hedge_ratio * s2
-
-        win = min(self.zscore_window, n)
-        mu  = spread[-win:].mean()
-        sig = spread[-win:].std()
-        if sig < 1e-10:
-            return None
+    def _held(self, j: int) -> int:
+        """Prices of ticker column `j` still inside the window."""
+        return min(int(self._appended[j]), self._buf_size)
 
-        z = (spread[-1] - mu) / sig
+    def _sync_pairs(self, keep: Optional[np.ndarray] = None) -> None:
+        """Re-align the per-pair arrays with `self._pairs` after it changed.
 
-        # State machine
-        new_dir = None
-        cur     = pc.position
-
-        # Regime-adaptive thresholds (spec §3.4) via meta-signal model
-        entry_z_eff = self._meta_signal.get_entry_threshold(self._current_regime)
-        exit_z_eff  = self._meta_signal.get_exit_threshold(self._current_regime)
-
-        # Exit / stop
-        if cur != 0:
-            stop_loss_eff = self._meta_signal.get_stop_loss_threshold(self._current_regime)
-            if abs(z) < exit_z_eff or abs(z) > stop_loss_eff:
-                new_dir = "flat"
-
-        if new_dir is None:
-            # Entry — use regime-adaptive entry threshold
-            if cur == 0:
-                regime_scale = self._meta_signal.get_position_scale(self._current_regime)
-                if regime_scale <= 0.0:
-                    return None      # regime blocks new entries
-
-                if z < -entry_z_eff:
-                    new_dir = "long_spread"
-                elif z > entry_z_eff:
-                    new_dir = "short_spread"
-
-        if new_dir is None and cur == pc.position:
-            # Re-emit current direction so position sizer can rebalance if equity shifted
-            return None
-
-        if new_dir is not None:
-            if new_dir == "flat":
-                pc.position = 0
-            elif new_dir == "long_spread":
-                pc.position = 1
-            elif new_dir == "short_spread":
-                pc.position = -1
-
-            regime_scale = self._meta_signal.get_position_scale(self._current_regime) if new_dir != "flat" else 1.0
-            return SignalEvent(
-                date        = event.date,
-                ticker1     = pc.ticker1,
-                ticker2     = pc.ticker2,
-                direction   = new_dir,
-                strength    = regime_scale,
-                spread_zscore = z,
-                hedge_ratio = pc.hedge_ratio,
-                strategy_id = self.strategy_id,
-            )
-        return None
+        `keep` masks the surviving rows of the previous pair list; pairs
+        added since are at the end of `self._pairs`.
+        """
+        if keep is not None:
+            self._moments.keep(keep)
+            self._kalman.keep(keep)
+        self._moments.extend(len(self._pairs) - len(self._moments))
+        self._kalman.extend([pc.hedge_ratio for pc in self._pairs[len(self._kalman):]])
+        for pc in self._pairs:
+            self._ensure_ticker(pc.ticker1)
+            self._ensure_ticker(pc.ticker2)
+        self._leg1 = np.array([self._tix[pc.ticker1] for pc in self._pairs], dtype=np.intp)
+        self._leg2 = np.array([self._tix[pc.ticker2] for pc in self._pairs], dtype=np.intp)
+        self._pairs_version += 1
+
+    def _pair_zscores(self) -> np.ndarray:
+        """Update the Kalman hedges and return the latest spread z-score of
+        every pair (NaN while history is too short or the spread is flat).
+
+        Each z-score is taken over the last min(zscore_window, n) prices of
+        each leg (n = the shorter leg buffer) under the current hedge ratio.
+        A pair's window slides in O(1) when both legs got exactly one new
+        price since the last bar; a missing print on either leg (or the
+        window still filling after a gap) reloads that pair's row from the
+        buffers, on the legs' common tail (a leg that stopped printing for
+        longer than the buffer holds fewer prices than the other).
+        """
+        pairs = self._pairs
+        z = np.full(len(pairs), np.nan)
+        if not pairs:
+            return z
+
+        cnt1 = self._appended[self._leg1]
+        cnt2 = self._appended[self._leg2]
+        n    = np.minimum(np.minimum(cnt1, cnt2), self._buf_size)
+        rows = np.flatnonzero(n >= max(self.zscore_window // 2, 1))
+        if len(rows) == 0:
+            return z
+        p1 = self._last_px[self._leg1[rows]]
+        p2 = self._last_px[self._leg2[rows]]
+
+        # Kalman hedge ratios with the latest prices, mirrored onto the
+        # PairConfigs for signal sizing
+        hedge = np.zeros(len(pairs))
+        hedge[rows], _ = self._kalman.update(rows, p1, p2)
+        for k, h in zip(rows.tolist(), hedge[rows].tolist()):
+            pairs[k].hedge_ratio = h
+
+        bank = self._moments
+        win  = np.minimum(n[rows], self.zscore_window)
+        c1, c2 = cnt1[rows], cnt2[rows]
+        seen = bank.seen[rows]
+        cnt  = bank.count[rows]
+        slide = ((c1 == seen[:, 0] + 1) & (c2 == seen[:, 1] + 1)
+                 & (win == np.minimum(cnt + 1, bank.window)))
+        stale = ~slide & ((c1 != seen[:, 0]) | (c2 != seen[:, 1]) | (cnt != win))
+        bank.push(rows[slide], p1[slide], p2[slide])
+        window = self._window
+        min_n = max(self.zscore_window // 2, 1)
+        for k, w in zip(rows[stale].tolist(), win[stale].tolist()):
+            x1 = window.tail(self._leg1[k], w)
+            x2 = window.tail(self._leg2[k], w)
+            # A leg with a long gap holds fewer than w prices in the window:
+            # use the common tail, or leave the row empty (NaN z) if too short
+            m = min(len(x1), len(x2))
+            if m < min_n:
+                m = 0
+            bank.reset(k, x1[len(x1) - m:], x2[len(x2) - m:])
+        bank.seen[rows, 0] = c1
+        bank.seen[rows, 1] = c2
+
+        z[rows] = bank.spread_zscore(hedge)[rows]
+        return z
 
     # -----------------------------------------------------------------------
     # Regime
@@ -333,23 +524,27 @@ class PairsBacktestStrategy:
     def _update_regime(self, event: MarketEvent) -> None:
         """Predict regime on the latest price window.
 
-        Throttled to every ``_regime_update_every`` bars because regime labels
+        Streaming detectors are advanced by one observation per new
+        regime-ticker price (see `_stream_regime`).  Otherwise this is
+        throttled to every ``_regime_update_every`` bars because regime labels
         change slowly.  Using only the most-recent 90 prices (enough for
         rv_20/mom_20) and windows=[20] keeps DataFrame construction cheap.
         """
+        if self._regime_stream:
+            self._stream_regime(event)
+            return
         if self._bar_count - self._regime_last_update < self._regime_update_every:
             return
         self._regime_last_update = self._bar_count
 
-        rt  = self._regime_ticker
-        buf = self._price_buf.get(rt)
-        if buf is None or len(buf) < self.zscore_window:
+        j = self._tix.get(self._regime_ticker)
+        if j is None or self._held(j) < self.zscore_window:
             return
 
         try:
             compute_standard_features = _get_featurize()
             # 90 prices is enough for rv_20 + mom_20 + decent HMM context
-            prices = list(buf)[-90:]
+            prices = self._window.tail(j, 90)
             dates  = pd.date_range(end=event.date, periods=len(prices), freq="B")
             mini_df = pd.DataFrame({"Date": dates, "close": prices})
             feat = compute_standard_features(mini_df, windows=[20])
@@ -364,14 +559,84 @@ class PairsBacktestStrategy:
         except Exception as e:
             logger.debug("Regime update skipped: %s", e)
 
+    def _stream_regime(self, event: MarketEvent) -> None:
+        """Feed the regime ticker's latest features to the detector's forward
+        filter.  Walk-forward labels, where the detector has one for this
+        date, take priority (as in `HMMRegimeDetector.predict`)."""
+        j = self._tix.get(self._regime_ticker)
+        if j is None or self._held(j) < self.zscore_window:
+            return
+        n = int(self._appended[j])
+        if n == self._regime_seen:          # no new print since the last bar
+            return
+        self._regime_seen = n
+
+        obs = latest_standard_features(self._window.tail(j, _STREAM_WINDOW + 1),
+                                       windows=[_STREAM_WINDOW])
+        det = self._regime_detector
+        if not all(np.isfinite(obs[c]) for c in det.stream_features):
+            return
+        label, self._current_regime_probs = det.update(obs)
+        wf = det.walkforward_label(event.date) if hasattr(det, "walkforward_label") else None
+        self._current_regime = wf if wf is not None else label
+
+    def _set_regime_timeline(self, timeline: Optional[pd.Series],
+                             probs: Optional[pd.DataFrame] = None) -> None:
+        """Store a date-indexed label series as flat arrays for per-bar reads."""
+        self._timeline_ns: List[int] = []
+        self._timeline_labels: List[int] = []
+        self._timeline_probs: Optional[np.ndarray] = None
+        self._timeline_pos = -1         # last timeline row at or before the bar date
+        if timeline is None:
+            return
+        timeline = timeline.dropna()
+        timeline = timeline[~timeline.index.duplicated(keep="last")].sort_index()
+        index = pd.DatetimeIndex(timeline.index)
+        self._timeline_ns = index.as_unit("ns").asi8.tolist()   # Timestamp.value units
+        self._timeline_labels = timeline.astype(int).tolist()
+        if probs is not None:
+            probs = probs[~probs.index.duplicated(keep="last")]
+            self._timeline_probs = probs.reindex(index).to_numpy(dtype=float)
+
+    def _read_regime_timeline(self, event: MarketEvent) -> bool:
+        """Set the regime from the precomputed timeline.
+
+        Bars arrive in date order, so the row pointer only moves forward (one
+        step per bar when the timeline is aligned with the feed).  Returns
+        False when the bar is outside the timeline's date range.
+        """
+        dates = self._timeline_ns
+        if not dates:
+            return False
+        now = event.date.value
+        if now < dates[0] or now > dates[-1]:
+            return False
+        pos = self._timeline_pos
+        if pos >= 0 and dates[pos] > now:       # out-of-order bar: re-seek
+            pos = -1
+        while pos + 1 < len(dates) and dates[pos + 1] <= now:
+            pos += 1
+        self._timeline_pos = pos
+        self._current_regime = self._timeline_labels[pos]
+        if self._timeline_probs is not None:
+            self._current_regime_probs = self._timeline_probs[pos]
+        return True
+
+    @property
+    def current_regime_probs(self) -> Optional[np.ndarray]:
+        """P(regime label) for the current bar, when the timeline or the
+        streaming detector provides it."""
+        return self._current_regime_probs
+
     # -----------------------------------------------------------------------
     # Periodic Pair Re-Selection
     # -----------------------------------------------------------------------
 
-    def _try_reselect(self, event: MarketEvent, portfolio: Portfolio) -> List[SignalEvent]:
+    def _try_reselect(self, event: MarketEvent) -> List[PairConfig]:
         """Check if it's time to re-select pairs, and do so.
 
-        Returns flat signals for any removed pairs.
+        Returns the removed pairs (in pair order) so each `SignalBook` can
+        flatten any position it holds in them.
         """
         # Prefer adaptive re-selection when regime history is available
         recent_regimes = list(r for _, r in self._regime_history[-40:]) if self._regime_history else None
@@ -404,40 +669,23 @@ class PairsBacktestStrategy:
         if new_pairs_df.empty and not removed:
             return []
 
-        signals: List[SignalEvent] = []
-
-        # O(1) lookup dict — avoids nested O(n*m) loop over pairs
-        pairs_by_id: Dict[str, PairConfig] = {pc.pair_id: pc for pc in self._pairs}
-
-        # 1. Close removed pairs
-        for pid in removed:
-            pc = pairs_by_id.get(pid)
-            if pc is not None and pc.position != 0:
-                signals.append(SignalEvent(
-                    date=event.date,
-                    ticker1=pc.ticker1,
-                    ticker2=pc.ticker2,
-                    direction="flat",
-                    strength=1.0,
-                    spread_zscore=0.0,
-                    hedge_ratio=pc.hedge_ratio,
-                    strategy_id=self.strategy_id,
-                ))
-                pc.position = 0
+        # 1. Removed pairs, in pair order (flattened by the signal books)
+        removed_pcs = [pc for pc in self._pairs if pc.pair_id in removed]
 
         # 2. Remove old pair configs and rebuild lookup
+        keep = np.array([pc.pair_id not in removed for pc in self._pairs], dtype=bool)
         self._pairs = [pc for pc in self._pairs if pc.pair_id not in removed]
         pairs_by_id = {pc.pair_id: pc for pc in self._pairs}
 
         # 3. Add new pairs / update hedge ratios — itertuples avoids row-copy overhead
-        _buf_size = max(self.zscore_window * 3, 504, 252)
+        refit: Dict[str, float] = {}
         for row in new_pairs_df.itertuples(index=False):
             pid = f"{row.ticker1}/{row.ticker2}"
             if pid in pairs_by_id:
-                # Update hedge ratio for existing pair and reset Kalman
+                # Update hedge ratio for existing pair (Kalman reset below)
                 pairs_by_id[pid].hedge_ratio = row.hedge_ratio
                 pairs_by_id[pid].hedge_ratio_static = row.hedge_ratio
-                pairs_by_id[pid].kalman_hedge.reset(initial_hedge=row.hedge_ratio)
+                refit[pid] = row.hedge_ratio
             elif pid in added:
                 # Add new pair
                 new_pc = PairConfig(
@@ -450,15 +698,14 @@ class PairsBacktestStrategy:
                 )
                 self._pairs.append(new_pc)
                 pairs_by_id[pid] = new_pc
-                # Ensure price buffers exist for new tickers
-                for t in [row.ticker1, row.ticker2]:
-                    if t not in self._price_buf:
-                        self._price_buf[t] = deque(maxlen=_buf_size)
-                    if t not in self._tickers:
-                        self._tickers.append(t)
 
+        # Price buffers for new tickers, per-pair arrays re-aligned
+        self._sync_pairs(keep)
+        for k, pc in enumerate(self._pairs):
+            if pc.pair_id in refit:
+                self._kalman.reset(k, initial_hedge=refit[pc.pair_id])
         logger.info("Post-reselection: %d active pairs", len(self._pairs))
-        return signals
+        return removed_pcs
 
     def get_regime_history(self) -> pd.Series:
         """Return regime label per trading bar as a Series (for analytics/plotting)."""
@@ -468,25 +715,8 @@ class PairsBacktestStrategy:
         return pd.Series(list(labels), index=list(dates), name="regime", dtype=int)
 
     def _build_price_history_df(self) -> pd.DataFrame:
-        """Build a wide price DataFrame from the internal price buffers."""
-        if not self._date_buf:
-            return pd.DataFrame()
-
-        dates = list(self._date_buf)
-        n = len(dates)
-        data = {}
-        for t, buf in self._price_buf.items():
-            prices = list(buf)
-            if len(prices) == n:
-                data[t] = prices
-            elif len(prices) < n:
-                # Pad front with NaN
-                data[t] = [float("nan")] * (n - len(prices)) + prices
-            else:
-                # Trim to match dates
-                data[t] = prices[-n:]
-
-        if not data:
+        """Wide Date × ticker price DataFrame over the price window (a view:
+        valid until the next bar is appended)."""
+        if not len(self._window) or not self._tickers:
             return pd.DataFrame()
-
-        return pd.DataFrame(data, index=dates)
+        return self._window.frame()
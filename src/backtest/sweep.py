@@ -0,0 +1,230 @@
+"""Process-pool parameter sweep over `PlatformConfig` fields.
+
+Usage:
+    from backtest.sweep import run_sweep
+    result = run_sweep(cfg, {"pairs.entry_z": [1.5, 2.0, 2.5],
+                             "backtest.target_notional_pct": [0.05, 0.10]})
+    result.table.head()          # ranked by Sharpe
+
+Pipeline:
+    1. Prices and features are fetched and featurized once in the parent
+       (`load_market_data`).  `data.*`, `regime.regime_ticker` and
+       `regime.macro_tickers` are fixed by that step and cannot be swept.
+    2. The wide price matrix and every feature frame are packed into one
+       shared-memory block (`backtest.shared_data`).  Workers attach to it
+       once (pool initializer) and build zero-copy, read-only DataFrames on
+       top of it, so N workers hold one copy of the data instead of N
+       pickled copies.
+    3. Each grid point runs the regular `run_backtest` pipeline (regime fit,
+       pair selection, out-of-sample backtest) in a worker, with
+       `backtest.seed` drawn from `SeedSequence(seed).spawn(n_jobs)` —
+       reproducible for a given root seed and independent across runs.
+    4. Results come back as a ranked table (one row per run) plus per-run
+       stats.
+
+Jobs share nothing but read-only data, so throughput scales with the number
+of workers until memory bandwidth is the limit.  Workers run with
+single-threaded BLAS (one process per core, no oversubscription).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import itertools
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from config import PlatformConfig
+from backtest.run_backtest import MarketData, load_market_data, run_backtest
+from backtest.shared_data import attach_market_data, share_market_data, single_threaded_children
+
+logger = logging.getLogger(__name__)
+
+# Fields fixed by the shared market data
+_DATA_FIELDS = ("data.", "regime.regime_ticker", "regime.macro_tickers")
+
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Grid / config helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+def expand_grid(grid: dict) -> list[dict]:
+    """Cartesian product of {"section.field": [values…]} → list of overrides."""
+    keys = list(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+
+def apply_overrides(cfg: PlatformConfig, overrides: dict) -> PlatformConfig:
+    """Deep copy of `cfg` with dotted-path overrides applied."""
+    out = copy.deepcopy(cfg)
+    for key, value in overrides.items():
+        section_name, _, field_name = key.partition(".")
+        section = getattr(out, section_name, None)
+        if section is None or not field_name or not hasattr(section, field_name):
+            raise KeyError(f"Unknown config field {key!r}")
+        setattr(section, field_name, value)
+    return out
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Jobs
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class SweepJob:
+    job_id: int
+    overrides: dict
+    seed: int
+
+
+@dataclass
+class SweepResult:
+    """Ranked table (best first) and per-run details keyed by job_id."""
+    table: pd.DataFrame
+    runs: dict = field(default_factory=dict)
+    metric: str = "sharpe_ratio"
+
+    def best(self) -> dict:
+        return self.runs[int(self.table.iloc[0]["job_id"])]
+
+
+def run_job(job: SweepJob, base_cfg: PlatformConfig, market_data: MarketData,
+            use_risk: bool = True) -> dict:
+    """Run one grid point; never raises (errors are recorded in the result)."""
+    row = {"job_id": job.job_id, "overrides": dict(job.overrides), "seed": job.seed,
+           "stats": {}, "error": None}
+    try:
+        cfg = apply_overrides(base_cfg, job.overrides)
+        cfg.backtest.seed = job.seed
+        cfg.backtest.verbose = False
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = run_backtest(cfg, use_risk=use_risk, use_plot=False,
+                                   market_data=market_data, log_mlflow=False)
+        if not results:
+            row["error"] = "no pairs selected"
+            return row
+        row["stats"] = results.get("stats", {})
+        for key in ("bars", "fills_count", "orders_rejected", "pair_reselection_count"):
+            row[key] = results.get(key)
+        row["n_pairs"] = len(results.get("selected_pairs", []))
+    except Exception as e:
+        logger.warning("Sweep job %d failed: %s", job.job_id, e)
+        row["error"] = f"{type(e).__name__}: {e}"
+    return row
+
+
+# Per-worker state, set once by the pool initializer
+_WORKER: dict = {}
+
+
+def _init_worker(spec: dict, base_cfg: PlatformConfig, use_risk: bool) -> None:
+    _WORKER["shared"], _WORKER["data"] = attach_market_data(spec)
+    _WORKER["cfg"] = base_cfg
+    _WORKER["use_risk"] = use_risk
+
+
+def _worker_run(job: SweepJob) -> dict:
+    return run_job(job, _WORKER["cfg"], _WORKER["data"], _WORKER["use_risk"])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Sweep
+# ─────────────────────────────────────────────────────────────────────────────
+
+def make_jobs(grid: dict, seed: int = 0) -> list[SweepJob]:
+    """One job per grid point, seeds spawned from a single root seed."""
+    points = expand_grid(grid)
+    children = np.random.SeedSequence(seed).spawn(len(points))
+    return [SweepJob(job_id=i, overrides=ov, seed=int(ss.generate_state(1)[0]))
+            for i, (ov, ss) in enumerate(zip(points, children))]
+
+
+def run_sweep(
+    base_cfg: PlatformConfig,
+    grid: dict,
+    n_workers: Optional[int] = None,
+    seed: int = 0,
+    use_risk: bool = True,
+    metric: str = "sharpe_ratio",
+    market_data: Optional[MarketData] = None,
+    mp_context: str = "spawn",
+) -> SweepResult:
+    """Run every combination in `grid` and rank the runs by `metric`.
+
+    Parameters
+    ----------
+    base_cfg : PlatformConfig
+        Config the overrides are applied to.
+    grid : dict
+        {"section.field": [values…]}, e.g. {"pairs.entry_z": [1.5, 2.0]}.
+    n_workers : int, optional
+        Worker processes (default: CPU count).  1 runs in-process.
+    seed : int
+        Root seed; each run gets its own `backtest.seed` spawned from it.
+    market_data : MarketData, optional
+        Pre-loaded data (default: fetched once via `load_market_data`).
+    """
+    for key, values in grid.items():
+        if key.startswith(_DATA_FIELDS):
+            raise ValueError(f"{key!r} changes the shared market data and cannot be swept")
+        if not values:
+            raise ValueError(f"No values given for {key!r}")
+        apply_overrides(base_cfg, {key: values[0]})    # KeyError on unknown fields
+
+    jobs = make_jobs(grid, seed)
+    if market_data is None:
+        market_data = load_market_data(base_cfg)
+    n_workers = max(1, min(n_workers or os.cpu_count() or 1, len(jobs) or 1))
+    logger.info("Sweep: %d runs on %d worker(s)", len(jobs), n_workers)
+
+    rows = []
+    if n_workers == 1:
+        for job in jobs:
+            rows.append(run_job(job, base_cfg, market_data, use_risk))
+    else:
+        with share_market_data(market_data) as shared, \
+                single_threaded_children(), \
+                ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    mp_context=get_context(mp_context),
+                    initializer=_init_worker,
+                    initargs=(shared.spec, base_cfg, use_risk),
+                ) as pool:
+            futures = [pool.submit(_worker_run, job) for job in jobs]
+            for fut in as_completed(futures):
+                row = fut.result()
+                rows.append(row)
+                logger.info("Sweep run %d/%d done (job %d: %s=%s)", len(rows), len(jobs),
+                            row["job_id"], metric, row["stats"].get(metric))
+
+    return _rank(rows, metric)
+
+
+def _rank(rows: list[dict], metric: str) -> SweepResult:
+    records = []
+    for row in sorted(rows, key=lambda r: r["job_id"]):
+        rec = {"job_id": row["job_id"], **row["overrides"], "seed": row["seed"]}
+        rec.update(row["stats"])
+        for key in ("bars", "fills_count", "orders_rejected", "pair_reselection_count", "n_pairs"):
+            if key in row:
+                rec[key] = row[key]
+        rec["error"] = row["error"]
+        records.append(rec)
+
+    table = pd.DataFrame.from_records(records)
+    if metric not in table.columns:
+        table[metric] = math.nan
+    table = table.sort_values(metric, ascending=False, na_position="last", kind="stable")
+    table.index = pd.RangeIndex(1, len(table) + 1, name="rank")
+    return SweepResult(table=table, runs={r["job_id"]: r for r in rows}, metric=metric)
@@ -0,0 +1,260 @@
+"""Parallel walk-forward optimization.
+
+`run_backtest` fits the regime model and selects pairs once, on a single
+`train_pct` split.  Walk-forward instead cuts the history into folds:
+
+    rolling  (anchored=False)    |--- train ---|-- test --|
+                                           |--- train ---|-- test --|
+    anchored (anchored=True)     |--- train ---|-- test --|
+                                 |-------- train ---------|-- test --|
+
+and for every fold fits the HMM and runs `select_pairs` on the train window
+only, then trades the following test window out-of-sample.  Folds depend on
+nothing but price/feature data, so they run concurrently in a process pool
+(market data shared through `backtest.shared_data`).
+
+The test windows are stitched into one out-of-sample equity curve by chaining
+daily returns — each fold starts flat with `initial_capital`, so the stitched
+curve is what reinvesting the whole book fold-to-fold would have earned.  If
+`step_days < test_days` the test windows overlap; each date is then taken
+from the latest fold whose test window starts at or before it.
+
+The strategy's warm-up bars are taken from the end of the train window, so
+the first test bar can already trade.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from typing import Optional
+
+import pandas as pd
+
+from config import PlatformConfig
+from backtest.portfolio import equity_curve_stats
+from backtest.run_backtest import (
+    MarketData, build_backtest_engine, fit_regime_detector, load_market_data, select_pairs,
+)
+from backtest.shared_data import attach_market_data, share_market_data, single_threaded_children
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Fold:
+    """Bar positions (end-exclusive) of one train/test split."""
+    fold_id: int
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+def make_folds(
+    n_bars: int,
+    train_days: int,
+    test_days: int,
+    step_days: Optional[int] = None,
+    anchored: bool = False,
+) -> list[Fold]:
+    """Split `n_bars` into walk-forward folds (the last test window may be short)."""
+    if train_days < 1 or test_days < 1:
+        raise ValueError("train_days and test_days must be >= 1")
+    step = step_days or test_days
+    folds = []
+    train_end = train_days
+    while train_end < n_bars:
+        folds.append(Fold(
+            fold_id=len(folds),
+            train_start=0 if anchored else train_end - train_days,
+            train_end=train_end,
+            test_start=train_end,
+            test_end=min(train_end + test_days, n_bars),
+        ))
+        train_end += step
+    return folds
+
+
+def run_fold(fold: Fold, cfg: PlatformConfig, market_data: MarketData,
+             use_risk: bool = True) -> dict:
+    """Fit on the train window, trade the test window; never raises."""
+    wide  = market_data.wide
+    dates = wide.index
+    capital = cfg.backtest.initial_capital
+    out = {
+        "fold_id": fold.fold_id,
+        "train_start": dates[fold.train_start], "train_end": dates[fold.train_end - 1],
+        "test_start": dates[fold.test_start], "test_end": dates[fold.test_end - 1],
+        "n_pairs": 0, "stats": {}, "returns": pd.Series(dtype=float), "error": None,
+    }
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            train_first, train_last = dates[fold.train_start], dates[fold.train_end - 1]
+
+            def _train_rows(df):
+                return df[(df.index >= train_first) & (df.index <= train_last)]
+
+            # 1. Regime model on the train window only
+            regime_detector = fit_regime_detector(
+                {t: _train_rows(f) for t, f in market_data.feature_dict.items()},
+                cfg.regime.regime_ticker,
+                n_states=cfg.regime.n_states,
+                use_walkforward=False,
+                macro_dict={t: _train_rows(f) for t, f in market_data.macro_dict.items()} or None,
+            )
+
+            # 2. Pairs on the train window (regime proxy ETF excluded)
+            train = wide.iloc[fold.train_start:fold.train_end]
+            if cfg.regime.regime_ticker not in cfg.data.tickers and cfg.regime.regime_ticker in train.columns:
+                train = train.drop(columns=[cfg.regime.regime_ticker])
+            pairs_df = select_pairs(train, train_last, cfg)
+            out["n_pairs"] = len(pairs_df)
+            out["pairs"] = pairs_df.to_dict("records")
+
+            # 3. Test window, with the strategy warm-up taken from the train tail
+            warm = max(0, min(cfg.pairs.warmup_bars - 1, fold.test_start))
+            window = wide.iloc[fold.test_start - warm:fold.test_end]
+            test_dates = dates[fold.test_start:fold.test_end]
+            if pairs_df.empty:
+                out["error"] = "no pairs selected"
+                out["returns"] = pd.Series(0.0, index=test_dates)
+                return out
+
+            engine = build_backtest_engine(cfg, window, pairs_df, regime_detector,
+                                           use_risk=use_risk, feed_warmup_bars=0)
+            results = engine.run()
+
+        equity = results["equity_curve"]
+        rets = (equity / equity.shift(1, fill_value=capital) - 1).loc[test_dates[0]:]
+        out["returns"] = rets
+        out["stats"] = equity_curve_stats(
+            _compound(rets, capital, dates[fold.test_start - 1]), capital,
+            n_trades=len(results["trades"]),
+            commission=results["stats"].get("total_commission", 0.0),
+            slippage=results["stats"].get("total_slippage", 0.0),
+        )
+        out["fills_count"] = results["fills_count"]
+        out["orders_rejected"] = results["orders_rejected"]
+        out["regime_series"] = engine.strategy.get_regime_history()
+    except Exception as e:
+        logger.warning("Walk-forward fold %d failed: %s", fold.fold_id, e)
+        out["error"] = f"{type(e).__name__}: {e}"
+    return out
+
+
+def _compound(rets: pd.Series, capital: float, start_date: pd.Timestamp) -> pd.Series:
+    """Equity curve from daily returns, starting at `capital` on `start_date`."""
+    equity = pd.concat([pd.Series([float(capital)], index=[start_date]),
+                        capital * (1 + rets).cumprod()])
+    equity.name = "equity"
+    return equity
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Orchestration
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class WalkForwardResult:
+    """Stitched out-of-sample curve and stats, plus one row per fold."""
+    equity_curve: pd.Series
+    stats: dict
+    folds: pd.DataFrame
+    fold_results: list = field(default_factory=list)
+
+
+# Per-worker state, set once by the pool initializer
+_WORKER: dict = {}
+
+
+def _init_worker(spec: dict, cfg: PlatformConfig, use_risk: bool) -> None:
+    _WORKER["shared"], _WORKER["data"] = attach_market_data(spec)
+    _WORKER["cfg"] = cfg
+    _WORKER["use_risk"] = use_risk
+
+
+def _worker_run(fold: Fold) -> dict:
+    return run_fold(fold, _WORKER["cfg"], _WORKER["data"], _WORKER["use_risk"])
+
+
+def run_walkforward(
+    cfg: PlatformConfig,
+    n_workers: Optional[int] = None,
+    use_risk: bool = True,
+    market_data: Optional[MarketData] = None,
+    mp_context: str = "spawn",
+) -> WalkForwardResult:
+    """Run every fold of `cfg.walkforward` and stitch the test windows.
+
+    n_workers=1 runs the folds in-process; otherwise they are spread over a
+    process pool (default: one worker per CPU).
+    """
+    if market_data is None:
+        market_data = load_market_data(cfg)
+    wf = cfg.walkforward
+    folds = make_folds(len(market_data.wide), wf.train_days, wf.test_days,
+                       step_days=wf.step_days, anchored=wf.anchored)
+    if not folds:
+        raise ValueError(f"History of {len(market_data.wide)} bars is too short for "
+                         f"train_days={wf.train_days}")
+
+    cfg = copy.deepcopy(cfg)
+    cfg.backtest.verbose = False
+    n_workers = max(1, min(n_workers or os.cpu_count() or 1, len(folds)))
+    logger.info("Walk-forward: %d folds (%s) on %d worker(s)", len(folds),
+                "anchored" if wf.anchored else "rolling", n_workers)
+
+    if n_workers == 1:
+        fold_results = [run_fold(f, cfg, market_data, use_risk) for f in folds]
+    else:
+        with share_market_data(market_data) as shared, \
+                single_threaded_children(), \
+                ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    mp_context=get_context(mp_context),
+                    initializer=_init_worker,
+                    initargs=(shared.spec, cfg, use_risk),
+                ) as pool:
+            fold_results = list(pool.map(_worker_run, folds))
+
+    return stitch_folds(fold_results, cfg.backtest.initial_capital,
+                        market_data.wide.index[folds[0].test_start - 1])
+
+
+def stitch_folds(fold_results: list[dict], initial_capital: float,
+                 start_date: pd.Timestamp) -> WalkForwardResult:
+    """Chain the folds' test-window returns into one equity curve."""
+    fold_results = sorted(fold_results, key=lambda r: r["fold_id"])
+    pieces = []
+    for res, nxt in zip(fold_results, fold_results[1:] + [None]):
+        rets = res["returns"]
+        if nxt is not None:
+            rets = rets[rets.index < nxt["test_start"]]
+        pieces.append(rets)
+    rets = pd.concat(pieces) if pieces else pd.Series(dtype=float)
+
+    equity = _compound(rets, initial_capital, start_date)
+    stats = equity_curve_stats(
+        equity, initial_capital,
+        n_trades=sum(r["stats"].get("n_trades", 0) for r in fold_results),
+        commission=sum(r["stats"].get("total_commission", 0.0) for r in fold_results),
+        slippage=sum(r["stats"].get("total_slippage", 0.0) for r in fold_results),
+    )
+
+    rows = []
+    for r in fold_results:
+        row = {k: r[k] for k in ("fold_id", "train_start", "train_end",
+                                 "test_start", "test_end", "n_pairs")}
+        row.update(r["stats"])
+        row["error"] = r["error"]
+        rows.append(row)
+    folds = pd.DataFrame(rows).set_index("fold_id") if rows else pd.DataFrame()
+    return WalkForwardResult(equity_curve=equity, stats=stats, folds=folds,
+                             fold_results=fold_results)
@@ -30,6 +30,11 @@ class DataConfig:
     period: str = "10y"
     interval: str = "1d"
     cache_dir: str = "data/cache"
+    # "yfinance" | "parquet" (recorded bars in data_dir) | "synthetic" (seeded
+    # generator, no network) — see data.data_client_factory
+    source: str = "yfinance"
+    data_dir: Optional[str] = None          # parquet source; defaults to cache_dir
+    synthetic_seed: int = 0
 
 
 @dataclass
@@ -41,6 +46,12 @@ class RegimeConfig:
     use_walkforward: bool = True
     walkforward_min_train_years: int = 5   # minimum bars before first prediction window
     walkforward_retrain_years: int = 1     # refit every N years with expanding window
+    # Backtest reads the walk-forward labels bar by bar instead of
+    # re-predicting regimes online from the strategy's price buffer
+    precomputed_timeline: bool = True
+    # Without a timeline: advance the detector's streaming forward filter
+    # every bar instead of re-predicting every few bars (HMM detectors)
+    stream: bool = False
     # Multivariate macro HMM (guide §6) — leave empty for univariate mode
     # Example: ["^VIX", "GLD", "TLT", "USO"]
     macro_tickers: List[str] = field(default_factory=list)
@@ -53,6 +64,9 @@ class PairsConfig:
     min_half_life: int = 5
     max_half_life: int = 126
     max_pairs: int = 10
+    # Engle-Granger implementation: "statsmodels" (per pair) or "numpy"
+    # (all candidate pairs in one batched kernel, same p-values)
+    coint_kernel: str = "statsmodels"
     zscore_window: int = 60
     entry_z: float = 2.0
     exit_z: float = 0.5
@@ -74,6 +88,14 @@ class ReselectionConfig:
     enabled: bool = True
     interval_days: int = 63
     lookback_days: int = 504
+    # Run the scheduled re-selections' pair searches up front in a process
+    # pool (see backtest.reselection_precompute); results are identical
+    precompute: bool = False
+    precompute_workers: Optional[int] = None   # default: CPU count
+    # Skip the full cointegration test of pairs whose spread half-life, from
+    # sliding-window sums, is out of bounds (PairsSelector incremental mode);
+    # same selections as a full retest
+    incremental: bool = False
 
 
 @dataclass
@@ -110,6 +132,21 @@ class BacktestConfig:
     train_pct: float = 0.50
     target_notional_pct: float = 0.10
     verbose: bool = True
+    # "event" = queue-driven BacktestEngine, "fast" = array-backed FastBacktestEngine
+    engine: str = "event"
+    # Seeds the broker's slippage RNG (sweeps spawn one per run from a root seed)
+    seed: int = 42
+    # Per-handler timings / bar latency percentiles in results["profile"]
+    profile: bool = False
+
+
+@dataclass
+class WalkForwardConfig:
+    """Walk-forward optimization settings (see backtest.walkforward)."""
+    train_days: int = 504          # bars per training window
+    test_days: int = 126           # bars per out-of-sample window
+    step_days: Optional[int] = None  # fold stride (default: test_days, i.e. back-to-back tests)
+    anchored: bool = False         # True = expanding train window from the first bar
 
 
 @dataclass
@@ -122,6 +159,7 @@ class PlatformConfig:
     execution: ExecutionConfigSpec = field(default_factory=ExecutionConfigSpec)
     risk: RiskConfigSpec = field(default_factory=RiskConfigSpec)
     backtest: BacktestConfig = field(default_factory=BacktestConfig)
+    walkforward: WalkForwardConfig = field(default_factory=WalkForwardConfig)
 
     plots_dir: str = field(default_factory=lambda: os.path.join(
         os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -145,7 +183,7 @@ class PlatformConfig:
 
         cfg = cls()
         for section_name in ["data", "regime", "pairs", "reselection",
-                             "execution", "risk", "backtest"]:
+                             "execution", "risk", "backtest", "walkforward"]:
             if section_name in raw:
                 section = getattr(cfg, section_name)
                 for k, v in raw[section_name].items():
@@ -1,8 +1,17 @@
 import logging
+import os
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Environment override for the data source, so scripts and the dashboard can
+# be pointed at offline data without code changes (same key as
+# `PlatformConfig.from_env` uses for `data.source`).
+SOURCE_ENV = "STATARB_DATA_SOURCE"
+DATA_DIR_ENV = "STATARB_DATA_DATA_DIR"
+
+SOURCES = ("yfinance", "parquet", "synthetic")
+
 
 class DataClientFactory:
     @staticmethod
@@ -11,13 +20,57 @@ class DataClientFactory:
         retry_attempts: int = 3,
         retry_delay: float = 1.0,
         rate_limit_delay: Optional[float] = None,
+        source: Optional[str] = None,
+        data_dir: Optional[str] = None,
         **kwargs
     ):
-        from yfinance_client import YFinanceClient
-        return YFinanceClient(
-            cache_dir=cache_dir,
-            retry_attempts=retry_attempts,
-            retry_delay=retry_delay,
-            rate_limit_delay=rate_limit_delay or 0.1,
-            **kwargs
-        )
+        """Build a market-data client.
+
+        source : "yfinance" (default), "parquet" or "synthetic"; falls back to
+            $STATARB_DATA_SOURCE.  The offline sources ignore the network
+            settings (retries, rate limit, cache_dir).
+        data_dir : Parquet directory for source="parquet"; falls back to
+            $STATARB_DATA_DATA_DIR, then `cache_dir`.
+        kwargs : passed to the client (e.g. `tickers`, `seed`, `n_bars` for
+            the synthetic source).
+        """
+        source = (source or os.environ.get(SOURCE_ENV) or "yfinance").lower()
+        if source == "yfinance":
+            from data.yfinance_client import YFinanceClient
+            return YFinanceClient(
+                cache_dir=cache_dir,
+                retry_attempts=retry_attempts,
+                retry_delay=retry_delay,
+                rate_limit_delay=rate_limit_delay or 0.1,
+                **kwargs
+            )
+        if source == "parquet":
+            from data.offline_client import ParquetDataClient
+            data_dir = data_dir or os.environ.get(DATA_DIR_ENV) or cache_dir
+            if not data_dir:
+                raise ValueError("source='parquet' needs data_dir (or cache_dir)")
+            logger.info("Using offline Parquet data from %s", data_dir)
+            return ParquetDataClient(data_dir, **kwargs)
+        if source == "synthetic":
+            from data.offline_client import SyntheticDataClient
+            logger.info("Using synthetic market data")
+            return SyntheticDataClient(**kwargs)
+        raise ValueError(f"Unknown data source {source!r} (expected one of {SOURCES})")
+
+    @staticmethod
+    def from_config(cfg, **kwargs):
+        """Client for a `PlatformConfig`: `cfg.data.source` / `data_dir`, with
+        the synthetic universe named after `cfg.data.tickers` and the regime
+        ticker as its market proxy.  `kwargs` override any of these.
+
+        $STATARB_DATA_SOURCE is not consulted here: it reaches the config
+        through `PlatformConfig.from_env`, below any CLI override."""
+        data = cfg.data
+        source = data.source.lower()
+        if source == "synthetic":
+            kwargs.setdefault("tickers", list(data.tickers))
+            kwargs.setdefault("market_ticker", cfg.regime.regime_ticker)
+            kwargs.setdefault("seed", data.synthetic_seed)
+        kwargs.setdefault("cache_dir", data.cache_dir)
+        kwargs.setdefault("data_dir", data.data_dir)
+        return DataClientFactory.create(source=source, **kwargs)
@@ -0,0 +1,261 @@
+"""
+Offline data clients for load tests, benchmarks and air-gapped runs.
+
+Drop-in replacements for `YFinanceClient` (same `fetch_ticker`, `fetch_bulk`
+and `get_price_matrix` signatures and output frames) that never touch the
+network:
+
+    ParquetDataClient    serves recorded bars from a local Parquet directory
+                         laid out like the YFinanceClient cache
+                         (`<ticker>_<interval>.parquet`), read memory-mapped
+                         with only the needed columns.
+    SyntheticDataClient  serves a seeded `data.synthetic` market (cointegrated
+                         pairs, regime-switching factor) under any ticker names.
+
+Select one through `DataClientFactory.create(source=...)`; `record_to_parquet`
+turns the output of any client (e.g. a one-off yfinance download) into a
+directory `ParquetDataClient` can replay.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from data.synthetic import SyntheticMarket, make_synthetic_market
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["Date", "open", "high", "low", "close", "volume"]
+
+# yfinance period suffix → DateOffset keyword (longest suffix first)
+_PERIOD_UNITS = (("mo", "months"), ("wk", "weeks"), ("d", "days"), ("y", "years"))
+
+
+def _naive(dates: pd.Series) -> pd.Series:
+    """Timezone-naive datetimes (UTC wall time for tz-aware input)."""
+    dates = pd.to_datetime(dates)
+    if getattr(dates.dt, "tz", None) is not None:
+        dates = dates.dt.tz_convert("UTC").dt.tz_localize(None)
+    return dates
+
+
+def period_start(period: str, last: pd.Timestamp) -> Optional[pd.Timestamp]:
+    """First date covered by a yfinance `period` string ending at `last`
+    (None for "max")."""
+    period = period.strip().lower()
+    if period == "max":
+        return None
+    if period == "ytd":
+        return pd.Timestamp(year=last.year, month=1, day=1)
+    for suffix, unit in _PERIOD_UNITS:
+        if period.endswith(suffix) and period[:-len(suffix)].isdigit():
+            return last - pd.DateOffset(**{unit: int(period[:-len(suffix)])})
+    raise ValueError(f"Unsupported period: {period!r}")
+
+
+class OfflineDataClient:
+    """Shared `YFinanceClient` API on top of `_load(ticker, interval, columns)`.
+
+    Subclasses return a frame with a naive `Date` column plus the requested
+    price columns (or None when the ticker is unknown); date filtering,
+    `period` handling and the long/wide output formats live here.
+    """
+
+    def _load(self, ticker: str, interval: str, columns: List[str]) -> Optional[pd.DataFrame]:
+        raise NotImplementedError
+
+    def fetch_ticker(
+        self,
+        ticker: str,
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
+        period: str = "10y",
+        interval: str = "1d",
+        auto_adjust: bool = True,
+        use_cache: bool = True,
+    ) -> pd.DataFrame:
+        """Historical OHLCV for one ticker, with a `ticker` column (empty
+        DataFrame if the ticker is not available offline)."""
+        df = self._load(ticker, interval, OHLCV_COLUMNS)
+        if df is None or df.empty:
+            logger.warning(f"No offline data for {ticker} ({interval})")
+            return pd.DataFrame()
+        df = self._window(df, start_date, end_date, period)
+        df["ticker"] = ticker
+        return df.reset_index(drop=True)
+
+    def fetch_bulk(
+        self,
+        tickers: List[str],
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
+        period: str = "10y",
+        interval: str = "1d",
+        auto_adjust: bool = True,
+        use_cache: bool = True,
+        show_progress: bool = True,
+    ) -> pd.DataFrame:
+        """Long-format OHLCV for several tickers, sorted by (ticker, Date)."""
+        frames = [
+            df for df in (
+                self.fetch_ticker(t, start_date, end_date, period, interval)
+                for t in tickers
+            )
+            if not df.empty
+        ]
+        if not frames:
+            logger.error("No offline data for any ticker")
+            return pd.DataFrame()
+        combined = pd.concat(frames, axis=0)
+        return combined.sort_values(["ticker", "Date"]).reset_index(drop=True)
+
+    def get_price_matrix(
+        self,
+        tickers: List[str],
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
+        period: str = "10y",
+        price_col: str = "close",
+        use_cache: bool = True,
+    ) -> pd.DataFrame:
+        """Wide Date × Ticker price matrix (see `YFinanceClient.get_price_matrix`).
+
+        Only the `Date` and `price_col` columns are read per ticker, so the
+        OHLCV long frame is never materialised.
+        """
+        columns = {}
+        for t in tickers:
+            df = self._load(t, "1d", ["Date", price_col])
+            if df is None or df.empty:
+                logger.warning(f"No offline data for {t}")
+                continue
+            df = self._window(df, start_date, end_date, period)
+            columns[t] = df.set_index("Date")[price_col]
+        if not columns:
+            return pd.DataFrame()
+        wide = pd.DataFrame(columns).sort_index()
+        wide.index.name = "Date"
+        wide.columns.name = "ticker"
+        return wide
+
+    @staticmethod
+    def _window(df: pd.DataFrame, start_date, end_date, period: str) -> pd.DataFrame:
+        dates = df["Date"]
+        if start_date or end_date:
+            mask = pd.Series(True, index=df.index)
+            if start_date:
+                mask &= dates >= pd.to_datetime(start_date)
+            if end_date:
+                mask &= dates <= pd.to_datetime(end_date)
+            return df[mask]
+        first = period_start(period, dates.iloc[-1])
+        return df if first is None else df[dates >= first]
+
+
+class ParquetDataClient(OfflineDataClient):
+    """Replays recorded bars from `<data_dir>/<ticker>_<interval>.parquet`
+    (the `YFinanceClient` cache layout, so a populated `cache_dir` works
+    as-is).  Files are memory-mapped and only the requested columns are
+    decoded."""
+
+    def __init__(self, data_dir: Union[str, Path], memory_map: bool = True):
+        self.data_dir = Path(data_dir)
+        if not self.data_dir.is_dir():
+            raise FileNotFoundError(f"Parquet data directory not found: {self.data_dir}")
+        self.memory_map = memory_map
+
+    def path(self, ticker: str, interval: str = "1d") -> Path:
+        return self.data_dir / f"{ticker}_{interval}.parquet"
+
+    def available_tickers(self, interval: str = "1d") -> List[str]:
+        suffix = f"_{interval}.parquet"
+        return sorted(p.name[:-len(suffix)] for p in self.data_dir.glob(f"*{suffix}"))
+
+    def _load(self, ticker, interval, columns):
+        path = self.path(ticker, interval)
+        if not path.exists():
+            return None
+        try:
+            present = pq.read_schema(path, memory_map=self.memory_map).names
+            table = pq.read_table(path, columns=[c for c in columns if c in present],
+                                  memory_map=self.memory_map)
+        except Exception as e:
+            logger.warning(f"Failed to read {path}: {e}")
+            return None
+        df = table.to_pandas()
+        if "Date" not in df.columns:
+            return None
+        df["Date"] = _naive(df["Date"])
+        return df.sort_values("Date", kind="stable")
+
+
+class SyntheticDataClient(OfflineDataClient):
+    """Serves a deterministic `make_synthetic_market` panel.
+
+    Ticker names are assigned in order: `tickers[0]`/`tickers[1]` are the
+    first cointegrated pair, and so on (see `data.synthetic`), and
+    `market_ticker` is the regime proxy.  Without `tickers` the generator's
+    own `T0000…` names are used.  Unknown tickers return an empty frame,
+    like an unlisted symbol on yfinance.
+    """
+
+    def __init__(
+        self,
+        tickers: Optional[List[str]] = None,
+        n_tickers: int = 50,
+        n_bars: int = 3780,
+        seed: int = 0,
+        market_ticker: str = "MKT",
+        start: str = "2010-01-04",
+        **market_kwargs,
+    ):
+        tickers = [t for t in dict.fromkeys(tickers or []) if t != market_ticker]
+        market = make_synthetic_market(
+            n_tickers=len(tickers) or n_tickers,
+            n_bars=n_bars,
+            seed=seed,
+            start=start,
+            market_ticker=market_ticker,
+            **market_kwargs,
+        )
+        if tickers:
+            names = dict(zip(market.tickers, tickers))
+            market.prices = market.prices.rename(columns=names)
+            market.pairs = [
+                {**p, "ticker1": names[p["ticker1"]], "ticker2": names[p["ticker2"]]}
+                for p in market.pairs
+            ]
+        self.market: SyntheticMarket = market
+
+    def _load(self, ticker, interval, columns):
+        if interval != "1d":
+            logger.warning(f"Synthetic data is daily only (requested {interval})")
+            return None
+        if ticker not in self.market.prices.columns:
+            return None
+        return self.market.ohlcv(ticker)[columns]
+
+
+def record_to_parquet(client, tickers: List[str], data_dir: Union[str, Path],
+                      interval: str = "1d", **fetch_kwargs) -> List[str]:
+    """Fetch `tickers` with any client and write them in the
+    `ParquetDataClient` layout.  Returns the tickers written."""
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for t in tickers:
+        df = client.fetch_ticker(t, interval=interval, **fetch_kwargs)
+        if df.empty:
+            continue
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, data_dir / f"{t}_{interval}.parquet", compression="snappy")
+        written.append(t)
+    logger.info(f"Recorded {len(written)}/{len(tickers)} tickers to {data_dir}")
+    return written
@@ -0,0 +1,150 @@
+"""Deterministic synthetic market data (offline tests and benchmarks).
+
+`make_synthetic_market` builds a wide close-price panel with a known
+structure:
+
+  - a market factor whose drift/volatility follow a hidden regime path
+    (sticky Markov chain with `n_regimes` states, ~`regime_switches` switches
+    over the sample);
+  - `n_pairs` cointegrated pairs: leg B is a factor-driven random walk and
+    leg A = hedge_ratio × B + an Ornstein-Uhlenbeck spread;
+  - the remaining tickers are independent factor-driven random walks;
+  - a regime proxy ticker (`market_ticker`) that tracks the factor itself.
+
+Everything is drawn from one `numpy.random.default_rng(seed)`, so the same
+arguments always give the same panel.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+# (daily drift, daily vol) of the market factor per regime, calm → stressed
+_REGIME_PARAMS = [
+    (0.0006, 0.007),
+    (0.0002, 0.011),
+    (-0.0004, 0.018),
+    (-0.0015, 0.035),
+]
+
+
+@dataclass
+class SyntheticMarket:
+    """Close-price panel plus the structure it was generated from."""
+    prices: pd.DataFrame                  # Date × Ticker closes
+    pairs: List[dict]                     # {ticker1, ticker2, hedge_ratio} (true pairs)
+    regimes: pd.Series                    # hidden regime label per bar
+    market_ticker: str = "MKT"
+    seed: int = 0
+
+    @property
+    def tickers(self) -> List[str]:
+        """Tradable tickers (the regime proxy excluded)."""
+        return [t for t in self.prices.columns if t != self.market_ticker]
+
+    def ohlcv(self, ticker: str) -> pd.DataFrame:
+        """Long-format bar frame (Date, open, high, low, close, volume) for one
+        ticker, as produced by the data clients.  Intraday range is a
+        deterministic function of the close path; volume is drawn from a
+        per-ticker stream of the market's seed."""
+        j = self.prices.columns.get_loc(ticker)
+        close = self.prices[ticker].to_numpy()
+        prev = np.concatenate([[close[0]], close[:-1]])
+        wiggle = np.abs(close - prev) * 0.5 + close * 0.002
+        volume = np.floor(np.random.default_rng([self.seed, j]).uniform(1e5, 5e6, len(close)))
+        return pd.DataFrame({
+            "Date": self.prices.index,
+            "open": prev,
+            "high": np.maximum(prev, close) + wiggle,
+            "low": np.minimum(prev, close) - wiggle,
+            "close": close,
+            "volume": volume,
+        })
+
+
+def make_synthetic_market(
+    n_tickers: int = 50,
+    n_bars: int = 1000,
+    n_pairs: Optional[int] = None,
+    n_regimes: int = 3,
+    regime_switches: int = 6,
+    seed: int = 0,
+    start: str = "2010-01-04",
+    market_ticker: str = "MKT",
+    spread_phi: float = 0.92,
+) -> SyntheticMarket:
+    """Generate a deterministic synthetic market.
+
+    Parameters
+    ----------
+    n_tickers : int
+        Tradable tickers (the regime proxy comes on top).
+    n_bars : int
+        Business-day bars.
+    n_pairs : int, optional
+        Cointegrated pairs; default min(n_tickers // 4, 50).  Uses 2 × n_pairs
+        of the tickers.
+    n_regimes : int
+        Hidden market regimes (1–4).
+    regime_switches : int
+        Expected number of regime changes over the sample.
+    spread_phi : float
+        AR(1) coefficient of every pair spread (half-life ≈ ln 2 / (1 − phi)).
+    """
+    if not 1 <= n_regimes <= len(_REGIME_PARAMS):
+        raise ValueError(f"n_regimes must be in [1, {len(_REGIME_PARAMS)}]")
+    if n_pairs is None:
+        n_pairs = min(n_tickers // 4, 50)
+    if 2 * n_pairs > n_tickers:
+        raise ValueError("n_pairs needs 2 × n_pairs <= n_tickers")
+
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=n_bars)
+
+    # Hidden regime path: sticky Markov chain
+    stay = 1.0 - min(0.5, regime_switches / max(n_bars, 1))
+    regimes = np.zeros(n_bars, dtype=int)
+    state = 0
+    switches = rng.random(n_bars) > stay
+    hops = rng.integers(1, max(n_regimes, 2), n_bars)
+    for t in range(1, n_bars):
+        if switches[t] and n_regimes > 1:
+            state = (state + hops[t]) % n_regimes
+        regimes[t] = state
+
+    params = np.array(_REGIME_PARAMS[:n_regimes])
+    drift, vol = params[regimes, 0], params[regimes, 1]
+    factor = drift + vol * rng.standard_normal(n_bars)
+
+    betas = rng.uniform(0.5, 1.5, n_tickers)
+    idio = rng.uniform(0.012, 0.025, n_tickers)
+    rets = factor[:, None] * betas[None, :] + rng.standard_normal((n_bars, n_tickers)) * idio
+    start_px = rng.uniform(20.0, 200.0, n_tickers)
+    closes = start_px * np.exp(np.cumsum(rets, axis=0))
+
+    names = [f"T{i:04d}" for i in range(n_tickers)]
+    pairs = []
+    for k in range(n_pairs):
+        a, b = 2 * k, 2 * k + 1
+        hedge = float(rng.uniform(0.5, 2.0))
+        eps = rng.standard_normal(n_bars) * closes[:, b].mean() * 0.005
+        spread = lfilter([1.0], [1.0, -spread_phi], eps)      # AR(1)
+        closes[:, a] = hedge * closes[:, b] + spread + closes[:, b].mean() * 0.5
+        pairs.append({"ticker1": names[a], "ticker2": names[b], "hedge_ratio": hedge})
+
+    market = 100.0 * np.exp(np.cumsum(factor))
+    prices = pd.DataFrame(closes, index=dates, columns=names)
+    prices[market_ticker] = market
+    prices.index.name = "Date"
+    return SyntheticMarket(
+        prices=prices,
+        pairs=pairs,
+        regimes=pd.Series(regimes, index=dates, name="regime"),
+        market_ticker=market_ticker,
+        seed=seed,
+    )
@@ -90,6 +90,32 @@ def compute_standard_features(df: pd.DataFrame, windows: List[int] = [5, 20, 60]
     return df
 
 
+def latest_standard_features(prices, windows: List[int] = [20]) -> dict:
+    """Last-row values of the price-only `compute_standard_features` columns.
+
+    `prices` is the recent price history of one ticker, oldest first (at
+    least max(windows) + 1 values for every feature to be defined).  Returns
+    {`ret`, `logret`, `mom_{w}`, `rv_{w}`} with the same definitions and
+    min_periods as the batch computation — NaN where it would be NaN — in
+    O(max(windows)), so streaming consumers (e.g. per-bar regime updates)
+    need not rebuild a DataFrame every bar.
+    """
+    p = np.asarray(prices, dtype=float)[-(max(windows) + 1):]
+    nan = float("nan")
+    out = {"ret": nan, "logret": nan}
+    logret = np.diff(np.log(p)) if len(p) > 1 else np.empty(0)
+    if len(p) > 1:
+        out["ret"] = p[-1] / p[-2] - 1.0
+        out["logret"] = logret[-1]
+    for w in windows:
+        out[f"mom_{w}"] = p[-1] / p[-w - 1] - 1.0 if len(p) > w else nan
+        lr = logret[-w:]
+        lr = lr[np.isfinite(lr)]
+        n_min = max(1, w // 2)
+        out[f"rv_{w}"] = lr.std(ddof=1) * np.sqrt(252) if len(lr) >= max(n_min, 2) else nan
+    return {k: (v if np.isfinite(v) else nan) for k, v in out.items()}
+
+
 def compute_market_correlation_feature(
     wide_prices: "pd.DataFrame",
     window: int = 60,
@@ -2,11 +2,15 @@
 
 Fits a Gaussian HMM on daily log-returns and realized volatility,
 then relabels states so regime 0 = lowest vol (bull), n-1 = highest vol (crisis).
+
+Besides batch `predict` (Viterbi over a window), a fitted detector can be
+run as a streaming forward filter — `start_stream()`, then one
+`update(observation)` per bar — at O(K²) per bar.
 """
 
 import numpy as np
 import pandas as pd
-from typing import List, Optional
+from typing import List, Mapping, Optional, Tuple
 import logging
 import warnings
 
@@ -58,6 +62,8 @@ class HMMRegimeDetector(BaseRegimeDetector):
         self._active_features: list = []  # columns actually used during fit
         # Walk-forward labels: pre-computed bias-free regime series (guide §3)
         self._walkforward_labels: Optional[pd.Series] = None
+        # Forward-filter state (see start_stream)
+        self._stream: Optional[dict] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -302,6 +308,82 @@ class HMMRegimeDetector(BaseRegimeDetector):
     def n_regimes(self) -> int:
         return self.n_states
 
+    @property
+    def walkforward_labels(self) -> Optional[pd.Series]:
+        """Bias-free labels from `fit_predict_walkforward` (None before it ran)."""
+        return self._walkforward_labels
+
+    def walkforward_label(self, date) -> Optional[int]:
+        """Pre-computed walk-forward label for `date` (None if not covered)."""
+        if self._walkforward_labels is None:
+            return None
+        label = self._walkforward_labels.get(pd.Timestamp(date))
+        return None if label is None or pd.isna(label) else int(label)
+
+    # ------------------------------------------------------------------
+    # Streaming (forward filter)
+    # ------------------------------------------------------------------
+
+    @property
+    def stream_features(self) -> List[str]:
+        """Feature names, in order, that `update` expects."""
+        return list(self._active_features or self.feature_cols)
+
+    def start_stream(self) -> None:
+        """Reset the forward filter to the model's start distribution.
+
+        Caches the fitted scaler, Cholesky factors of the state covariances
+        and the label map, so `update` is a few small matrix products.
+        """
+        if self._model is None:
+            raise RuntimeError("Call fit() before start_stream()")
+        m = self._model
+        chol = np.linalg.cholesky(m.covars_)                       # (K, d, d)
+        d = chol.shape[-1]
+        labels = np.array([self._label_map[k] for k in range(self.n_states)])
+        self._stream = {
+            "mean": np.asarray(self._scaler.mean_, dtype=float),
+            "scale": np.asarray(self._scaler.scale_, dtype=float),
+            "means": np.asarray(m.means_, dtype=float),
+            "chol_inv": np.linalg.inv(chol),
+            "log_norm": -0.5 * d * np.log(2 * np.pi)
+                        - np.log(np.diagonal(chol, axis1=1, axis2=2)).sum(axis=1),
+            "transmat": np.asarray(m.transmat_, dtype=float),
+            "startprob": np.asarray(m.startprob_, dtype=float),
+            "labels": labels,
+            "alpha": None,            # filtered P(raw state | obs so far)
+        }
+
+    def update(self, observation) -> Tuple[int, np.ndarray]:
+        """Advance the forward filter by one bar.
+
+        `observation` holds the unscaled features for the bar: a mapping or
+        Series keyed by feature name, or a sequence in `stream_features` order.
+        Returns (regime label, P(regime | observations so far)) with the
+        probabilities indexed by sorted regime label.  An observation with
+        missing / non-finite values leaves the filter unchanged.
+        """
+        st = self._stream
+        if st is None:
+            raise RuntimeError("Call start_stream() before update()")
+        if isinstance(observation, (Mapping, pd.Series)):
+            observation = [observation.get(c, np.nan) for c in self.stream_features]
+        x = np.asarray(observation, dtype=float)
+
+        if np.isfinite(x).all():
+            x = (x - st["mean"]) / st["scale"]
+            z = np.einsum("kij,kj->ki", st["chol_inv"], x - st["means"])
+            loglik = st["log_norm"] - 0.5 * (z * z).sum(axis=1)
+            prior = st["startprob"] if st["alpha"] is None else st["alpha"] @ st["transmat"]
+            post = prior * np.exp(loglik - loglik.max())
+            total = post.sum()
+            st["alpha"] = post / total if total > 0 and np.isfinite(total) else prior
+
+        alpha = st["startprob"] if st["alpha"] is None else st["alpha"]
+        probs = np.empty(self.n_states)
+        probs[st["labels"]] = alpha
+        return int(st["labels"][int(np.argmax(alpha))]), probs
+
     # ------------------------------------------------------------------
     # Diagnostics
     # ------------------------------------------------------------------
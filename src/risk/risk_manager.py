@@ -251,10 +251,7 @@ class RiskManager:
         old_pos = portfolio.get_position(order.ticker)
         new_pos = old_pos + order.quantity
 
-        gross_notional = sum(
-            abs(shares) * prices.get(t, portfolio.avg_cost.get(t, 0.0))
-            for t, shares in portfolio.positions.items()
-        )
+        gross_notional = portfolio.gross_notional(prices)
         projected_gross_notional = gross_notional - abs(old_pos) * price + abs(new_pos) * price
         post_gross = projected_gross_notional / equity if equity > 0 else float("inf")
 
@@ -270,10 +267,7 @@ class RiskManager:
         old_pos = portfolio.get_position(order.ticker)
         new_pos = old_pos + order.quantity
 
-        net_notional = sum(
-            shares * prices.get(t, portfolio.avg_cost.get(t, 0.0))
-            for t, shares in portfolio.positions.items()
-        )
+        net_notional = portfolio.net_notional(prices)
         projected_net_notional = net_notional - old_pos * price + new_pos * price
         post_net = abs(projected_net_notional / equity) if equity > 0 else float("inf")
 
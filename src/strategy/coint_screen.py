@@ -0,0 +1,174 @@
+"""Incrementally maintained regression statistics for cointegration screening.
+
+Re-selection re-tests candidate pairs on a trailing window that has only
+slid by a few bars.  Everything the Engle-Granger hedge regression and the
+OU half-life regression need can be written in terms of a handful of window
+sums over the price matrix X (n bars × k tickers, shifted by a per-ticker
+constant for conditioning):
+
+    S  = Σ x_t              G = Σ x_t x_tᵀ          L = Σ_{t≥1} x_t x_{t-1}ᵀ
+
+plus the first and last rows.  `WindowMoments` keeps these for the current
+window and slides them by adding the new bars' and removing the expired
+bars' outer products, so a window step costs O(Δn·k²) instead of a full
+pass.  From them `screen_stats` gives, for every candidate pair at once,
+the OLS hedge ratio, the spread's AR(1) half-life (exactly as the full test
+computes it) and the lag-0 Dickey-Fuller t-statistic of the spread.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+class WindowMoments:
+    """Sliding window sums of a wide price matrix.
+
+    `update(window)` accepts the next window (same columns); when its rows
+    continue the previous window's (a suffix of the old rows followed by
+    new ones) the sums are slid — or, every `resync_every` slides, rebuilt
+    to bound rounding drift — otherwise they are rebuilt.  Columns with any
+    missing value in the window are flagged in `complete` and their sums
+    are not meaningful.
+    """
+
+    def __init__(self, resync_every: int = 20):
+        self.resync_every = resync_every
+        self.columns: list = []
+        self.n = 0
+        self._index: Optional[pd.Index] = None
+        self._x: Optional[np.ndarray] = None        # shifted window, NaN → 0
+        self._missing: Optional[np.ndarray] = None
+        self.complete = np.zeros(0, dtype=bool)
+        self.shift = np.zeros(0)
+        self.S = self.G = self.L = None
+        self.slides = 0
+
+    # -----------------------------------------------------------------------
+    # Updates
+    # -----------------------------------------------------------------------
+
+    def update(self, window: pd.DataFrame) -> bool:
+        """Move to `window`; True if it continues the previous window (the
+        sums were slid, or resynced on schedule), False if it does not."""
+        raw = window.to_numpy(dtype=float)
+        missing = np.isnan(raw)
+        offset = self._overlap(window, raw, missing)
+        if offset is None:
+            self._rebuild(window, raw, missing)
+            return False
+        if self.slides + 1 >= self.resync_every:
+            self._rebuild(window, raw, missing)
+            return True
+
+        x = np.where(missing, 0.0, raw - self.shift)
+        old = self._x
+        kept = len(old) - offset
+        expired = old[:offset + 1]                     # + first kept row (its lag link)
+        added = np.concatenate([old[-1:], x[kept:]])   # last old row + new rows
+        self.S += added[1:].sum(axis=0) - expired[:-1].sum(axis=0)
+        self.G += added[1:].T @ added[1:] - expired[:-1].T @ expired[:-1]
+        self.L += added[1:].T @ added[:-1] - expired[1:].T @ expired[:-1]
+        self._set_window(window, x, missing)
+        self.slides += 1
+        return True
+
+    def _overlap(self, window: pd.DataFrame, raw: np.ndarray, missing: np.ndarray):
+        """Rows dropped from the front of the previous window, if `window`
+        continues it; else None."""
+        if self._x is None or list(window.columns) != self.columns or len(window) < 2:
+            return None
+        prev = self._index
+        try:
+            offset = prev.get_loc(window.index[0])
+        except KeyError:
+            return None
+        if not isinstance(offset, (int, np.integer)):
+            return None
+        kept = len(prev) - offset
+        if kept < 2 or kept > len(window) or not prev[offset:].equals(window.index[:kept]):
+            return None
+        old = np.where(missing[:kept], 0.0, raw[:kept] - self.shift)
+        old_missing = self._missing[offset:]
+        if not (np.array_equal(missing[:kept], old_missing)
+                and np.array_equal(old, self._x[offset:])):
+            return None
+        return offset
+
+    def _rebuild(self, window: pd.DataFrame, raw: np.ndarray, missing: np.ndarray) -> None:
+        self.columns = list(window.columns)
+        with np.errstate(invalid="ignore"):
+            shift = np.nanmean(raw, axis=0) if len(raw) else np.zeros(raw.shape[1])
+        self.shift = np.nan_to_num(shift)
+        x = np.where(missing, 0.0, raw - self.shift)
+        self.S = x.sum(axis=0)
+        self.G = x.T @ x
+        self.L = x[1:].T @ x[:-1]
+        self._set_window(window, x, missing)
+        self.slides = 0
+
+    def _set_window(self, window: pd.DataFrame, x: np.ndarray, missing: np.ndarray) -> None:
+        self._index = window.index
+        self._x = x
+        self._missing = missing
+        self.complete = ~missing.any(axis=0)
+        self.n = len(x)
+
+    # -----------------------------------------------------------------------
+    # Pair statistics
+    # -----------------------------------------------------------------------
+
+    def screen_stats(self, i: np.ndarray, j: np.ndarray) -> dict:
+        """Regression statistics of the pairs (y = column i, x = column j).
+
+        Returns arrays `hedge_ratio` (OLS y = a + b·x), `theta` (OU mean-
+        reversion speed of the spread y − b·x, from regressing its first
+        difference on its lag with intercept), `half_life` (ln 2 / θ, inf
+        when θ ≤ 0) and `df_stat` (t-statistic of that lag coefficient,
+        i.e. the lag-0 Dickey-Fuller statistic).  Only meaningful where both
+        columns are `complete` and n ≥ 4.
+        """
+        n, S, G, L = self.n, self.S, self.G, self.L
+        first, last = self._x[0], self._x[-1]
+        m = n - 1
+
+        # Hedge ratio from the full-window moments
+        my, mx = S[i] / n, S[j] / n
+        sxx = G[j, j] - n * mx * mx
+        sxy = G[i, j] - n * mx * my
+        b = sxy / np.where(sxx == 0, np.nan, sxx)
+
+        def quad(M):
+            # Σ of spread products (e = y − b·x) from a moment matrix
+            return M[i, i] - b * (M[i, j] + M[j, i]) + b * b * M[j, j]
+
+        def lin(s):
+            return s[i] - b * s[j]
+
+        # Lagged (t-1) and current (t) halves of the m = n-1 AR(1) samples
+        G_lag = G - np.outer(last, last)
+        G_cur = G - np.outer(first, first)
+        sum_lag = lin(S - last)
+        sum_cur = lin(S - first)
+        ss_lag = quad(G_lag)
+        ss_cur = quad(G_cur)
+        cross = quad(L)
+
+        var_lag = ss_lag / m - (sum_lag / m) ** 2
+        cov = cross / m - (sum_cur / m) * (sum_lag / m)
+        sum_d = sum_cur - sum_lag
+        ss_d = ss_cur - 2 * cross + ss_lag
+        var_d = ss_d / m - (sum_d / m) ** 2
+        cov_d = cov - var_lag                         # cov(Δe, e_lag)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gamma = cov_d / var_lag
+            ssr = m * np.maximum(var_d - gamma * cov_d, 0.0)
+            se = np.sqrt(ssr / (m - 2) / (m * var_lag))
+            df_stat = gamma / se
+            theta = -gamma
+            half_life = np.where(theta > 0, np.log(2) / theta, np.inf)
+        return {"hedge_ratio": b, "theta": theta, "half_life": half_life, "df_stat": df_stat}
@@ -9,12 +9,38 @@ Usage:
     for p1, p2 in price_pairs:
         hedge, uncertainty = kf.update(p1, p2)
         spread = p1 - hedge * p2
+
+`KalmanHedgeBank` runs the same filter for many pairs at once (one row per
+pair, updated in a single vectorized step), and `kalman_hedge_series`
+filters whole price histories in one call for research and plotting.
 """
 
 from __future__ import annotations
 
+from collections import deque
+from typing import Optional, Sequence, Tuple
+
 import numpy as np
-from typing import Tuple
+
+# Bounds applied to the posterior uncertainty after every update
+MIN_UNCERTAINTY = 1e-6
+MAX_UNCERTAINTY = 100.0
+
+
+def _kalman_step(hedge, uncertainty, process_var, meas_var, price1, price2):
+    """One predict/update step on aligned arrays (all rows valid).
+
+    Returns the new (hedge, uncertainty); same arithmetic as
+    `KalmanHedge.update`, element-wise.
+    """
+    predicted_uncertainty = uncertainty + process_var
+    spread = price1 - hedge * price2
+    S = predicted_uncertainty * price2 * price2 + meas_var
+    tiny = np.abs(S) < 1e-12
+    K = np.where(tiny, 0.0, predicted_uncertainty * price2 / np.where(tiny, 1.0, S))
+    new_hedge = hedge + K * spread
+    new_uncertainty = (1.0 - K * price2) * predicted_uncertainty
+    return new_hedge, np.minimum(np.maximum(new_uncertainty, MIN_UNCERTAINTY), MAX_UNCERTAINTY)
 
 
 class KalmanHedge:
@@ -34,6 +60,9 @@ class KalmanHedge:
         Larger = more responsive to regime changes.
     measurement_variance : float
         Noise level in the observed spread. Affects trust in new price data.
+    max_history : int, optional
+        Keep only the last `max_history` entries of `hedge_history` /
+        `uncertainty_history` (0 disables recording); None keeps everything.
         """
 
     def __init__(
@@ -42,15 +71,22 @@ class KalmanHedge:
         initial_uncertainty: float = 1.0,
         process_variance: float = 0.0001,
         measurement_variance: float = 0.01,
+        max_history: Optional[int] = None,
     ):
         self.hedge = initial_hedge
         self.uncertainty = initial_uncertainty
         self.process_var = process_variance
         self.meas_var = measurement_variance
+        self.max_history = max_history
 
         # History for diagnostics
-        self.hedge_history = [initial_hedge]
-        self.uncertainty_history = [initial_uncertainty]
+        self.hedge_history = self._history(initial_hedge)
+        self.uncertainty_history = self._history(initial_uncertainty)
+
+    def _history(self, first: float):
+        if self.max_history is None:
+            return [first]
+        return deque([first] if self.max_history else [], maxlen=self.max_history)
 
     def update(self, price1: float, price2: float) -> Tuple[float, float]:
         """Update hedge ratio estimate given new prices.
@@ -87,9 +123,10 @@ class KalmanHedge:
         self.uncertainty = (1.0 - K * H) * predicted_uncertainty
 
         # Ensure uncertainty stays positive and bounded
-        self.uncertainty = np.clip(self.uncertainty, 1e-6, 100.0)
-        self.hedge_history.append(self.hedge)
-        self.uncertainty_history.append(self.uncertainty)
+        self.uncertainty = np.clip(self.uncertainty, MIN_UNCERTAINTY, MAX_UNCERTAINTY)
+        if self.max_history != 0:
+            self.hedge_history.append(self.hedge)
+            self.uncertainty_history.append(self.uncertainty)
 
         return self.hedge, self.uncertainty
 
@@ -111,5 +148,123 @@ class KalmanHedge:
         """Reset filter to a clean state."""
         self.hedge = initial_hedge
         self.uncertainty = 1.0
-        self.hedge_history = [initial_hedge]
-        self.uncertainty_history = [1.0]
+        self.hedge_history = self._history(initial_hedge)
+        self.uncertainty_history = self._history(1.0)
+
+
+class KalmanHedgeBank:
+    """`KalmanHedge` filters for many pairs held in arrays.
+
+    Row k is pair k: `hedge[k]`, `uncertainty[k]` are its state and
+    `process_var[k]`, `meas_var[k]` its noise parameters.  `update` advances
+    any subset of rows by one observation in one vectorized step, with
+    exactly the scalar filter's arithmetic (rows with a non-finite price or
+    a zero second leg keep their state).  No history is recorded, so memory
+    is O(pairs) however long the run.
+    """
+
+    _ROW_ARRAYS = ("hedge", "uncertainty", "process_var", "meas_var")
+
+    def __init__(
+        self,
+        initial_hedges: Sequence[float] = (),
+        initial_uncertainty: float = 1.0,
+        process_variance: float = 0.0001,
+        measurement_variance: float = 0.01,
+    ):
+        self.initial_uncertainty = initial_uncertainty
+        self.process_variance = process_variance
+        self.measurement_variance = measurement_variance
+        n = len(initial_hedges)
+        self.hedge = np.asarray(initial_hedges, dtype=float).copy()
+        self.uncertainty = np.full(n, float(initial_uncertainty))
+        self.process_var = np.full(n, float(process_variance))
+        self.meas_var = np.full(n, float(measurement_variance))
+
+    def __len__(self) -> int:
+        return len(self.hedge)
+
+    # -----------------------------------------------------------------------
+    # Rows
+    # -----------------------------------------------------------------------
+
+    def keep(self, mask: np.ndarray) -> None:
+        """Drop the rows where `mask` is False (order of the rest preserved)."""
+        for name in self._ROW_ARRAYS:
+            setattr(self, name, getattr(self, name)[mask])
+
+    def extend(self, initial_hedges: Sequence[float]) -> None:
+        """Append one fresh row per initial hedge ratio."""
+        fresh = KalmanHedgeBank(initial_hedges, self.initial_uncertainty,
+                                self.process_variance, self.measurement_variance)
+        for name in self._ROW_ARRAYS:
+            setattr(self, name, np.concatenate([getattr(self, name), getattr(fresh, name)]))
+
+    def reset(self, k: int, initial_hedge: float = 1.0) -> None:
+        """Restart row `k` from `initial_hedge` (like `KalmanHedge.reset`)."""
+        self.hedge[k] = initial_hedge
+        self.uncertainty[k] = 1.0
+
+    def get_state(self, k: int) -> dict:
+        """State of row `k` in the `KalmanHedge.get_state` format."""
+        return {
+            "hedge": float(self.hedge[k]),
+            "uncertainty": float(self.uncertainty[k]),
+            "process_var": float(self.process_var[k]),
+            "meas_var": float(self.meas_var[k]),
+        }
+
+    # -----------------------------------------------------------------------
+    # Filtering
+    # -----------------------------------------------------------------------
+
+    def update(self, rows: np.ndarray, price1: np.ndarray,
+               price2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Advance `rows` (distinct row indices) by one price observation each.
+
+        Returns the (hedge, uncertainty) arrays of `rows` after the step.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        price1 = np.asarray(price1, dtype=float)
+        price2 = np.asarray(price2, dtype=float)
+        valid = np.isfinite(price1) & np.isfinite(price2) & (price2 != 0)
+        r = rows[valid]
+        if len(r):
+            self.hedge[r], self.uncertainty[r] = _kalman_step(
+                self.hedge[r], self.uncertainty[r], self.process_var[r],
+                self.meas_var[r], price1[valid], price2[valid],
+            )
+        return self.hedge[rows], self.uncertainty[rows]
+
+
+def kalman_hedge_series(
+    price1,
+    price2,
+    initial_hedge=1.0,
+    initial_uncertainty: float = 1.0,
+    process_variance: float = 0.0001,
+    measurement_variance: float = 0.01,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Run the hedge filter over whole price histories.
+
+    `price1` / `price2` are (T,) arrays for one pair or (T, P) arrays for P
+    pairs filtered side by side (`initial_hedge` scalar or per pair).
+    Returns the (hedge, uncertainty) after each bar, shaped like the
+    inputs — identical to feeding the bars one by one to `KalmanHedge`.
+    """
+    price1 = np.asarray(price1, dtype=float)
+    price2 = np.asarray(price2, dtype=float)
+    if price1.shape != price2.shape:
+        raise ValueError("price1 and price2 must have the same shape")
+    p1 = price1.reshape(len(price1), -1)
+    p2 = price2.reshape(len(price2), -1)
+    n_pairs = p1.shape[1]
+
+    bank = KalmanHedgeBank(np.broadcast_to(np.asarray(initial_hedge, dtype=float), (n_pairs,)),
+                           initial_uncertainty, process_variance, measurement_variance)
+    rows = np.arange(n_pairs)
+    hedge = np.empty_like(p1)
+    uncertainty = np.empty_like(p1)
+    for t in range(len(p1)):
+        hedge[t], uncertainty[t] = bank.update(rows, p1[t], p2[t])
+    return hedge.reshape(price1.shape), uncertainty.reshape(price1.shape)
@@ -15,12 +15,17 @@ Key concepts:
 Integration:
     PairReSelector is called from PairsBacktestStrategy.on_market_event()
     when the bar count hits the next reselection epoch.
+
+    The expensive part (`select`, i.e. `find_pairs` on the trailing window)
+    depends only on prices, so it can be computed ahead of time for every
+    scheduled window (see `backtest.reselection_precompute`) and handed over
+    with `add_precomputed`; `reselect` then only diffs pair ids.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 import pandas as pd
 
@@ -47,6 +52,12 @@ class PairReSelector:
         Max mean-reversion half-life.
     max_pairs : int
         Maximum number of pairs to keep.
+    incremental : bool
+        Slide the cointegration screening statistics from one re-selection
+        window to the next and skip the full test of pairs whose half-life
+        is out of bounds (see `PairsSelector`).
+    kernel : {"statsmodels", "numpy"}
+        Engle-Granger implementation used by `PairsSelector.find_pairs`.
     """
 
     def __init__(
@@ -57,6 +68,8 @@ class PairReSelector:
         min_half_life: int = 5,
         max_half_life: int = 126,
         max_pairs: int = 10,
+        incremental: bool = False,
+        kernel: str = "statsmodels",
     ):
         self.reselection_interval = reselection_interval
         self.lookback_days = lookback_days
@@ -65,15 +78,17 @@ class PairReSelector:
             pvalue_threshold=pvalue_threshold,
             min_half_life=min_half_life,
             max_half_life=max_half_life,
+            incremental=incremental,
+            kernel=kernel,
         )
         self._last_reselection_bar: int = 0
         self._reselection_count: int = 0
+        # Ahead-of-time `select` results, keyed by `window_key`
+        self._precomputed: Dict[tuple, pd.DataFrame] = {}
 
     def should_reselect(self, bar_count: int) -> bool:
         """Return True if it's time to re-select pairs."""
-        # Default cadence
-        effective_interval = self.reselection_interval
-        return (bar_count - self._last_reselection_bar) >= effective_interval
+        return self.is_due(bar_count, self._last_reselection_bar)
 
     def should_reselect_adaptive(self, bar_count: int, current_regime: int = None,
                                  recent_regimes: list | None = None) -> bool:
@@ -85,9 +100,15 @@ class PairReSelector:
         current_regime: latest regime label (optional)
         recent_regimes: list-like of recent regime labels (most-recent last)
         """
+        return self.is_due(bar_count, self._last_reselection_bar, recent_regimes)
+
+    def is_due(self, bar_count: int, last_bar: int,
+               recent_regimes: list | None = None) -> bool:
+        """Schedule rule behind `should_reselect[_adaptive]`, for an explicit
+        last re-selection bar (used to work out the schedule ahead of time)."""
         # If no recent regime info, fall back to static cadence
         if recent_regimes is None or len(recent_regimes) < 2:
-            return self.should_reselect(bar_count)
+            return (bar_count - last_bar) >= self.reselection_interval
 
         # Measure regime switches in a recent window (last 20 labels or available)
         window = min(len(recent_regimes), 20)
@@ -101,7 +122,48 @@ class PairReSelector:
         else:
             effective_interval = self.reselection_interval
 
-        return (bar_count - self._last_reselection_bar) >= effective_interval
+        return (bar_count - last_bar) >= effective_interval
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def trailing_window(self, price_history: pd.DataFrame) -> pd.DataFrame:
+        """The last `lookback_days` rows of `price_history`."""
+        if len(price_history) > self.lookback_days:
+            return price_history.iloc[-self.lookback_days:]
+        return price_history
+
+    @staticmethod
+    def window_key(window: pd.DataFrame) -> tuple:
+        """Identity of a trailing window for the precomputed-result lookup."""
+        columns = tuple(window.columns)
+        if window.empty:
+            return (0, None, None, columns)
+        first, last = pd.Timestamp(window.index[0]), pd.Timestamp(window.index[-1])
+        return (len(window), first.value, last.value, columns)
+
+    def select(self, price_history: pd.DataFrame) -> pd.DataFrame:
+        """Run pair selection on the trailing window of `price_history`
+        (empty DataFrame when there is too little data).  Depends on prices
+        only, so it can run ahead of time and in other processes."""
+        window = self.trailing_window(price_history)
+
+        # Drop tickers with too many NaNs
+        valid_cols = window.columns[window.notna().sum() > 252]
+        window = window[valid_cols].dropna(axis=0, how="all")
+
+        if window.shape[1] < 2 or len(window) < 252:
+            logger.warning("Insufficient data for pair re-selection (shape=%s)", window.shape)
+            return pd.DataFrame()
+
+        return self._selector.find_pairs(
+            window, max_pairs=self.max_pairs, verbose=False
+        )
+
+    def add_precomputed(self, key: tuple, new_pairs_df: pd.DataFrame) -> None:
+        """Register a `select` result for the window identified by `key`."""
+        self._precomputed[key] = new_pairs_df
 
     def reselect(
         self,
@@ -130,23 +192,11 @@ class PairReSelector:
         self._last_reselection_bar = bar_count
         self._reselection_count += 1
 
-        # Use trailing lookback window
-        if len(price_history) > self.lookback_days:
-            window = price_history.iloc[-self.lookback_days:]
-        else:
-            window = price_history
-
-        # Drop tickers with too many NaNs
-        valid_cols = window.columns[window.notna().sum() > 252]
-        window = window[valid_cols].dropna(axis=0, how="all")
-
-        if window.shape[1] < 2 or len(window) < 252:
-            logger.warning("Insufficient data for pair re-selection (shape=%s)", window.shape)
-            return pd.DataFrame(), set(), set()
-
-        new_pairs_df = self._selector.find_pairs(
-            window, max_pairs=self.max_pairs, verbose=False
-        )
+        # Precomputed result for this exact window, else select now
+        key = self.window_key(self.trailing_window(price_history))
+        new_pairs_df = self._precomputed.pop(key, None)
+        if new_pairs_df is None:
+            new_pairs_df = self.select(price_history)
 
         if new_pairs_df.empty:
             logger.info("Pair re-selection #%d at bar %d: no pairs found, keeping current",
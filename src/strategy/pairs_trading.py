@@ -26,6 +26,9 @@ from statsmodels.tsa.stattools import coint
 from statsmodels.regression.linear_model import OLS
 from statsmodels.tools import add_constant
 
+from strategy.coint_screen import WindowMoments
+from strategy.eg_kernel import engle_granger_batch
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +39,12 @@ logger = logging.getLogger(__name__)
 def _test_pair_worker(args: tuple):
     """Run Engle-Granger test + hedge-ratio + half-life for one pair.
     Returns a result dict on success, or None if the pair is rejected."""
+    return _eg_test(args)[1]
+
+
+def _eg_test(args: tuple):
+    """`_test_pair_worker` that also reports the Engle-Granger p-value:
+    returns (pvalue, result dict or None); pvalue is None if the test failed."""
     os.environ["OMP_NUM_THREADS"] = "1"
     os.environ["OPENBLAS_NUM_THREADS"] = "1"
     os.environ["MKL_NUM_THREADS"] = "1"
@@ -53,10 +62,10 @@ def _test_pair_worker(args: tuple):
         try:
             _, pvalue, _ = coint(s1_vals, s2_vals)
         except Exception:
-            return None
+            return None, None
 
     if pvalue > pvalue_threshold:
-        return None
+        return pvalue, None
 
     # OLS hedge ratio: s1 = β·s2 + α
     X = add_constant(s2_vals)
@@ -72,13 +81,13 @@ def _test_pair_worker(args: tuple):
     res2 = OLS(delta, X2).fit()
     theta = -res2.params[1]
     if theta <= 0:
-        return None
+        return pvalue, None
     half_life = float(np.log(2) / theta)
 
     if not (min_hl <= half_life <= max_hl):
-        return None
+        return pvalue, None
 
-    return {
+    return pvalue, {
         "ticker1": t1,
         "ticker2": t2,
         "pvalue": round(float(pvalue), 5),
@@ -90,7 +99,8 @@ def _test_pair_worker(args: tuple):
 
 
 def _test_pairs_batch_worker(batch: list):
-    """Worker that receives a list of args tuples and returns list of results.
+    """Worker that receives a list of args tuples and returns the list of
+    `_eg_test` outcomes, one per args tuple.
     This reduces IPC overhead by batching several pair tests per process.
     """
     os.environ["OMP_NUM_THREADS"] = "1"
@@ -101,15 +111,48 @@ def _test_pairs_batch_worker(batch: list):
     results = []
     for args in batch:
         try:
-            res = _test_pair_worker(args)
-            if res is not None:
-                results.append(res)
+            results.append(_eg_test(args))
         except Exception:
             # don't let one bad pair kill the whole batch
-            continue
+            results.append((None, None))
     return results
 
 
+def _eg_batch(args_list: list) -> list:
+    """`_eg_test` outcomes for many pairs at once with the NumPy kernel
+    (`strategy.eg_kernel`); pairs are stacked by series length."""
+    outcomes: list = [(None, None)] * len(args_list)
+    by_length: Dict[int, list] = {}
+    for k, args in enumerate(args_list):
+        by_length.setdefault(len(args[2]), []).append(k)
+
+    for ks in by_length.values():
+        try:
+            res = engle_granger_batch(np.stack([args_list[k][2] for k in ks]),
+                                      np.stack([args_list[k][3] for k in ks]))
+        except ValueError:
+            continue                                   # too short to test
+        for row, k in enumerate(ks):
+            t1, t2, _, _, pvalue_threshold, min_hl, max_hl = args_list[k]
+            pvalue, hedge_ratio = float(res["pvalue"][row]), float(res["hedge_ratio"][row])
+            if not np.isfinite(hedge_ratio) or np.isnan(res["adf_stat"][row]):
+                continue                               # degenerate (constant) legs
+            half_life = float(res["half_life"][row])
+            if pvalue > pvalue_threshold or not (min_hl <= half_life <= max_hl):
+                outcomes[k] = (pvalue, None)
+                continue
+            outcomes[k] = (pvalue, {
+                "ticker1": t1,
+                "ticker2": t2,
+                "pvalue": round(pvalue, 5),
+                "hedge_ratio": round(hedge_ratio, 4),
+                "half_life_days": round(half_life, 1),
+                "spread_mean": round(float(res["spread_mean"][row]), 4),
+                "spread_std": round(float(res["spread_std"][row]), 4),
+            })
+    return outcomes
+
+
 # Module-level executor reused across calls to avoid repeated worker setup
 _GLOBAL_EXECUTOR: ThreadPoolExecutor | None = None
 _GLOBAL_EXECUTOR_WORKERS: int | None = None
@@ -155,6 +198,16 @@ class PairsSelector:
         Minimum mean-reversion half-life in days.
     max_half_life : int
         Maximum mean-reversion half-life in days.
+    incremental : bool
+        For repeated calls on a sliding window (pair re-selection): keep the
+        window's regression sums up to date by sliding them (see
+        `strategy.coint_screen`) and skip the full Engle-Granger test of
+        fully observed pairs whose spread half-life — computed exactly from
+        the sums — is outside the bounds, which the full test would reject
+        whatever the p-value.  The selected pairs are those of a full
+        retest.
+    kernel : {"statsmodels", "numpy"}
+        Default Engle-Granger implementation of `find_pairs`.
     """
 
     def __init__(
@@ -162,10 +215,15 @@ class PairsSelector:
         pvalue_threshold: float = 0.05,
         min_half_life: int = 5,
         max_half_life: int = 126,
+        incremental: bool = False,
+        kernel: str = "statsmodels",
     ):
         self.pvalue_threshold = pvalue_threshold
         self.min_half_life = min_half_life
         self.max_half_life = max_half_life
+        self.incremental = incremental
+        self.kernel = kernel
+        self._moments = WindowMoments()
 
     def find_pairs(
         self,
@@ -174,6 +232,7 @@ class PairsSelector:
         max_pairs: int = 50,
         verbose: bool = True,
         sequential_threshold: int = 64,
+        kernel: Optional[str] = None,
     ) -> pd.DataFrame:
         """Find cointegrated pairs in a wide price DataFrame.
 
@@ -185,12 +244,19 @@ class PairsSelector:
             Subset of tickers to test. Default = all columns.
         max_pairs : int
             Maximum pairs to return (ranked by p-value).
+        kernel : {"statsmodels", "numpy"}, optional
+            Engle-Granger implementation (default: the selector's `kernel`).
+            "numpy" tests all pairs at once with `strategy.eg_kernel`
+            (same p-values to rounding, no thread pool needed).
 
         Returns
         -------
         DataFrame with columns: ticker1, ticker2, pvalue, hedge_ratio, half_life_days
         """
         tickers = tickers or list(price_df.columns)
+        kernel = kernel or self.kernel
+        if kernel not in ("statsmodels", "numpy"):
+            raise ValueError(f"Unknown kernel {kernel!r}; use 'statsmodels' or 'numpy'")
 
         combos = list(combinations(tickers, 2))
         logger.info("Testing %d raw pairs for cointegration...", len(combos))
@@ -202,6 +268,12 @@ class PairsSelector:
         combos = list(zip(tickers_arr[i_idx].tolist(), tickers_arr[j_idx].tolist()))
         logger.info("  After |r|≥0.70 pre-filter: %d pairs remain", len(combos))
 
+        # ── Incremental mode: skip pairs the screening statistics rule out
+        if self.incremental and combos:
+            skip = self._screen(price_df[tickers], i_idx, j_idx, combos)
+            combos = [c for c in combos if c not in skip]
+            logger.info("  After incremental screen: %d pairs to retest", len(combos))
+
         # ── Build argument list (convert to numpy arrays once, outside workers)
         # Cache cleaned per-ticker series to avoid repeated dropna/index ops.
         cleaned = {t: price_df[t].dropna() for t in tickers}
@@ -239,11 +311,12 @@ class PairsSelector:
 
         # Force sequential path when sequential_threshold <= 0.
         force_sequential = sequential_threshold <= 0
-        if force_sequential or len(args_list) < sequential_threshold:
-            for a in args_list:
-                r = _test_pair_worker(a)
-                if r is not None:
-                    pairs_result.append(r)
+        if kernel == "numpy" or force_sequential or len(args_list) < sequential_threshold:
+            if kernel == "numpy":
+                outcomes = _eg_batch(args_list)
+            else:
+                outcomes = [_eg_test(a) for a in args_list]
+            pairs_result = [r for _, r in outcomes if r is not None]
             result = pd.DataFrame(pairs_result)
             if not result.empty:
                 result = result.sort_values("pvalue").head(max_pairs).reset_index(drop=True)
@@ -255,20 +328,17 @@ class PairsSelector:
         batch_size = min(128, max(1, len(args_list) // (n_workers * 8)))
         batches = [args_list[i:i + batch_size] for i in range(0, len(args_list), batch_size)]
 
+        outcomes: list = []
         try:
             exe = _get_executor(n_workers)
             # Use map to submit batches; each worker runs multiple tests inside
             for batch_res in exe.map(_test_pairs_batch_worker, batches):
-                if not batch_res:
-                    continue
-                pairs_result.extend(batch_res)
+                outcomes.extend(batch_res)
         except Exception as exc:
             # Fallback to sequential execution if multiprocessing fails
             logger.warning("Batched parallel pair testing failed (%s); falling back to sequential.", exc)
-            for a in args_list:
-                r = _test_pair_worker(a)
-                if r is not None:
-                    pairs_result.append(r)
+            outcomes = [_eg_test(a) for a in args_list]
+        pairs_result = [r for _, r in outcomes if r is not None]
 
         if verbose:
             logger.info("  %d cointegrated pairs found", len(pairs_result))
@@ -284,6 +354,22 @@ class PairsSelector:
         return result
 
     # ------------------------------------------------------------------
+    def _screen(self, window: pd.DataFrame, i_idx: np.ndarray, j_idx: np.ndarray,
+                combos: list) -> set:
+        """Incremental-mode screen of the candidate pairs (column indices
+        `i_idx`, `j_idx` of `window`): the pairs that need no full test."""
+        m = self._moments
+        m.update(window)
+        if m.n < 4:
+            return set()
+        st = m.screen_stats(i_idx, j_idx)
+        complete = m.complete[i_idx] & m.complete[j_idx]
+        # Half-life outside the bounds (with a rounding margin): the full test
+        # rejects these whatever the p-value
+        hl = st["half_life"]
+        hl_out = (hl < self.min_half_life * (1 - 1e-6)) | (hl > self.max_half_life * (1 + 1e-6))
+        return {combos[k] for k in np.flatnonzero(complete & hl_out)}
+
     @staticmethod
     def _estimate_hedge_ratio(s1: pd.Series, s2: pd.Series) -> float:
         """OLS hedge ratio: s1 = β * s2 + α."""
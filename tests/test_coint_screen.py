@@ -0,0 +1,98 @@
+"""Tests for the sliding cointegration screen and PairsSelector incremental mode."""
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.regression.linear_model import OLS
+from statsmodels.tools import add_constant
+
+import strategy.pairs_trading as pairs_trading
+from data.synthetic import make_synthetic_market
+from strategy.coint_screen import WindowMoments
+from strategy.pairs_trading import PairsSelector
+
+
+def _universe(n_bars=1200, seed=0):
+    """Planted cointegrated pairs plus sector names that are highly
+    correlated but (mostly) not cointegrated."""
+    rng = np.random.default_rng(seed)
+    sectors = rng.normal(0, 0.012, (n_bars, 3))
+    rets = np.repeat(sectors, 5, axis=1) + rng.normal(0, 0.005, (n_bars, 15))
+    market = make_synthetic_market(n_tickers=8, n_bars=n_bars, seed=seed)
+    sector_px = pd.DataFrame(50 * np.exp(np.cumsum(rets, axis=0)), index=market.prices.index,
+                             columns=[f"S{i:02d}" for i in range(15)])
+    return pd.concat([market.prices[market.tickers], sector_px], axis=1)
+
+
+def test_sliding_moments_match_regressions():
+    prices = _universe(n_bars=900)
+    prices.iloc[620, 3] = np.nan                   # one gap: column 3 incomplete there
+    i, j = np.array([0, 2, 8, 10]), np.array([1, 3, 9, 14])
+    moments = WindowMoments(resync_every=50)
+    slid = []
+    for end in range(300, 901, 40):
+        window = prices.iloc[end - 300:end]
+        slid.append(moments.update(window))
+        stats = moments.screen_stats(i, j)
+        assert moments.complete[3] == window.iloc[:, 3].notna().all()
+        for k in range(len(i)):
+            if not (moments.complete[i[k]] and moments.complete[j[k]]):
+                continue
+            y, x = window.iloc[:, i[k]].to_numpy(), window.iloc[:, j[k]].to_numpy()
+            hedge = OLS(y, add_constant(x)).fit().params[1]
+            spread = y - hedge * x
+            ar = OLS(np.diff(spread), add_constant(spread[:-1])).fit()
+            assert stats["hedge_ratio"][k] == pytest.approx(hedge, rel=1e-9)
+            assert stats["theta"][k] == pytest.approx(-ar.params[1], rel=1e-7, abs=1e-10)
+            assert stats["df_stat"][k] == pytest.approx(ar.tvalues[1], rel=1e-7)
+    assert not slid[0] and all(slid[1:])
+
+    # A window that does not continue the previous one is rebuilt
+    assert not moments.update(prices.iloc[:300])
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_incremental_find_pairs_matches_full_retest(monkeypatch, seed):
+    prices = _universe(n_bars=1400, seed=seed)
+    tested = []
+    eg_batch = pairs_trading._eg_batch
+    monkeypatch.setattr(pairs_trading, "_eg_batch", lambda a: tested.extend(a) or eg_batch(a))
+
+    full = PairsSelector(kernel="numpy")
+    incremental = PairsSelector(incremental=True, kernel="numpy")
+    n_full = n_incremental = 0
+    for end in range(504, len(prices) + 1, 63):
+        window = prices.iloc[end - 504:end]
+        expected = full.find_pairs(window, max_pairs=10, verbose=False)
+        n_full += len(tested)
+        tested.clear()
+        result = incremental.find_pairs(window, max_pairs=10, verbose=False)
+        n_incremental += len(tested)
+        tested.clear()
+        pd.testing.assert_frame_equal(result, expected)
+    assert n_incremental < n_full
+
+
+def test_incremental_find_pairs_skips_only_out_of_bounds_half_lives(monkeypatch):
+    prices = _universe()
+    tested = []
+    eg_test = pairs_trading._eg_test
+    monkeypatch.setattr(pairs_trading, "_eg_test", lambda a: tested.append(a[:2]) or eg_test(a))
+
+    full, incremental = PairsSelector(), PairsSelector(incremental=True)
+    for end in (504, 567, 630):
+        incremental.find_pairs(prices.iloc[end - 504:end], max_pairs=6, verbose=False)
+    tested.clear()
+
+    # Out of order: the sums are rebuilt, the skip rule is the same
+    window = prices.iloc[1200 - 504:1200]
+    result = incremental.find_pairs(window, max_pairs=6, verbose=False)
+    retested = set(tested)
+    tested.clear()
+    expected = full.find_pairs(window, max_pairs=6, verbose=False)
+    pd.testing.assert_frame_equal(result, expected)
+    moments = WindowMoments()
+    moments.update(window)
+    st = moments.screen_stats(*[np.array([window.columns.get_loc(t) for t in leg])
+                                for leg in zip(*tested)])
+    in_bounds = (st["half_life"] >= 5) & (st["half_life"] <= 126)
+    assert retested == {pair for pair, ok in zip(tested, in_bounds) if ok}
@@ -0,0 +1,78 @@
+"""Tests for the columnar trade/fill log."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.columnar_log import ColumnarLog
+
+SCHEMA = (("date", "datetime"), ("ticker", "category"), ("qty", "float"))
+
+
+def _log(n=5, capacity=2):
+    log = ColumnarLog(SCHEMA, capacity=capacity)
+    for i in range(n):
+        log.append(pd.Timestamp("2024-01-01") + pd.Timedelta(days=i),
+                   "AAA" if i % 2 else "BBB", float(i))
+    return log
+
+
+class TestColumnarLog:
+    def test_grows_past_capacity(self):
+        log = _log(n=9, capacity=2)
+        assert len(log) == 9
+        np.testing.assert_array_equal(log.column("qty"), np.arange(9.0))
+
+    def test_row_access(self):
+        log = _log()
+        assert log[1] == {"date": pd.Timestamp("2024-01-02"), "ticker": "AAA", "qty": 1.0}
+        assert log[-1]["ticker"] == "BBB"
+        with pytest.raises(IndexError):
+            log[5]
+
+    def test_int_nanosecond_dates(self):
+        log = ColumnarLog(SCHEMA)
+        ts = pd.Timestamp("2024-03-01")
+        log.append(ts.value, "X", 1.0)
+        assert log[0]["date"] == ts
+
+    def test_categories_are_coded(self):
+        log = _log()
+        assert log.categories("ticker") == ["BBB", "AAA"]
+        np.testing.assert_array_equal(log.column("ticker"), [0, 1, 0, 1, 0])
+
+    def test_to_frame(self):
+        log = _log()
+        df = log.to_frame()
+        assert list(df.columns) == ["date", "ticker", "qty"]
+        assert list(df["ticker"]) == ["BBB", "AAA", "BBB", "AAA", "BBB"]
+        assert df["date"].iloc[-1] == pd.Timestamp("2024-01-05")
+        cat = log.to_frame(categorical=True)
+        assert isinstance(cat["ticker"].dtype, pd.CategoricalDtype)
+
+    def test_column_views_share_memory(self):
+        log = _log(n=3, capacity=8)
+        assert np.shares_memory(log.column("qty"), log._cols[2])
+        assert not log.column("qty").flags.writeable
+
+    def test_to_frame_copies_by_default(self):
+        log = _log(n=3, capacity=8)
+        df = log.to_frame()
+        assert not np.shares_memory(df["qty"].to_numpy(), log._cols[2])
+        df.loc[0, "qty"] = 99.0
+        assert log[0]["qty"] == 0.0
+        view = log.to_frame(copy=False)
+        assert np.shares_memory(view["qty"].to_numpy(), log._cols[2])
+
+    def test_to_arrow(self):
+        table = _log().to_arrow()
+        assert table.num_rows == 5
+        assert table.column("ticker").to_pylist() == ["BBB", "AAA", "BBB", "AAA", "BBB"]
+
+    def test_empty_log(self):
+        log = ColumnarLog(SCHEMA)
+        assert len(log) == 0
+        assert len(log.to_frame()) == 0
+
+    def test_unknown_kind_rejected(self):
+        with pytest.raises(ValueError):
+            ColumnarLog((("x", "complex"),))
@@ -0,0 +1,104 @@
+"""Tests for the offline data clients and DataClientFactory source selection."""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config import PlatformConfig
+from data.data_client_factory import DataClientFactory
+from data.offline_client import (
+    ParquetDataClient,
+    SyntheticDataClient,
+    period_start,
+    record_to_parquet,
+)
+
+UNIVERSE = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF", "GGG", "HHH"]
+
+
+@pytest.fixture(scope="module")
+def synthetic():
+    return SyntheticDataClient(tickers=UNIVERSE, n_bars=600, seed=3, market_ticker="IDX")
+
+
+def test_synthetic_client_matches_yfinance_frames(synthetic):
+    one = synthetic.fetch_ticker("AAA", period="max")
+    assert list(one.columns) == ["Date", "open", "high", "low", "close", "volume", "ticker"]
+    assert len(one) == 600 and (one["ticker"] == "AAA").all()
+
+    bulk = synthetic.fetch_bulk(["BBB", "AAA", "NOPE"], period="max")
+    assert list(bulk["ticker"].unique()) == ["AAA", "BBB"]
+
+    wide = synthetic.get_price_matrix(["AAA", "BBB", "IDX"], period="max")
+    assert list(wide.columns) == ["AAA", "BBB", "IDX"]
+    assert isinstance(wide.index, pd.DatetimeIndex)
+    assert wide["AAA"].to_numpy() == pytest.approx(one["close"].to_numpy())
+
+    # First synthetic pair carries the first two universe names
+    assert synthetic.market.pairs[0]["ticker1"] == "AAA"
+    assert synthetic.market.pairs[0]["ticker2"] == "BBB"
+    assert synthetic.fetch_ticker("NOPE").empty
+
+
+def test_date_window_and_period(synthetic):
+    dates = synthetic.market.prices.index
+    df = synthetic.fetch_ticker("CCC", start_date=dates[100], end_date=dates[199])
+    assert len(df) == 100
+    assert df["Date"].iloc[0] == dates[100] and df["Date"].iloc[-1] == dates[199]
+
+    one_year = synthetic.get_price_matrix(["CCC"], period="1y")
+    assert one_year.index[0] >= dates[-1] - pd.DateOffset(years=1)
+    assert one_year.index[-1] == dates[-1]
+
+    last = pd.Timestamp("2024-06-14")
+    assert period_start("6mo", last) == pd.Timestamp("2023-12-14")
+    assert period_start("ytd", last) == pd.Timestamp("2024-01-01")
+    assert period_start("max", last) is None
+    with pytest.raises(ValueError):
+        period_start("forever", last)
+
+
+def test_parquet_roundtrip(synthetic, tmp_path):
+    written = record_to_parquet(synthetic, ["AAA", "BBB", "NOPE"], tmp_path, period="max")
+    assert written == ["AAA", "BBB"]
+
+    client = ParquetDataClient(tmp_path)
+    assert client.available_tickers() == ["AAA", "BBB"]
+    pd.testing.assert_frame_equal(
+        client.fetch_bulk(["AAA", "BBB"], period="max"),
+        synthetic.fetch_bulk(["AAA", "BBB"], period="max"),
+    )
+    pd.testing.assert_frame_equal(
+        client.get_price_matrix(["AAA", "BBB"], period="max"),
+        synthetic.get_price_matrix(["AAA", "BBB"], period="max"),
+        check_freq=False,
+    )
+    assert client.fetch_ticker("CCC").empty
+
+    with pytest.raises(FileNotFoundError):
+        ParquetDataClient(tmp_path / "missing")
+
+
+def test_factory_source_selection(tmp_path, monkeypatch):
+    monkeypatch.delenv("STATARB_DATA_SOURCE", raising=False)
+    assert isinstance(DataClientFactory.create(source="synthetic", n_tickers=8, n_bars=300),
+                      SyntheticDataClient)
+    assert isinstance(DataClientFactory.create(source="parquet", data_dir=str(tmp_path)),
+                      ParquetDataClient)
+    with pytest.raises(ValueError):
+        DataClientFactory.create(source="bloomberg")
+
+    monkeypatch.setenv("STATARB_DATA_SOURCE", "synthetic")
+    cfg = PlatformConfig.from_env()
+    assert cfg.data.source == "synthetic"
+    # The config, not the environment, decides in from_config
+    monkeypatch.setenv("STATARB_DATA_SOURCE", "parquet")
+    cfg.data.tickers = UNIVERSE[:4]
+    cfg.regime.regime_ticker = "IDX"
+    client = DataClientFactory.from_config(cfg, n_bars=300)
+    assert isinstance(client, SyntheticDataClient)
+    assert list(client.market.prices.columns) == UNIVERSE[:4] + ["IDX"]
@@ -0,0 +1,156 @@
+"""Tests for the array-backed HistoricalDataFeed."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.data_feed import HistoricalDataFeed
+
+
+def _prices(n=10):
+    dates = pd.date_range("2020-01-01", periods=n, freq="B")
+    df = pd.DataFrame({
+        "AAA": np.arange(n, dtype=float) + 100.0,
+        "BBB": np.arange(n, dtype=float) + 200.0,
+    }, index=dates)
+    df.iloc[3, 1] = np.nan
+    return df
+
+
+class TestIteration:
+    def test_warmup_bars_not_emitted(self):
+        feed = HistoricalDataFeed(_prices(), warmup_bars=4)
+        events = list(feed)
+        assert len(events) == len(feed) == 6
+        assert events[0].date == pd.Timestamp("2020-01-07")
+
+    def test_missing_prices_skipped(self):
+        feed = HistoricalDataFeed(_prices())
+        events = list(feed)
+        assert events[3].prices == {"AAA": 103.0}
+        assert events[4].prices == {"AAA": 104.0, "BBB": 204.0}
+
+    def test_current_prices_is_copy(self):
+        feed = HistoricalDataFeed(_prices())
+        assert feed.current_prices() == {}
+        it = iter(feed)
+        next(it)
+        cp = feed.current_prices()
+        cp["AAA"] = -1.0
+        assert feed.current_prices()["AAA"] == 100.0
+
+
+class TestWindows:
+    def test_window_is_zero_copy_view(self):
+        feed = HistoricalDataFeed(_prices())
+        it = iter(feed)
+        for _ in range(6):
+            next(it)
+        w = feed.window(3)
+        assert w.shape == (3, 2)
+        assert np.shares_memory(w, feed.to_numpy())
+        assert not w.flags.writeable
+        np.testing.assert_array_equal(w[:, 0], [103.0, 104.0, 105.0])
+        assert list(feed.window_dates(3)) == list(_prices().index[3:6])
+
+    def test_window_includes_warmup_bars(self):
+        feed = HistoricalDataFeed(_prices(), warmup_bars=5)
+        next(iter(feed))
+        assert feed.window().shape == (6, 2)
+        assert feed.window(100).shape == (6, 2)
+
+    def test_price_history(self):
+        feed = HistoricalDataFeed(_prices())
+        for _ in feed:
+            pass
+        ph = feed.price_history("BBB", 8)
+        assert len(ph) == 8
+        assert np.isnan(ph[1])        # row 3 is missing for BBB
+        assert ph[-1] == 209.0
+        assert np.shares_memory(ph, feed.to_numpy())
+        with pytest.raises(KeyError):
+            feed.price_history("ZZZ", 5)
+
+    def test_history_length_bounds_windows(self):
+        feed = HistoricalDataFeed(_prices(), history_length=4)
+        for _ in feed:
+            pass
+        assert feed.window().shape == (4, 2)
+        assert feed.window(2).shape == (2, 2)
+        assert len(feed.price_history("AAA", 50)) == 4
+        df = feed.history_df()
+        assert list(df.columns) == ["AAA", "BBB"]
+        assert df.index[-1] == _prices().index[-1]
+        assert len(df) == 4
+
+    def test_invalid_history_length(self):
+        with pytest.raises(ValueError):
+            HistoricalDataFeed(_prices(), history_length=0)
+
+
+def _ohlcv_panels(prices):
+    panels = {}
+    for t in prices.columns:
+        close = prices[t]
+        panels[t] = pd.DataFrame({
+            "open": close - 0.5, "high": close + 1.0, "low": close - 1.0,
+            "close": close, "volume": 1_000.0, "source": "test",
+        }, index=prices.index)
+    panels["BBB"] = panels["BBB"].drop(prices.index[2])
+    return panels
+
+
+class TestOHLCV:
+    def test_snapshot_matches_panel_rows(self):
+        prices = _prices().ffill()
+        panels = _ohlcv_panels(prices)
+        feed = HistoricalDataFeed(prices, ohlcv_panels=panels)
+        for i, ev in enumerate(feed):
+            date = prices.index[i]
+            expected = {
+                t: p.drop(columns="source").loc[date].to_dict()
+                for t, p in panels.items() if date in p.index
+            }
+            assert dict(ev.ohlcv) == expected
+
+    def test_missing_row_absent_and_field_view(self):
+        prices = _prices()
+        feed = HistoricalDataFeed(prices, ohlcv_panels=_ohlcv_panels(prices))
+        events = list(feed)
+        snap = events[2].ohlcv
+        assert list(snap) == ["AAA"] and len(snap) == 1
+        with pytest.raises(KeyError):
+            snap["BBB"]
+        assert snap.fields == ["open", "high", "low", "close", "volume"]
+        np.testing.assert_array_equal(events[4].ohlcv.field("high"), [105.0, 205.0])
+        assert np.shares_memory(events[4].ohlcv.array, feed._ohlcv)
+
+    def test_no_panels_gives_none(self):
+        assert next(iter(HistoricalDataFeed(_prices()))).ohlcv is None
+
+
+class TestAppend:
+    def test_remaining_resumes_after_cursor(self):
+        prices = _prices().ffill()
+        feed = HistoricalDataFeed(prices.iloc[:6], warmup_bars=2)
+        assert len(list(feed.remaining())) == 4
+        assert list(feed.remaining()) == []
+
+        new = prices.iloc[4:].assign(CCC=1.0)        # overlaps two old bars
+        assert feed.append(new) == 4
+        events = list(feed.remaining())
+        assert [e.date for e in events] == list(prices.index[6:])
+        assert events[0].prices == {"AAA": 106.0, "BBB": 206.0, "CCC": 1.0}
+        assert feed.tickers == ["AAA", "BBB", "CCC"]
+        assert np.isnan(feed.price_history("CCC", 10)[:6]).all()
+        assert not feed.to_numpy().flags.writeable
+        assert feed.append(prices.iloc[:3]) == 0
+
+    def test_append_ohlcv(self):
+        prices = _prices().ffill()
+        panels = _ohlcv_panels(prices)
+        feed = HistoricalDataFeed(prices.iloc[:5], ohlcv_panels=panels)
+        list(feed)
+        feed.append(prices.iloc[5:], ohlcv_panels=panels)
+        full = list(HistoricalDataFeed(prices, ohlcv_panels=panels))
+        for ev, ref in zip(feed.remaining(), full[5:]):
+            assert dict(ev.ohlcv) == dict(ref.ohlcv)
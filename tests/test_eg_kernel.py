@@ -0,0 +1,59 @@
+"""Tests for the batched NumPy Engle-Granger kernel (strategy.eg_kernel)."""
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.tsa.adfvalues import mackinnonp
+from statsmodels.tsa.stattools import coint
+
+from data.synthetic import make_synthetic_market
+from strategy.eg_kernel import engle_granger_batch, mackinnon_pvalues
+from strategy.pairs_trading import PairsSelector
+
+
+def test_mackinnon_pvalues_match_statsmodels():
+    stats = np.concatenate([np.linspace(-25, 4, 301), [-np.inf, np.inf]])
+    expected = [mackinnonp(s, regression="c", N=2) for s in stats]
+    np.testing.assert_allclose(mackinnon_pvalues(stats), expected, rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("n_bars", [120, 504])
+def test_batch_matches_statsmodels_coint(n_bars):
+    rng = np.random.default_rng(n_bars)
+    n_pairs = 60
+    x = 50 + np.cumsum(rng.normal(0, 1, (n_pairs, n_bars)), axis=1)
+    # Mix of random walks, AR(1) spreads of varying persistence, one exact copy
+    phi = rng.uniform(0.5, 1.0, n_pairs)
+    noise = rng.normal(0, 1, (n_pairs, n_bars))
+    spread = np.zeros_like(noise)
+    for t in range(1, n_bars):
+        spread[:, t] = phi * spread[:, t - 1] + noise[:, t]
+    y = 1.3 * x + spread
+    y[:10] = 30 + np.cumsum(rng.normal(0, 1, (10, n_bars)), axis=1)
+    y[10] = 2.0 * x[10] + 1.0
+
+    res = engle_granger_batch(y, x)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = [coint(y[p], x[p]) for p in range(n_pairs)]
+    np.testing.assert_allclose(res["adf_stat"][11:], [e[0] for e in expected[11:]], rtol=1e-8)
+    np.testing.assert_allclose(res["pvalue"], [e[1] for e in expected], rtol=1e-8, atol=1e-12)
+    assert res["adf_stat"][10] == -np.inf                 # collinear legs, as statsmodels
+
+    with pytest.raises(ValueError):
+        engle_granger_batch(y, x[:, :-1])
+
+
+def test_find_pairs_numpy_kernel_matches_statsmodels():
+    market = make_synthetic_market(n_tickers=24, n_bars=600, seed=3)
+    prices = market.prices[market.tickers].copy()
+    prices.iloc[::41, 2] = np.nan                         # a leg with gaps: shorter series
+    selector = PairsSelector(pvalue_threshold=0.2, max_half_life=250)
+    expected = selector.find_pairs(prices, max_pairs=50, verbose=False)
+    result = selector.find_pairs(prices, max_pairs=50, verbose=False, kernel="numpy")
+    assert len(expected) >= 4 and "T0002" in set(expected["ticker1"])
+    pd.testing.assert_frame_equal(result, expected)
+
+    with pytest.raises(ValueError):
+        selector.find_pairs(prices, kernel="fortran")
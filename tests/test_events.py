@@ -0,0 +1,60 @@
+"""Tests for the slotted event types."""
+import pandas as pd
+import pytest
+
+from backtest.events import (
+    Direction, EventType, FillEvent, MarketEvent, OrderEvent, OrderType, SignalEvent,
+)
+
+
+def _order(date):
+    return OrderEvent(date=date, ticker="AAPL", order_type=OrderType.MARKET,
+                      quantity=10.0, direction=Direction.LONG, pair_id="AAPL/MSFT")
+
+
+class TestEventDates:
+    def test_timestamp_round_trip(self):
+        ts = pd.Timestamp("2021-03-04")
+        o = _order(ts)
+        assert o.date == ts
+        assert o.date_ns == ts.value
+
+    def test_integer_nanoseconds(self):
+        ts = pd.Timestamp("2021-03-04")
+        o = _order(ts.value)
+        assert o.date_ns == ts.value
+        assert o.date == ts
+
+    def test_string_and_none(self):
+        assert _order("2021-03-04").date == pd.Timestamp("2021-03-04")
+        m = MarketEvent(date=None, prices={})
+        assert m.date is None and m.date_ns is None
+
+    def test_reassign_date(self):
+        m = MarketEvent(date=None, prices={})
+        m.date = pd.Timestamp("2022-01-03")
+        assert m.date_ns == pd.Timestamp("2022-01-03").value
+
+
+class TestEventShape:
+    def test_no_instance_dict(self):
+        o = _order(pd.Timestamp("2021-03-04"))
+        assert not hasattr(o, "__dict__")
+        with pytest.raises(AttributeError):
+            o.not_a_field = 1
+
+    def test_event_types(self):
+        d = pd.Timestamp("2021-03-04")
+        assert MarketEvent(d, {}).event_type == EventType.MARKET
+        assert SignalEvent(d, "A", "B", "flat").event_type == EventType.SIGNAL
+        assert _order(d).event_type == EventType.ORDER
+        fill = FillEvent(d, "A", -2.0, 10.0, 1.0, 0.1, Direction.SHORT)
+        assert fill.event_type == EventType.FILL
+        assert fill.notional == 20.0
+        assert fill.total_cost == 19.0
+
+    def test_equality_and_repr(self):
+        d = pd.Timestamp("2021-03-04")
+        assert _order(d) == _order(d.value)
+        assert _order(d) != _order(d + pd.Timedelta(days=1))
+        assert repr(_order(d)).startswith("OrderEvent(date=Timestamp('2021-03-04")
@@ -0,0 +1,81 @@
+"""Tests for SimulatedBroker, including the batched execution path."""
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from backtest.events import Direction, OrderEvent, OrderType
+from backtest.execution import ExecutionConfig, SimulatedBroker
+
+
+def _orders(n=25, seed=0):
+    rng = np.random.default_rng(seed)
+    tickers = ["A", "B", "C", "D", "MISSING"]
+    out = []
+    for i in range(n):
+        qty = float(rng.integers(-500, 500))
+        out.append(OrderEvent(
+            date=pd.Timestamp("2024-01-02"), ticker=tickers[i % len(tickers)],
+            order_type=OrderType.MARKET, quantity=qty,
+            direction=Direction.LONG if qty > 0 else Direction.SHORT,
+            pair_id=f"P{i % 3}",
+        ))
+    return out
+
+
+PRICES = {"A": 101.5, "B": 47.25, "C": float("nan"), "D": 3.1}
+
+
+def _fields(fill):
+    return (fill.ticker, fill.quantity, fill.fill_price, fill.commission,
+            fill.slippage_cost, fill.direction, fill.pair_id)
+
+
+class TestExecuteBatch:
+    def test_matches_single_order_path(self):
+        single = SimulatedBroker(seed=5)
+        batch  = SimulatedBroker(seed=5, noise_block=7)
+        orders = _orders()
+        expected = [f for f in (single.execute(o, PRICES) for o in orders) if f is not None]
+        got = batch.execute_batch(orders, PRICES)
+        assert [_fields(f) for f in got] == [_fields(f) for f in expected]
+        pdt.assert_frame_equal(single.fills_df(), batch.fills_df())
+
+    def test_rng_stream_shared_across_paths(self):
+        mixed = SimulatedBroker(seed=9, noise_block=4)
+        ref   = SimulatedBroker(seed=9)
+        orders = _orders(40, seed=1)
+        got = []
+        for k in range(0, 40, 10):
+            chunk = orders[k:k + 10]
+            if k % 20:
+                got += [f for f in (mixed.execute(o, PRICES) for o in chunk) if f]
+            else:
+                got += mixed.execute_batch(chunk, PRICES)
+        expected = [f for f in (ref.execute(o, PRICES) for o in orders) if f]
+        assert [_fields(f) for f in got] == [_fields(f) for f in expected]
+
+    def test_matches_legacy_exponential_draws(self):
+        broker = SimulatedBroker(seed=3)
+        rng = np.random.default_rng(3)
+        order = _orders(1)[0]
+        fill = broker.execute(order, PRICES)
+        cfg = ExecutionConfig()
+        slip_bps = cfg.slippage_bps + float(rng.exponential(scale=cfg.slippage_bps * 0.5))
+        mid = PRICES["A"]
+        adj = mid * (cfg.spread_bps / 10_000) + mid * (slip_bps / 10_000)
+        expected = mid + adj if order.quantity > 0 else mid - adj
+        assert abs(fill.fill_price - expected) < 1e-12
+
+    def test_deterministic_slippage(self):
+        cfg = ExecutionConfig(random_slippage=False, min_commission=5.0)
+        broker = SimulatedBroker(cfg)
+        fills = broker.execute_batch(_orders(5), PRICES)
+        assert [f.ticker for f in fills] == ["A", "B", "D"]
+        assert all(f.commission >= 5.0 for f in fills)
+        assert broker.total_commission() == sum(f.commission for f in fills)
+
+    def test_empty_and_unpriced(self):
+        broker = SimulatedBroker()
+        assert broker.execute_batch([], PRICES) == []
+        assert broker.execute_batch([o for o in _orders() if o.ticker == "C"], PRICES) == []
+        assert broker.fills_df().empty
@@ -0,0 +1,124 @@
+"""Parity tests: FastBacktestEngine must reproduce BacktestEngine exactly."""
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from backtest.data_feed import HistoricalDataFeed
+from backtest.engine import BacktestEngine
+from backtest.execution import SimulatedBroker
+from backtest.fast_engine import FastBacktestEngine
+from backtest.portfolio import Portfolio
+from backtest.strategy_wrapper import PairsBacktestStrategy
+from risk.risk_manager import RiskManager, RiskConfig
+from strategy.pair_reselection import PairReSelector
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _cointegrated_prices(n_pairs=3, n_days=400, seed=7) -> pd.DataFrame:
+    """Wide price frame with `n_pairs` cointegrated (A_i, B_i) pairs whose
+    spread is a fast OU process, so z-score entries/exits fire regularly."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2019-01-02", periods=n_days, freq="B")
+    data = {}
+    for i in range(n_pairs):
+        base = 50.0 + 10 * i + np.cumsum(rng.normal(0, 0.8, n_days))
+        spread = np.zeros(n_days)
+        for t in range(1, n_days):
+            spread[t] = 0.85 * spread[t - 1] + rng.normal(0, 1.2)
+        beta = 1.0 + 0.2 * i
+        data[f"A{i}"] = beta * base + spread + 100.0
+        data[f"B{i}"] = base + 50.0
+    return pd.DataFrame(data, index=dates)
+
+
+def _pairs(n_pairs=3):
+    return [
+        {"ticker1": f"A{i}", "ticker2": f"B{i}", "hedge_ratio": 1.0 + 0.2 * i}
+        for i in range(n_pairs)
+    ]
+
+
+def _run(engine_cls, prices, reselect=False, use_risk=True, risk_config=None):
+    feed = HistoricalDataFeed(prices, warmup_bars=20)
+    reselector = None
+    if reselect:
+        reselector = PairReSelector(reselection_interval=100, lookback_days=300, max_pairs=3)
+    strategy = PairsBacktestStrategy(
+        pairs=_pairs(),
+        zscore_window=30,
+        warmup_bars=30,
+        pair_reselector=reselector,
+        all_tickers=list(prices.columns),
+    )
+    risk = None
+    if use_risk:
+        risk = RiskManager(risk_config)
+        risk._peak_equity = 1_000_000.0
+    engine = engine_cls(
+        data_feed=feed,
+        strategy=strategy,
+        portfolio=Portfolio(initial_capital=1_000_000.0),
+        broker=SimulatedBroker(seed=11),
+        risk_manager=risk,
+    )
+    return engine.run()
+
+
+def _assert_same(a: dict, b: dict) -> None:
+    pdt.assert_series_equal(a["equity_curve"], b["equity_curve"])
+    pdt.assert_frame_equal(a["trades"], b["trades"])
+    pdt.assert_frame_equal(a["fills"], b["fills"])
+    for key in ("bars", "signals", "orders", "orders_rejected", "fills_count"):
+        assert a[key] == b[key], key
+    assert a["stats"] == b["stats"]
+    assert a.get("risk_summary") == b.get("risk_summary")
+
+
+# ---------------------------------------------------------------------------
+# Parity
+# ---------------------------------------------------------------------------
+
+class TestFastEngineParity:
+    def test_identical_results_with_risk_manager(self):
+        prices = _cointegrated_prices()
+        ev = _run(BacktestEngine, prices)
+        fa = _run(FastBacktestEngine, prices)
+        assert ev["fills_count"] > 0   # the scenario must actually trade
+        _assert_same(ev, fa)
+
+    def test_identical_results_with_rejections(self):
+        prices = _cointegrated_prices(seed=2)
+        cfg = RiskConfig(max_open_pairs=1, regime_max_open_pairs={1: 1},
+                         max_ticker_notional_pct=0.12)
+        ev = _run(BacktestEngine, prices, risk_config=cfg)
+        fa = _run(FastBacktestEngine, prices, risk_config=cfg)
+        assert ev["orders_rejected"] > 0
+        _assert_same(ev, fa)
+
+    def test_identical_results_without_risk_manager(self):
+        prices = _cointegrated_prices(seed=3)
+        _assert_same(_run(BacktestEngine, prices, use_risk=False),
+                     _run(FastBacktestEngine, prices, use_risk=False))
+
+    def test_identical_results_with_missing_prices(self):
+        prices = _cointegrated_prices(seed=5)
+        rng = np.random.default_rng(0)
+        mask = rng.random(prices.shape) < 0.02
+        prices = prices.mask(mask)
+        _assert_same(_run(BacktestEngine, prices), _run(FastBacktestEngine, prices))
+
+    def test_identical_results_with_reselection(self):
+        prices = _cointegrated_prices(n_days=520, seed=9)
+        ev = _run(BacktestEngine, prices, reselect=True)
+        fa = _run(FastBacktestEngine, prices, reselect=True)
+        _assert_same(ev, fa)
+
+    def test_bar_count_matches_feed_length(self):
+        prices = _cointegrated_prices(n_days=120)
+        res = _run(FastBacktestEngine, prices)
+        assert res["bars"] == 120 - 20
+        assert len(res["equity_curve"]) == res["bars"]
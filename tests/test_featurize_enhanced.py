@@ -35,7 +35,11 @@ def _make_wide_prices(n_tickers=10, n_days=150, seed=0) -> pd.DataFrame:
 
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-from features.featurize import compute_standard_features, compute_market_correlation_feature
+from features.featurize import (
+    compute_market_correlation_feature,
+    compute_standard_features,
+    latest_standard_features,
+)
 
 
 class TestVolTermStructure:
@@ -177,3 +181,19 @@ class TestMarketCorrelationFeature:
         # Some early values should be NaN
         early = result.iloc[:window - 1]
         assert early.isna().any()
+
+
+class TestLatestStandardFeatures:
+    """Streaming last-row features must agree with the batch computation."""
+
+    def test_matches_batch_last_row(self):
+        df = _make_ohlcv(n=80, seed=7).drop(columns=["adj_close"])
+        for n in [1, 2, 8, 12, 20, 21, 60, 80]:
+            batch = compute_standard_features(df.iloc[:n], windows=[5, 20]).iloc[-1]
+            latest = latest_standard_features(df["close"].to_numpy()[:n], windows=[5, 20])
+            assert set(latest) == {"ret", "logret", "mom_5", "rv_5", "mom_20", "rv_20"}
+            for col, value in latest.items():
+                if np.isnan(batch[col]):
+                    assert np.isnan(value), (n, col)
+                else:
+                    assert value == pytest.approx(batch[col], rel=1e-10), (n, col)
@@ -0,0 +1,91 @@
+"""Tests for HMMRegimeDetector's streaming forward filter and its use in the strategy."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.events import MarketEvent
+from backtest.strategy_wrapper import PairsBacktestStrategy
+from data.synthetic import make_synthetic_market
+from features.featurize import compute_standard_features
+from regime.hmm_detector import HMMRegimeDetector
+
+FEATURES = ["logret", "rv_20", "mom_20"]
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    market = make_synthetic_market(n_tickers=12, n_bars=900, seed=2)
+    proxy = market.prices[market.market_ticker]
+    feat = compute_standard_features(
+        pd.DataFrame({"Date": proxy.index, "close": proxy.to_numpy()}), windows=[20]
+    ).set_index("Date")
+    detector = HMMRegimeDetector(n_states=3, n_iter=100, feature_cols=FEATURES)
+    detector.fit(feat.iloc[:500])
+    return market, feat, detector
+
+
+def test_forward_filter_matches_posterior_of_last_bar(fitted):
+    _, feat, detector = fitted
+    raw = feat[FEATURES].dropna().to_numpy()
+    X = detector._scaler.transform(raw)
+    labels = np.array([detector._label_map[k] for k in range(detector.n_states)])
+
+    detector.start_stream()
+    for t, obs in enumerate(raw[:300]):
+        label, probs = detector.update(obs)
+        if t in (0, 1, 50, 299):
+            # Filtered P(state_t | x_0..t) equals the smoothed posterior of the last bar
+            expected = np.empty(detector.n_states)
+            expected[labels] = detector._model.predict_proba(X[:t + 1])[-1]
+            np.testing.assert_allclose(probs, expected, atol=1e-10)
+            assert label == int(np.argmax(expected))
+            assert probs.sum() == pytest.approx(1.0)
+
+    # Missing features leave the filter unchanged; mappings are accepted too
+    assert detector.update([np.nan, 0.1, 0.0])[0] == label
+    np.testing.assert_array_equal(detector.update(dict(zip(FEATURES, [np.nan] * 3)))[1], probs)
+    by_name, _ = detector.update(dict(zip(FEATURES, raw[300])))
+    detector.start_stream()
+    for obs in raw[:301]:
+        by_position, _ = detector.update(obs)
+    assert by_name == by_position
+
+
+def test_stream_requires_fit():
+    detector = HMMRegimeDetector(n_states=2)
+    with pytest.raises(RuntimeError):
+        detector.start_stream()
+    with pytest.raises(RuntimeError):
+        detector.update([0.0, 0.1, 0.0])
+
+
+def test_strategy_updates_regime_every_bar_from_stream(fitted):
+    market, feat, detector = fitted
+    strategy = PairsBacktestStrategy(
+        pairs=market.pairs, zscore_window=60, warmup_bars=60, regime_detector=detector,
+        regime_ticker=market.market_ticker, all_tickers=market.tickers, regime_stream=True,
+    )
+    assert strategy._regime_stream
+    for date, row in market.prices.iterrows():
+        strategy.prepare_bar(MarketEvent(date=date, prices=row.to_dict()))
+    history = strategy.get_regime_history()
+
+    clean = feat[FEATURES].dropna()
+    detector.start_stream()
+    offline = pd.Series([detector.update(obs)[0] for obs in clean.to_numpy()], index=clean.index)
+    pd.testing.assert_series_equal(history, offline.reindex(history.index),
+                                   check_names=False, check_dtype=False)
+    assert history.nunique() > 1
+
+
+def test_strategy_streams_only_on_request(fitted):
+    market, _, detector = fitted
+    detector._stream = None
+    kwargs = dict(pairs=market.pairs, regime_detector=detector,
+                  regime_ticker=market.market_ticker, all_tickers=market.tickers)
+    assert not PairsBacktestStrategy(**kwargs)._regime_stream
+    timeline = pd.Series(0, index=market.prices.index)
+    assert not PairsBacktestStrategy(**kwargs, regime_timeline=timeline,
+                                     regime_stream=True)._regime_stream
+    # The shared detector's filter was left alone
+    assert detector._stream is None
@@ -1,7 +1,7 @@
 """Unit tests for Kalman filter hedge ratio estimation."""
 import pytest
 import numpy as np
-from strategy.kalman_hedge import KalmanHedge
+from strategy.kalman_hedge import KalmanHedge, KalmanHedgeBank, kalman_hedge_series
 
 
 class TestKalmanHedgeBasics:
@@ -129,6 +129,17 @@ class TestKalmanHedgeStateManagement:
         kf.update(110.0, 100.0)
         assert len(kf.hedge_history) == 3
 
+    def test_bounded_and_disabled_history(self):
+        bounded = KalmanHedge(initial_hedge=1.0, max_history=5)
+        off = KalmanHedge(initial_hedge=1.0, max_history=0)
+        for i in range(50):
+            bounded.update(100.0 + i, 100.0)
+            off.update(100.0 + i, 100.0)
+        assert len(bounded.hedge_history) == 5
+        assert bounded.hedge_history[-1] == bounded.hedge
+        assert len(off.hedge_history) == 0 and len(off.uncertainty_history) == 0
+        assert off.hedge == bounded.hedge
+
 
 class TestKalmanHedgeVarianceEffects:
     """Test process and measurement variance effects."""
@@ -158,3 +169,55 @@ class TestKalmanHedgeVarianceEffects:
 
         # Trusts should have updated more
         assert abs(kf_trusts.hedge - 2.0) < abs(kf_skeptic.hedge - 2.0)
+
+
+class TestKalmanHedgeBank:
+    """Vectorized bank and batch filter must reproduce the scalar filter."""
+
+    def _prices(self, n_bars=400, n_pairs=5, seed=0):
+        rng = np.random.default_rng(seed)
+        p2 = 50 + np.cumsum(rng.normal(0, 1, (n_bars, n_pairs)), axis=0)
+        p1 = 1.3 * p2 + rng.normal(0, 2, (n_bars, n_pairs))
+        p1[rng.random((n_bars, n_pairs)) < 0.03] = np.nan
+        p2[rng.random((n_bars, n_pairs)) < 0.01] = 0.0
+        return p1, p2
+
+    def test_bank_matches_scalar_filters(self):
+        p1, p2 = self._prices()
+        init = np.array([1.0, 0.5, 1.3, 2.0, 0.8])
+        scalar = [KalmanHedge(initial_hedge=h) for h in init]
+        bank = KalmanHedgeBank(init)
+        for t in range(len(p1)):
+            # Only some rows are updated on each bar
+            rows = np.array([k for k in range(len(init)) if (t + k) % 4])
+            hedge, unc = bank.update(rows, p1[t, rows], p2[t, rows])
+            for j, k in enumerate(rows):
+                h, u = scalar[k].update(p1[t, k], p2[t, k])
+                assert hedge[j] == h and unc[j] == u
+        for k, kf in enumerate(scalar):
+            assert bank.get_state(k) == kf.get_state()
+
+    def test_bank_rows_keep_extend_reset(self):
+        bank = KalmanHedgeBank([1.0, 2.0, 3.0])
+        bank.update(np.arange(3), np.full(3, 110.0), np.full(3, 100.0))
+        bank.keep(np.array([True, False, True]))
+        bank.extend([4.0])
+        assert len(bank) == 3
+        assert bank.hedge[2] == 4.0 and bank.uncertainty[2] == 1.0
+        bank.reset(0, initial_hedge=1.5)
+        assert bank.get_state(0)["hedge"] == 1.5 and bank.uncertainty[0] == 1.0
+
+    def test_series_matches_scalar_filter(self):
+        p1, p2 = self._prices(seed=1)
+        hedge, unc = kalman_hedge_series(p1, p2, initial_hedge=1.2)
+        assert hedge.shape == p1.shape
+        kf = KalmanHedge(initial_hedge=1.2)
+        for t in range(len(p1)):
+            assert (hedge[t, 3], unc[t, 3]) == kf.update(p1[t, 3], p2[t, 3])
+
+        h1, u1 = kalman_hedge_series(p1[:, 3], p2[:, 3], initial_hedge=1.2)
+        assert h1.shape == (len(p1),)
+        np.testing.assert_array_equal(h1, hedge[:, 3])
+        np.testing.assert_array_equal(u1, unc[:, 3])
+        with pytest.raises(ValueError):
+            kalman_hedge_series(p1, p2[:, :2])
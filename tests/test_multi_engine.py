@@ -0,0 +1,129 @@
+"""Tests for MultiPortfolioEngine: each lane must equal a standalone run."""
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from backtest.data_feed import HistoricalDataFeed
+from backtest.engine import BacktestEngine, default_position_sizer
+from backtest.execution import SimulatedBroker
+from backtest.multi_engine import MultiPortfolioEngine, ParameterSet
+from backtest.portfolio import Portfolio
+from backtest.strategy_wrapper import PairsBacktestStrategy
+from risk.risk_manager import RiskManager, RiskConfig
+from strategy.pair_reselection import PairReSelector
+
+
+def _prices(n_pairs=3, n_days=400, seed=7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2019-01-02", periods=n_days, freq="B")
+    data = {}
+    for i in range(n_pairs):
+        base = 50.0 + 10 * i + np.cumsum(rng.normal(0, 0.8, n_days))
+        spread = np.zeros(n_days)
+        for t in range(1, n_days):
+            spread[t] = 0.85 * spread[t - 1] + rng.normal(0, 1.2)
+        data[f"A{i}"] = (1.0 + 0.2 * i) * base + spread + 100.0
+        data[f"B{i}"] = base + 50.0
+    return pd.DataFrame(data, index=dates)
+
+
+def _strategy(prices, reselect=False, **kwargs):
+    reselector = None
+    if reselect:
+        reselector = PairReSelector(reselection_interval=100, lookback_days=300, max_pairs=3)
+    pairs = [{"ticker1": f"A{i}", "ticker2": f"B{i}", "hedge_ratio": 1.0 + 0.2 * i}
+             for i in range(3)]
+    return PairsBacktestStrategy(
+        pairs=pairs, zscore_window=30, warmup_bars=30,
+        pair_reselector=reselector, all_tickers=list(prices.columns), **kwargs,
+    )
+
+
+def _single(prices, reselect=False, target_notional_pct=0.10, risk_config=None,
+            use_risk=True, **strategy_kwargs):
+    risk = None
+    if use_risk:
+        risk = RiskManager(risk_config)
+        risk._peak_equity = 1_000_000.0
+    engine = BacktestEngine(
+        data_feed=HistoricalDataFeed(prices, warmup_bars=20),
+        strategy=_strategy(prices, reselect, **strategy_kwargs),
+        portfolio=Portfolio(initial_capital=1_000_000.0),
+        broker=SimulatedBroker(seed=11),
+        position_sizer=partial(default_position_sizer, target_notional_pct=target_notional_pct),
+        risk_manager=risk,
+    )
+    return engine.run()
+
+
+def _multi(prices, parameter_sets, reselect=False):
+    engine = MultiPortfolioEngine(
+        HistoricalDataFeed(prices, warmup_bars=20), _strategy(prices, reselect),
+        parameter_sets, broker_seed=11,
+    )
+    return engine, engine.run()
+
+
+def _assert_same(a: dict, b: dict) -> None:
+    pdt.assert_series_equal(a["equity_curve"], b["equity_curve"])
+    pdt.assert_frame_equal(a["trades"], b["trades"])
+    pdt.assert_frame_equal(a["fills"], b["fills"])
+    for key in ("bars", "signals", "orders", "orders_rejected", "fills_count"):
+        assert a[key] == b[key], key
+    assert a["stats"] == b["stats"]
+    assert a.get("risk_summary") == b.get("risk_summary")
+
+
+class TestMultiPortfolioEngine:
+    def test_default_set_matches_single_run(self):
+        prices = _prices()
+        _, res = _multi(prices, [ParameterSet("base")])
+        expected = _single(prices)
+        assert expected["fills_count"] > 0
+        _assert_same(res["base"], expected)
+
+    def test_each_lane_matches_its_own_run(self):
+        prices = _prices(n_days=520, seed=9)
+        wide = {r: 2.5 for r in range(4)}
+        tight_exit = {0: 0.2, 1: 0.3, 2: 0.5, 3: 0.8}
+        sets = [
+            ParameterSet("base"),
+            ParameterSet("wide", entry_z=2.5, exit_z=0.5,
+                         regime_exit_z=tight_exit, target_notional_pct=0.05),
+            ParameterSet("capped", use_risk=True,
+                         risk_config=RiskConfig(max_open_pairs=1, regime_max_open_pairs={1: 1}),
+                         regime_position_scale={0: 1.0, 1: 0.5, 2: 0.25, 3: 0.0}),
+            ParameterSet("no_risk", use_risk=False, target_notional_pct=0.2),
+        ]
+        _, res = _multi(prices, sets, reselect=True)
+
+        _assert_same(res["base"], _single(prices, reselect=True))
+        _assert_same(res["wide"], _single(
+            prices, reselect=True, target_notional_pct=0.05,
+            regime_entry_z_map=wide, regime_exit_z_map=tight_exit))
+        _assert_same(res["capped"], _single(
+            prices, reselect=True,
+            risk_config=RiskConfig(max_open_pairs=1, regime_max_open_pairs={1: 1}),
+            regime_position_scale_map={0: 1.0, 1: 0.5, 2: 0.25, 3: 0.0}))
+        _assert_same(res["no_risk"], _single(
+            prices, reselect=True, use_risk=False, target_notional_pct=0.2))
+        assert res["wide"]["fills_count"] != res["base"]["fills_count"]
+
+    def test_results_table(self):
+        engine, res = _multi(_prices(n_days=200), [ParameterSet("a"), ParameterSet("b", entry_z=1.5)])
+        table = engine.results_table()
+        assert list(table.index) == ["a", "b"]
+        assert table.index.name == "parameter_set"
+        assert table.loc["b", "fills_count"] == res["b"]["fills_count"]
+        assert table.loc["a", "sharpe_ratio"] == res["a"]["stats"]["sharpe_ratio"]
+
+    def test_invalid_parameter_sets(self):
+        prices = _prices(n_days=60)
+        feed = HistoricalDataFeed(prices)
+        with pytest.raises(ValueError):
+            MultiPortfolioEngine(feed, _strategy(prices), [])
+        with pytest.raises(ValueError):
+            MultiPortfolioEngine(feed, _strategy(prices), [ParameterSet("x"), ParameterSet("x")])
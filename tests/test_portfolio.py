@@ -1,6 +1,7 @@
 """Unit tests for Portfolio accounting."""
 import math
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -214,6 +215,81 @@ class TestLeverage:
         assert abs(p.margin_available() - expected) < 1e-6
 
 
+class TestExposureAggregates:
+    @staticmethod
+    def _brute(p, prices):
+        mv = [sh * prices.get(t, p.avg_cost.get(t, 0.0)) for t, sh in p.positions.items()]
+        return sum(v for v in mv if v > 0), -sum(v for v in mv if v < 0)
+
+    def test_incremental_matches_full_recompute(self):
+        import numpy as np
+        rng = np.random.default_rng(1)
+        tickers = [f"T{i}" for i in range(12)]
+        p = Portfolio(initial_capital=1_000_000)
+        for day in range(30):
+            prices = {t: float(rng.uniform(20, 200)) for t in tickers if rng.random() > 0.1}
+            for _ in range(8):
+                t = tickers[rng.integers(len(tickers))]
+                qty = float(rng.choice([-1, 1]) * rng.integers(1, 50))
+                if rng.random() < 0.2:
+                    qty = -p.get_position(t) or qty       # close out
+                fill = _buy_fill if qty > 0 else _sell_fill
+                p.update_fill(fill(t, qty=qty, price=prices.get(t, 100.0)))
+                long_mv, short_mv = self._brute(p, prices)
+                assert p.long_market_value(prices) == pytest.approx(long_mv)
+                assert p.short_market_value(prices) == pytest.approx(short_mv)
+                assert p.gross_notional(prices) == pytest.approx(long_mv + short_mv)
+                assert p.net_notional(prices) == pytest.approx(long_mv - short_mv)
+                assert p.total_equity(prices) == pytest.approx(p.cash + long_mv - short_mv)
+            p.mark_to_market(_ts("2024-01-02") + pd.Timedelta(days=day), prices)
+
+    def test_switching_price_snapshots_resyncs(self):
+        p = Portfolio(initial_capital=100_000)
+        p.update_fill(_buy_fill("A", qty=10, price=100.0, commission=0))
+        p.update_fill(_sell_fill("B", qty=-5, price=50.0, commission=0))
+        assert p.gross_notional({"A": 100.0, "B": 50.0}) == pytest.approx(1_250.0)
+        assert p.gross_notional({"A": 110.0, "B": 40.0}) == pytest.approx(1_300.0)
+        # Missing price falls back to avg cost
+        assert p.net_notional({"A": 110.0}) == pytest.approx(1_100.0 - 250.0)
+
+    def test_prices_mutated_in_place_resync(self):
+        p = Portfolio(initial_capital=100_000)
+        prices = {"A": 100.0, "B": 50.0}
+        p.update_fill(_buy_fill("A", qty=10, price=100.0, commission=0))
+        p.update_fill(_sell_fill("B", qty=-5, price=50.0, commission=0))
+        assert p.total_equity(prices) == pytest.approx(100_000 - 1_000 + 250 + 1_000 - 250)
+        # Same dict object, new bar's prices: picked up by the mark ...
+        prices["A"] = 120.0
+        prices["B"] = 40.0
+        assert p.mark_to_market(_ts("2024-01-03"), prices) == pytest.approx(99_250 + 1_200 - 200)
+        assert p.gross_leverage(prices) == pytest.approx(1_400 / 100_250)
+        # ... or after an explicit invalidation
+        prices.pop("B")
+        p.invalidate_exposure()
+        assert p.net_notional(prices) == pytest.approx(1_200 - 250)
+        # A fill after the mutation is valued at the current prices
+        prices["A"] = 130.0
+        p.invalidate_exposure()
+        p.update_fill(_buy_fill("A", qty=5, price=130.0, commission=0))
+        assert p.long_market_value(prices) == pytest.approx(15 * 130.0)
+
+    def test_last_prices_used_after_mark(self):
+        p = Portfolio(initial_capital=100_000)
+        p.update_fill(_buy_fill("A", qty=10, price=100.0, commission=0))
+        p.mark_to_market(_ts("2024-01-02"), {"A": 120.0})
+        assert p.total_equity() == pytest.approx(99_000 + 1_200)
+        p.mark_to_market(_ts("2024-01-03"), {"A": 130.0})
+        assert p.total_equity() == pytest.approx(99_000 + 1_300)
+
+    def test_flat_book_resets_to_zero(self):
+        p = Portfolio(initial_capital=100_000)
+        prices = {"A": 33.3}
+        p.update_fill(_buy_fill("A", qty=7, price=33.3, commission=0))
+        p.gross_notional(prices)
+        p.update_fill(_sell_fill("A", qty=-7, price=33.3, commission=0))
+        assert p.gross_notional(prices) == 0.0
+
+
 # ---------------------------------------------------------------------------
 # Short rebate accrual
 # ---------------------------------------------------------------------------
@@ -280,3 +356,57 @@ class TestPerformanceStats:
         self._build_equity_curve(p, values)
         stats = p.performance_stats()
         assert stats["max_drawdown_pct"] <= 0
+
+
+class TestLiveStats:
+    @staticmethod
+    def _assert_close(live, batch):
+        assert live.keys() == batch.keys()
+        for k, v in batch.items():
+            if isinstance(v, float) and math.isnan(v):
+                assert math.isnan(live[k]), k
+            else:
+                assert live[k] == pytest.approx(v, abs=0.011), k
+
+    def test_empty_until_two_marks(self):
+        p = Portfolio()
+        assert p.live_stats() == {}
+        p.mark_to_market(_ts("2020-01-02"), {})
+        assert p.live_stats() == {}
+
+    def test_matches_batch_at_every_bar(self):
+        import numpy as np
+        rng = np.random.default_rng(3)
+        p = Portfolio(initial_capital=100_000)
+        dates = pd.date_range("2020-01-02", periods=120, freq="B")
+        price = 50.0
+        for i, d in enumerate(dates):
+            price *= 1 + rng.normal(0, 0.03)
+            if i % 7 == 0:
+                qty = float(rng.integers(-300, 300))
+                fill = _buy_fill if qty > 0 else _sell_fill
+                p.update_fill(fill("X", qty=qty or 1.0, price=price, date=str(d.date())))
+            p.mark_to_market(d, {"X": price})
+            if i >= 1:
+                self._assert_close(p.live_stats(), p.performance_stats())
+
+    @pytest.mark.parametrize("capital,equities", [
+        (0.0, [0.0, 0.0, 0.0]),
+        (0.0, [0.0, 5.0, 7.0]),
+        (1_000.0, [1_000.0, 0.0, 0.0, 5.0]),
+    ])
+    def test_zero_equity_matches_batch(self, capital, equities):
+        p = Portfolio(initial_capital=capital)
+        for d, equity in zip(pd.date_range("2020-01-02", periods=len(equities), freq="B"),
+                             equities):
+            p.cash = equity
+            p.mark_to_market(d, {})
+        with np.errstate(divide="ignore", invalid="ignore"):
+            batch = p.performance_stats()
+        self._assert_close(p.live_stats(), batch)
+
+    def test_flat_equity_gives_nan_ratios(self):
+        p = Portfolio(initial_capital=1_000)
+        for d in pd.date_range("2020-01-02", periods=5, freq="B"):
+            p.mark_to_market(d, {})
+        self._assert_close(p.live_stats(), p.performance_stats())
@@ -0,0 +1,42 @@
+"""Tests for the rolling bars × tickers PriceWindow."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.price_window import PriceWindow
+
+
+def test_window_matches_trailing_frame_across_wraps():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2020-01-01", periods=40, freq="B").as_unit("ns")
+    full = pd.DataFrame(rng.normal(100, 1, (40, 3)), index=dates, columns=["A", "B", "C"])
+    full = full.mask(rng.random(full.shape) < 0.2)
+
+    window = PriceWindow(size=7, tickers=["A", "B"], capacity=1)
+    for t, (date, row) in enumerate(full.iterrows()):
+        if t == 10:
+            assert window.add_ticker("C") == 2          # grows columns mid-run
+        tickers = ["A", "B", "C"] if t >= 10 else ["A", "B"]
+        ok = row[tickers].notna().to_numpy()
+        cols = np.array([window.columns[c] for c in tickers])[ok]
+        window.append(date, cols, row[tickers].to_numpy()[ok])
+
+        expected = full.iloc[max(0, t - 6):t + 1]
+        if t < 10:
+            expected = expected[["A", "B"]]
+        else:
+            expected = expected.assign(C=expected["C"].where(expected.index >= dates[10]))
+        pd.testing.assert_frame_equal(window.frame(), expected, check_freq=False)
+        assert len(window) == len(expected)
+        np.testing.assert_array_equal(window.values(3), expected.to_numpy()[-3:])
+
+    col_b = window.columns["B"]
+    assert np.shares_memory(window.values(), window._buf)
+    assert np.shares_memory(window.frame().to_numpy(), window._buf)
+    np.testing.assert_array_equal(window.tail(col_b, 4), expected["B"].dropna().to_numpy()[-4:])
+    assert window.add_ticker("A") == 0
+
+
+def test_size_must_be_positive():
+    with pytest.raises(ValueError):
+        PriceWindow(size=0)
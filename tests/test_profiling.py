@@ -0,0 +1,61 @@
+"""Tests for the opt-in engine profiler."""
+import pandas.testing as pdt
+import pytest
+
+from backtest.data_feed import HistoricalDataFeed
+from backtest.engine import BacktestEngine
+from backtest.execution import SimulatedBroker
+from backtest.fast_engine import FastBacktestEngine
+from backtest.portfolio import Portfolio
+from backtest.profiling import profile_metrics
+from backtest.strategy_wrapper import PairsBacktestStrategy
+from risk.risk_manager import RiskManager
+from test_fast_engine import _cointegrated_prices, _pairs
+
+
+def _build(engine_cls, prices, profile=False):
+    risk = RiskManager()
+    risk._peak_equity = 1_000_000.0
+    return engine_cls(
+        data_feed=HistoricalDataFeed(prices, warmup_bars=20),
+        strategy=PairsBacktestStrategy(pairs=_pairs(), zscore_window=30, warmup_bars=30),
+        portfolio=Portfolio(initial_capital=1_000_000.0),
+        broker=SimulatedBroker(seed=11),
+        risk_manager=risk,
+        profile=profile,
+    )
+
+
+@pytest.mark.parametrize("engine_cls", [BacktestEngine, FastBacktestEngine])
+def test_profile_results_and_unwrap(engine_cls):
+    prices = _cointegrated_prices()
+    plain = _build(engine_cls, prices).run()
+    engine = _build(engine_cls, prices, profile=True)
+    res = engine.run()
+
+    pdt.assert_series_equal(res["equity_curve"], plain["equity_curve"])
+    assert "profile" not in plain
+
+    prof = res["profile"]
+    handlers = prof["handlers"]
+    assert prof["bars"] == res["bars"]
+    assert handlers["strategy.on_market_event"]["calls"] == res["bars"]
+    assert handlers["portfolio.mark_to_market"]["calls"] == res["bars"]
+    assert handlers["portfolio.update_fill"]["calls"] == res["fills_count"]
+    assert handlers["position_sizer"]["calls"] == res["signals"]
+    assert handlers["risk_manager.check_order"]["calls"] == res["orders"]
+    fills = "broker.execute_batch" if engine_cls is FastBacktestEngine else "broker.execute"
+    assert fills in handlers
+    lat = prof["bar_latency_us"]
+    assert 0 < lat["p50"] <= lat["p95"] <= lat["p99"] <= lat["max"]
+    assert sum(h["total_s"] for h in handlers.values()) <= prof["total_s"]
+
+    # Wrappers are gone after run(): the engine still snapshots
+    assert "on_market_event" not in vars(engine.strategy)
+    assert "execute" not in vars(engine.broker)
+    assert BacktestEngine.from_snapshot(engine.snapshot()).profiler is not None
+
+    metrics = profile_metrics(prof)
+    assert metrics["profile_bar_p99_us"] == lat["p99"]
+    assert metrics["profile_strategy_on_market_event_calls"] == res["bars"]
+    assert set(engine.profiler.to_frame().columns) >= {"calls", "total_s", "pct_of_bar_time"}
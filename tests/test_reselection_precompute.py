@@ -0,0 +1,80 @@
+"""Tests for ahead-of-time pair re-selection (backtest.reselection_precompute)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.data_feed import HistoricalDataFeed
+from backtest.portfolio import Portfolio
+from backtest.reselection_precompute import precompute_reselection
+from backtest.strategy_wrapper import PairsBacktestStrategy
+from data.synthetic import make_synthetic_market
+from strategy.pair_reselection import PairReSelector
+
+
+@pytest.fixture(scope="module")
+def market():
+    market = make_synthetic_market(n_tickers=16, n_bars=900, seed=2)
+    prices = market.prices.copy()
+    rng = np.random.default_rng(0)
+    for t in market.tickers[:4]:
+        prices.loc[prices.index[rng.choice(len(prices), 20, replace=False)], t] = np.nan
+    # Two names list late, so they join the window mid-run
+    prices.loc[prices.index[:350], market.tickers[-2:]] = np.nan
+    return market, prices
+
+
+def _run(market, prices, n_workers=None, incremental=False):
+    """Signals and re-selection outcomes of one run, optionally precomputed."""
+    rs = PairReSelector(reselection_interval=120, lookback_days=300, max_pairs=6,
+                        incremental=incremental)
+    strategy = PairsBacktestStrategy(pairs=market.pairs, zscore_window=40, warmup_bars=40,
+                                     all_tickers=market.tickers[:-2], pair_reselector=rs,
+                                     regime_ticker=market.market_ticker)
+    feed = HistoricalDataFeed(prices)
+    n_pre = 0
+    if n_workers is not None:
+        n_pre = precompute_reselection(strategy, prices.iloc[feed.next_index:],
+                                       n_workers=n_workers)
+
+    selected = []
+    select = rs.select
+    rs.select = lambda history: selected.append(len(history)) or select(history)
+
+    pf = Portfolio(1e6)
+    signals = [(ev.date, sg.ticker1, sg.ticker2, sg.direction, sg.spread_zscore, sg.hedge_ratio)
+               for ev in feed for sg in strategy.on_market_event(ev, pf)]
+    return signals, [p.pair_id for p in strategy._pairs], rs, n_pre, selected
+
+
+@pytest.mark.parametrize("n_workers,incremental", [(1, False), (2, False), (2, True)])
+def test_precomputed_reselection_matches_synchronous(market, n_workers, incremental):
+    expected, pairs, rs, _, selected = _run(*market, incremental=incremental)
+    assert rs.reselection_count >= 5 and len(selected) == rs.reselection_count
+
+    signals, pre_pairs, pre_rs, n_pre, pre_selected = _run(*market, n_workers=n_workers,
+                                                           incremental=incremental)
+    assert signals == expected
+    assert pre_pairs == pairs
+    # Every scheduled window was precomputed and looked up, none recomputed
+    assert n_pre == pre_rs.reselection_count == rs.reselection_count
+    assert pre_selected == [] and pre_rs._precomputed == {}
+
+
+def test_stale_precomputed_windows_fall_back(market):
+    _, prices = market
+    rs = PairReSelector(reselection_interval=120, lookback_days=300, max_pairs=6)
+    history = prices.iloc[:400]
+    rs.add_precomputed(rs.window_key(rs.trailing_window(history.iloc[:-1])), pd.DataFrame())
+    # Key of a different window: selection runs instead of using the stale entry
+    df, added, _ = rs.reselect(400, history, set())
+    assert not df.empty and added
+    assert len(rs._precomputed) == 1
+
+
+def test_window_key_distinguishes_columns(market):
+    _, prices = market
+    window = prices.iloc[100:400, :6]
+    key = PairReSelector.window_key(window)
+    assert PairReSelector.window_key(window.copy()) == key
+    assert PairReSelector.window_key(window[window.columns[::-1]]) != key
+    assert PairReSelector.window_key(prices.iloc[100:400, 1:7]) != key
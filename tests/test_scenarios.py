@@ -0,0 +1,56 @@
+"""Tests for fork-from-checkpoint what-if scenarios."""
+import pandas.testing as pdt
+import pytest
+
+from backtest.run_backtest import build_backtest_engine
+from backtest.scenarios import Scenario, run_scenarios
+from test_snapshot import setup  # noqa: F401  (module fixture)
+
+SCENARIOS = [
+    Scenario("tight_risk", risk={"max_gross_leverage": 0.5, "max_open_pairs": 1}),
+    Scenario("wide_entry", meta_signal={"regime_entry_thresholds": {0: 3.0, 1: 3.0, 2: 3.0, 3: 4.0}}),
+    Scenario("costly", execution={"slippage_bps": 25.0}),
+]
+
+
+def _engine(setup, engine="fast"):
+    cfg, test, pairs, detector = setup
+    cfg.backtest.engine = engine
+    return build_backtest_engine(cfg, test, pairs, detector), test
+
+
+@pytest.mark.parametrize("engine", ["event", "fast"])
+def test_baseline_matches_uninterrupted_run(setup, engine):
+    full = _engine(setup, engine)[0].run()
+    eng, test = _engine(setup, engine)
+    fork = test.index[120]
+    res = run_scenarios(eng, SCENARIOS, fork_date=fork, n_workers=1)
+
+    assert res.fork_date == fork
+    pdt.assert_series_equal(res.runs["baseline"]["equity_curve"], full["equity_curve"])
+    assert list(res.table.index) == ["baseline", "tight_risk", "wide_entry", "costly"]
+    assert res.table["error"].isna().all()
+    for name in res.table.index:
+        eq = res.runs[name]["equity_curve"]
+        pdt.assert_series_equal(eq[eq.index <= fork], full["equity_curve"].loc[:fork])
+    base = res.runs["baseline"]["equity_curve"].iloc[-1]
+    assert res.runs["costly"]["equity_curve"].iloc[-1] != base
+    assert res.table.loc["wide_entry", "n_trades"] < res.table.loc["baseline", "n_trades"]
+
+
+def test_pool_matches_in_process(setup):
+    eng, test = _engine(setup)
+    inline = run_scenarios(eng, SCENARIOS, fork_date=test.index[120], n_workers=1)
+    pooled = run_scenarios(eng, SCENARIOS, n_workers=2, mp_context="fork")
+    pdt.assert_frame_equal(inline.table, pooled.table)
+
+
+def test_invalid_scenarios(setup):
+    eng, test = _engine(setup)
+    res = run_scenarios(eng, [Scenario("bad", risk={"no_such_limit": 1})], n_workers=1)
+    assert "KeyError" in res.table.loc["bad", "error"]
+    with pytest.raises(ValueError):
+        run_scenarios(eng, [Scenario("baseline")])
+    eng.run(until=test.index[50])
+    with pytest.raises(ValueError):
+        run_scenarios(eng, [], fork_date=test.index[10])
@@ -0,0 +1,70 @@
+"""Engine snapshots: a restored and extended run must equal one full run."""
+import pandas.testing as pdt
+import pytest
+
+from backtest.engine import BacktestEngine
+from backtest.fast_engine import FastBacktestEngine
+from backtest.run_backtest import build_backtest_engine, fit_regime_detector, select_pairs
+from test_sweep import _cfg, _market
+
+
+@pytest.fixture(scope="module")
+def setup():
+    market = _market(n_days=500)
+    cfg = _cfg()
+    cfg.reselection.enabled = True
+    cfg.reselection.interval_days = 60
+    cfg.reselection.lookback_days = 200
+    split = 250
+    train, test = market.wide.iloc[:split], market.wide.iloc[split - 30:]
+    detector = fit_regime_detector(
+        {t: f.iloc[:split] for t, f in market.feature_dict.items()}, cfg.regime.regime_ticker,
+        n_states=cfg.regime.n_states, use_walkforward=False)
+    pairs = select_pairs(train.drop(columns=["VOO"]), train.index[-1], cfg)
+    assert not pairs.empty
+    return cfg, test, pairs, detector
+
+
+def _assert_same(a, b):
+    pdt.assert_series_equal(a["equity_curve"], b["equity_curve"])
+    pdt.assert_frame_equal(a["trades"], b["trades"])
+    pdt.assert_frame_equal(a["fills"], b["fills"])
+    for key in ("bars", "signals", "orders", "orders_rejected", "fills_count"):
+        assert a[key] == b[key]
+
+
+@pytest.mark.parametrize("engine", ["event", "fast"])
+def test_snapshot_resume_matches_full_run(setup, engine):
+    cfg, test, pairs, detector = setup
+    cfg.backtest.engine = engine
+    full = build_backtest_engine(cfg, test, pairs, detector).run()
+
+    cut = 150
+    first = build_backtest_engine(cfg, test.iloc[:cut], pairs, detector)
+    first.run()
+    blob = first.snapshot()
+
+    cls = FastBacktestEngine if engine == "fast" else BacktestEngine
+    resumed = cls.from_snapshot(blob)
+    assert resumed.data_feed.current_date == test.index[cut - 1]
+    resumed.extend(test.iloc[cut:cut + 1])
+    resumed = cls.from_snapshot(resumed.snapshot())
+    out = resumed.extend(test.iloc[cut + 1:])
+
+    _assert_same(out, full)
+    assert resumed.strategy._pair_reselector.reselection_count > 0
+    # Nothing new: no bars processed, nothing changes
+    assert resumed.extend(test.iloc[-5:])["bars"] == full["bars"]
+
+
+def test_snapshot_rejects_foreign_payload(setup, tmp_path):
+    cfg, test, pairs, detector = setup
+    cfg.backtest.engine = "fast"
+    engine = build_backtest_engine(cfg, test.iloc[:60], pairs, detector)
+    path = tmp_path / "engine.pkl"
+    engine.save_snapshot(str(path))
+    assert isinstance(BacktestEngine.load_snapshot(str(path)), FastBacktestEngine)
+
+    import pickle
+    with pytest.raises(ValueError):
+        BacktestEngine.from_snapshot(pickle.dumps({"format": -1, "engine": engine}))
@@ -0,0 +1,155 @@
+"""Tests for the vectorized spread z-scores and signal book in PairsBacktestStrategy."""
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.events import MarketEvent
+from backtest.rolling_stats import PairMomentsBank
+from backtest.strategy_wrapper import PairsBacktestStrategy
+from data.synthetic import make_synthetic_market
+
+
+def _feed_buffers(bufs, row, size):
+    """Per-ticker buffers of the last `size` valid prices, kept from the raw
+    feed independently of the strategy (as its former `_price_buf`)."""
+    for t, p in row.items():
+        if p == p:
+            bufs.setdefault(t, deque(maxlen=size)).append(float(p))
+
+
+def _reference_zscore(strategy, pc, bufs):
+    """Full-buffer z-score as computed before the rolling-moment rewrite."""
+    buf1 = list(bufs.get(pc.ticker1, []))
+    buf2 = list(bufs.get(pc.ticker2, []))
+    n = min(len(buf1), len(buf2))
+    if n < strategy.zscore_window // 2:
+        return None
+    s1 = np.array(buf1[-n:], dtype=float)
+    s2 = np.array(buf2[-n:], dtype=float)
+    spread = s1 - pc.hedge_ratio * s2
+    win = min(strategy.zscore_window, n)
+    sig = spread[-win:].std()
+    if sig < 1e-10:
+        return None
+    return (spread[-1] - spread[-win:].mean()) / sig
+
+
+def test_moments_bank_matches_numpy_windows():
+    rng = np.random.default_rng(0)
+    n_pairs, window = 4, 50
+    x1 = 100 + np.cumsum(rng.normal(0, 1, (3000, n_pairs)), axis=0)
+    x2 = 80 + np.cumsum(rng.normal(0, 1, (3000, n_pairs)), axis=0)
+    bank = PairMomentsBank(window=window, n_pairs=n_pairs, resync_every=700)
+    pushed = {k: [] for k in range(n_pairs)}        # bars each row has seen
+    for t in range(len(x1)):
+        # Rows advance on different bars; row 3 is reloaded every 500 bars
+        rows = np.array([k for k in range(n_pairs) if k != 1 or t % 3])
+        if t % 500 == 499:
+            bank.reset(3, x1[t - 79:t + 1, 3], x2[t - 79:t + 1, 3])
+            rows = rows[rows != 3]
+        bank.push(rows, x1[t, rows], x2[t, rows])
+        for k in range(n_pairs):
+            if k == 3 and t % 500 == 499:
+                pushed[3] = list(range(t - 79, t + 1))
+            elif k in rows:
+                pushed[k].append(t)
+        hedge = 1.0 + 0.3 * np.sin(t / 40 + np.arange(n_pairs))
+        z = bank.spread_zscore(hedge)
+        for k in range(n_pairs):
+            bars = pushed[k][-window:]
+            spread = x1[bars, k] - hedge[k] * x2[bars, k]
+            if len(bars) < 2:
+                assert np.isnan(z[k])             # single point: zero std
+                continue
+            expected = (spread[-1] - spread.mean()) / spread.std()
+            assert z[k] == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("window", [20, 60])
+def test_strategy_zscores_match_full_recompute(window):
+    market = make_synthetic_market(n_tickers=12, n_bars=900, seed=4)
+    prices = market.prices.copy()
+    # Missing prints on a few legs exercise the misaligned-buffer path
+    rng = np.random.default_rng(1)
+    for t in ["T0000", "T0003", "T0004"]:
+        prices.loc[prices.index[rng.choice(len(prices), 25, replace=False)], t] = np.nan
+
+    strategy = PairsBacktestStrategy(pairs=market.pairs, zscore_window=window,
+                                     warmup_bars=10, all_tickers=market.tickers)
+    checked = 0
+    bufs = {}
+    for date, row in prices.iterrows():
+        _feed_buffers(bufs, row, strategy._buf_size)
+        event = MarketEvent(date=date, prices=row.dropna().to_dict())
+        bar = strategy.prepare_bar(event)
+        if bar is None:
+            continue
+        for pc, z in zip(bar.pairs, bar.zscores):
+            expected = _reference_zscore(strategy, pc, bufs)
+            if expected is None:
+                assert np.isnan(z)
+            else:
+                assert z == pytest.approx(expected, rel=1e-8, abs=1e-8)
+                checked += 1
+    assert checked > 2000
+
+
+def test_long_gap_on_one_leg():
+    market = make_synthetic_market(n_tickers=8, n_bars=1400, seed=6)
+    prices = market.prices.copy()
+    # T0000 stops printing for longer than the strategy's price window
+    gap = slice(300, 1000)
+    prices.iloc[gap, prices.columns.get_loc("T0000")] = np.nan
+
+    strategy = PairsBacktestStrategy(pairs=market.pairs, zscore_window=60,
+                                     warmup_bars=10, all_tickers=market.tickers)
+    assert gap.stop - gap.start > strategy._buf_size
+    bufs, since_gap, checked = {}, 0, 0
+    for i, (date, row) in enumerate(prices.iterrows()):
+        _feed_buffers(bufs, row, strategy._buf_size)
+        bar = strategy.prepare_bar(MarketEvent(date=date, prices=row.dropna().to_dict()))
+        since_gap += i >= gap.stop
+        if bar is None:
+            continue
+        pc, z = next((pc, z) for pc, z in zip(bar.pairs, bar.zscores) if pc.ticker1 == "T0000")
+        if gap.stop <= i and since_gap < strategy.zscore_window // 2:
+            assert np.isnan(z)                    # too few prices since the gap
+        elif since_gap >= strategy.zscore_window:
+            assert z == pytest.approx(_reference_zscore(strategy, pc, bufs), rel=1e-8, abs=1e-8)
+            checked += 1
+    assert checked > 300
+
+
+def test_regime_timeline_drives_regime_by_bar():
+    market = make_synthetic_market(n_tickers=8, n_bars=300, seed=5)
+    dates = market.prices.index
+    # Sparse timeline covering bars 100-249 only (labels change every 10 bars)
+    covered = dates[100:250:3]
+    labels = pd.Series((np.arange(len(covered)) // 4) % 4, index=covered)
+    probs = pd.DataFrame(np.eye(4)[labels.to_numpy()], index=covered)
+
+    strategy = PairsBacktestStrategy(pairs=market.pairs, warmup_bars=20,
+                                     all_tickers=market.tickers,
+                                     regime_timeline=labels, regime_probs=probs)
+    seen_probs = {}
+    for date, row in market.prices.iterrows():
+        strategy.prepare_bar(MarketEvent(date=date, prices=row.to_dict()))
+        if strategy.current_regime_probs is not None:
+            seen_probs[date] = int(np.argmax(strategy.current_regime_probs))
+    history = strategy.get_regime_history()
+
+    # Without a detector the regime is neutral before the timeline starts
+    # and keeps its last label after it ends
+    expected = labels.reindex(dates).ffill().fillna(1)
+    assert history.tolist() == expected.loc[history.index].astype(int).tolist()
+    assert all(seen_probs[d] == expected[d] for d in seen_probs)
+
+
+def test_ticker_order_is_deterministic():
+    market = make_synthetic_market(n_tickers=10, n_bars=50, seed=0)
+    universe = market.tickers[::-1][:6]
+    strategy = PairsBacktestStrategy(pairs=market.pairs, all_tickers=universe)
+    pair_legs = [t for p in market.pairs for t in (p["ticker1"], p["ticker2"])]
+    assert strategy._tickers == list(dict.fromkeys(universe + pair_legs))
@@ -0,0 +1,98 @@
+"""Tests for the process-pool parameter sweep."""
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from backtest.run_backtest import MarketData
+from backtest.shared_data import SharedFrames
+from backtest.sweep import apply_overrides, make_jobs, run_sweep
+from config import PlatformConfig
+from features.featurize import compute_standard_features
+
+
+def _market(n_days=600, seed=3) -> MarketData:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2018-01-02", periods=n_days, freq="B")
+    px = {}
+    for i in range(3):
+        base = 50.0 + 10 * i + np.cumsum(rng.normal(0, 2.0, n_days))
+        spread = np.zeros(n_days)
+        for t in range(1, n_days):
+            spread[t] = 0.92 * spread[t - 1] + rng.normal(0, 0.6)
+        px[f"A{i}"] = (1.0 + 0.2 * i) * base + spread + 100.0
+        px[f"B{i}"] = base + 50.0
+    px["VOO"] = 300.0 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, n_days)))
+    wide = pd.DataFrame(px, index=dates)
+    features = {}
+    for t in wide:
+        raw = pd.DataFrame({"Date": dates, "close": wide[t].to_numpy(),
+                            "volume": rng.integers(100_000, 1_000_000, n_days).astype(float)})
+        feat = compute_standard_features(raw)
+        feat.index = pd.to_datetime(feat["Date"])
+        features[t] = feat
+    return MarketData(wide=wide, feature_dict=features, macro_dict={})
+
+
+def _cfg() -> PlatformConfig:
+    cfg = PlatformConfig()
+    cfg.data.tickers = [f"{p}{i}" for i in range(3) for p in "AB"]
+    cfg.regime.use_walkforward = False
+    cfg.regime.n_states = 2
+    cfg.reselection.enabled = False
+    cfg.pairs.zscore_window = 30
+    cfg.pairs.warmup_bars = 30
+    cfg.backtest.engine = "fast"
+    return cfg
+
+
+GRID = {"backtest.target_notional_pct": [0.05, 0.10], "pairs.regime_position_scale": [
+    {0: 1.0, 1: 1.0}, {0: 0.5, 1: 0.5}]}
+
+
+class TestSharedFrames:
+    def test_round_trip(self):
+        frames = {"a": _market(n_days=80).feature_dict["A0"], "w": _market(n_days=50).wide}
+        with SharedFrames.create(frames) as owner:
+            view = SharedFrames.attach(owner.spec)
+            got = view.frames()
+            numeric = frames["a"].select_dtypes(include="number").astype(float)
+            pdt.assert_frame_equal(got["a"].drop(columns="Date"), numeric, check_freq=False,
+                                   check_index_type=False)
+            assert (got["a"]["Date"].to_numpy() == got["a"].index.to_numpy()).all()
+            pdt.assert_frame_equal(got["w"], frames["w"], check_freq=False, check_index_type=False)
+            with pytest.raises(ValueError):
+                got["w"].to_numpy()[0, 0] = 1.0
+            view.close()
+
+
+class TestSweep:
+    def test_seeds_reproducible_and_distinct(self):
+        a, b = make_jobs(GRID, seed=5), make_jobs(GRID, seed=5)
+        assert [j.seed for j in a] == [j.seed for j in b]
+        assert len({j.seed for j in a}) == len(a) == 4
+        assert [j.seed for j in make_jobs(GRID, seed=6)] != [j.seed for j in a]
+
+    def test_invalid_grid(self):
+        with pytest.raises(ValueError):
+            run_sweep(_cfg(), {"data.period": ["5y"]}, market_data=_market())
+        with pytest.raises(KeyError):
+            run_sweep(_cfg(), {"pairs.no_such_field": [1]}, market_data=_market())
+        with pytest.raises(KeyError):
+            apply_overrides(_cfg(), {"nosection.x": 1})
+
+    def test_pool_matches_in_process(self):
+        market = _market()
+        inline = run_sweep(_cfg(), GRID, n_workers=1, seed=1, market_data=market)
+        pooled = run_sweep(_cfg(), GRID, n_workers=2, seed=1, market_data=market,
+                           mp_context="fork")
+        pdt.assert_frame_equal(inline.table, pooled.table)
+
+        table = inline.table
+        assert table["error"].isna().all()
+        assert list(table.index) == [1, 2, 3, 4]
+        assert table["sharpe_ratio"].is_monotonic_decreasing
+        assert set(table["job_id"]) == {0, 1, 2, 3}
+        best = inline.best()
+        assert best["stats"]["sharpe_ratio"] == table["sharpe_ratio"].iloc[0]
+        assert best["n_pairs"] > 0
@@ -0,0 +1,44 @@
+"""Tests for the deterministic synthetic market generator."""
+import numpy as np
+import pandas.testing as pdt
+import pytest
+
+from data.synthetic import make_synthetic_market
+from strategy.pairs_trading import PairsSelector
+
+
+def test_deterministic_and_shaped():
+    a = make_synthetic_market(n_tickers=20, n_bars=300, seed=4)
+    b = make_synthetic_market(n_tickers=20, n_bars=300, seed=4)
+    pdt.assert_frame_equal(a.prices, b.prices)
+    assert a.pairs == b.pairs
+    assert not a.prices.equals(make_synthetic_market(n_tickers=20, n_bars=300, seed=5).prices)
+
+    assert a.prices.shape == (300, 21)
+    assert a.prices.columns[-1] == a.market_ticker and a.market_ticker not in a.tickers
+    assert len(a.pairs) == 5
+    assert np.isfinite(a.prices.to_numpy()).all() and (a.prices.to_numpy() > 0).all()
+
+
+def test_regime_path():
+    m = make_synthetic_market(n_tickers=4, n_bars=2000, n_regimes=3, regime_switches=10, seed=1)
+    assert set(m.regimes.unique()) <= {0, 1, 2}
+    switches = int((m.regimes.diff().fillna(0) != 0).sum())
+    assert 3 <= switches <= 25
+    with pytest.raises(ValueError):
+        make_synthetic_market(n_regimes=5)
+    with pytest.raises(ValueError):
+        make_synthetic_market(n_tickers=6, n_pairs=4)
+
+
+def test_pairs_are_found_and_ohlcv_consistent():
+    m = make_synthetic_market(n_tickers=12, n_bars=600, seed=2)
+    found = PairsSelector().find_pairs(m.prices[m.tickers], verbose=False)
+    true = {(p["ticker1"], p["ticker2"]) for p in m.pairs}
+    assert true <= set(zip(found["ticker1"], found["ticker2"]))
+
+    bars = m.ohlcv("T0001")
+    assert list(bars.columns) == ["Date", "open", "high", "low", "close", "volume"]
+    assert (bars["high"] >= bars[["open", "close"]].max(axis=1)).all()
+    assert (bars["low"] <= bars[["open", "close"]].min(axis=1)).all()
+    pdt.assert_frame_equal(bars, m.ohlcv("T0001"))
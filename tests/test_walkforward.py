@@ -0,0 +1,67 @@
+"""Tests for the walk-forward orchestrator."""
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from backtest.walkforward import make_folds, run_walkforward, stitch_folds
+from test_sweep import _cfg, _market
+
+
+class TestMakeFolds:
+    def test_rolling(self):
+        folds = make_folds(100, train_days=40, test_days=25)
+        assert [(f.train_start, f.train_end, f.test_end) for f in folds] == [
+            (0, 40, 65), (25, 65, 90), (50, 90, 100)]
+        assert all(f.test_start == f.train_end for f in folds)
+
+    def test_anchored_with_step(self):
+        folds = make_folds(100, train_days=40, test_days=30, step_days=20, anchored=True)
+        assert [(f.train_start, f.train_end, f.test_end) for f in folds] == [
+            (0, 40, 70), (0, 60, 90), (0, 80, 100)]
+
+    def test_too_short(self):
+        assert make_folds(30, train_days=40, test_days=10) == []
+        with pytest.raises(ValueError):
+            make_folds(30, train_days=0, test_days=10)
+
+
+def _fold(fold_id, start, n, value):
+    idx = pd.date_range(start, periods=n, freq="B")
+    return {"fold_id": fold_id, "test_start": idx[0], "returns": pd.Series(value, index=idx),
+            "stats": {}, "error": None, "n_pairs": 1, "train_start": None,
+            "train_end": None, "test_end": idx[-1]}
+
+
+class TestStitch:
+    def test_overlap_uses_latest_fold(self):
+        a = _fold(0, "2020-01-01", 10, 0.01)
+        b = _fold(1, "2020-01-08", 10, -0.01)
+        res = stitch_folds([b, a], 100.0, pd.Timestamp("2019-12-31"))
+        eq = res.equity_curve
+        assert len(eq) == 1 + 5 + 10
+        assert eq.iloc[5] == pytest.approx(100.0 * 1.01 ** 5)
+        assert eq.iloc[-1] == pytest.approx(100.0 * 1.01 ** 5 * 0.99 ** 10)
+        assert list(res.folds.index) == [0, 1]
+
+
+class TestRunWalkForward:
+    def test_pool_matches_in_process_and_covers_test_windows(self):
+        cfg = _cfg()
+        cfg.walkforward.train_days = 300
+        cfg.walkforward.test_days = 100
+        market = _market(n_days=560)
+        inline = run_walkforward(cfg, n_workers=1, market_data=market)
+        pooled = run_walkforward(cfg, n_workers=2, market_data=market, mp_context="fork")
+
+        pdt.assert_series_equal(inline.equity_curve, pooled.equity_curve)
+        pdt.assert_frame_equal(inline.folds, pooled.folds)
+
+        dates = market.wide.index
+        assert len(inline.folds) == 3
+        assert inline.equity_curve.index[0] == dates[299]
+        assert list(inline.equity_curve.index[1:]) == list(dates[300:])
+        assert inline.folds["error"].isna().all()
+        assert inline.folds["n_trades"].sum() == inline.stats["n_trades"] > 0
+        np.testing.assert_allclose(inline.stats["final_equity"], inline.equity_curve.iloc[-1],
+                                   atol=0.01)